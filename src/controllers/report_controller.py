@@ -1,18 +1,69 @@
-from typing import List, Dict, Any, Optional
-from PySide6.QtCore import Slot
-from PySide6.QtGui import QStandardItemModel, QStandardItem
+from typing import Callable, List, Dict, Any, Optional, Set, Tuple
+from PySide6.QtCore import QTimer, Slot
 from PySide6.QtWidgets import QWidget
 from utils import utils_db
 from utils.utils_popup import _printv2
+from utils.utils_workers import NotificationBridge, QueryRunner
+from models.query_cache import QueryCache
 from models.report_model import ReportModel
+from models.search_index import SearchIndex
+from models.columnar_store import ColumnarStore
 from views.report_view import ReportView
+from widgets.columnar_table_model import ColumnarTableModel
+from widgets.lazy_table_model import LazyTableModel
 
 
 class ReportController:
     """
     Controlador para gestionar la interacción entre modelo, vista y base de datos.
+
+    Las consultas al modelo se ejecutan en segundo plano mediante QueryRunner; los resultados
+    vuelven al hilo principal a través de señales de Qt y solo entonces se actualiza la vista.
+    Todo lo necesario para pintar el informe (sello de cambio, primera página, resumen, más
+    vendidos para el gráfico y, en la carga inicial, los géneros del selector) se pide con
+    ReportModel._fetch_report, que envía las consultas juntas en modo pipeline y recibe sus
+    resultados en un único viaje al servidor. Si el modelo dispone de un AsyncManagerDB, ese lote
+    se lanza como corrutina. Las filas llegan con el nombre del género ya resuelto por la base de
+    datos (columna "genero"). Las páginas siguientes de la tabla también se piden en segundo plano
+    al desplazarse (ver _page_requester).
+
+    Los resultados de los filtros (primera página con resumen, y cada página siguiente) se
+    guardan en un QueryCache: repetir una búsqueda o volver a un género ya consultado se
+    resuelve en el hilo principal sin consultar la base de datos.
+
+    Mientras la vista está abierta, el controlador escucha las notificaciones de cambios de
+    'videojuegos' y 'ventas' (LISTEN/NOTIFY): agrupa los códigos afectados, vuelve a pedir solo
+    esas filas con el filtro activo y actualiza en su sitio la tabla, el gráfico y el resumen.
+    Además, cada utils_db.SYNC_INTERVAL_MS pide solo las filas cambiadas desde el último sello
+    de cambio recibido (sincronización incremental) y las aplica de la misma forma.
+
+    Cada utils_db.ROLLUP_REFRESH_INTERVAL_MS se actualizan en segundo plano los resúmenes
+    materializados de 'ventas' (ReportModel._refresh_sales_rollups), se crean por adelantado las
+    particiones mensuales de 'ventas' (ReportModel._maintain_sales_partitions) y se podan las
+    lápidas de borrados antiguas (ReportModel._prune_change_tombstones).
+
+    Con utils_db.IN_MEMORY_SEARCH, el catálogo completo se carga una vez en un ColumnarTableModel
+    y se indexa con SearchIndex (n-gramas): cada pulsación se resuelve en el hilo principal
+    intersecando listas de apariciones, sin consultar la base de datos, y filtrar consiste en
+    sustituir el vector de filas visibles del modelo. El género, el resumen y el gráfico se
+    calculan con operaciones vectorizadas sobre el ColumnarStore del catálogo. Los cambios
+    recibidos actualizan el catálogo y el índice fila a fila.
+
+    La evolución de ventas por periodo (día, semana o mes) se agrupa en el servidor
+    (ReportModel._fetch_sales_series) con el rango de fechas elegido en la vista y el filtro activo.
     """
 
+    # Claves de las peticiones en segundo plano (una petición nueva invalida la anterior de su clave)
+    _KEY_INITIAL_LOAD = "carga_inicial"
+    _KEY_FILTERS = "filtros"
+    _KEY_CHANGES = "cambios"
+    _KEY_SYNC = "sincronizacion"
+    _KEY_ROLLUPS = "resumenes_ventas"
+    _KEY_SERIES = "serie_ventas"
+    _KEY_PARTITIONS = "particiones_ventas"
+    _KEY_TOMBSTONES = "lapidas_borrados"
+    _KEY_PAGE = "pagina_videojuegos"
+
     def __init__(self, report_view: ReportView, report_model: ReportModel, popup_parent: Optional[QWidget] = None):
         """
         Inicializa el controlador.
@@ -29,46 +80,231 @@ class ReportController:
         self._view = report_view
         self._model = report_model
         self._popup_parent = popup_parent
+        self._genre_ids: Dict[str, int] = {}  # Nombre de género -> id_genero (se carga con la vista)
+
+        # Ejecutor de consultas en segundo plano (vive con la vista)
+        self._query_runner = QueryRunner(parent=self._view)
+
+        # Caché de resultados de los filtros
+        self._query_cache = QueryCache()
+
+        # Modo de búsqueda elegido en la vista; cada filtro lo captura al lanzarse (_run_filters)
+        self._search_mode = utils_db.EnumModosBusqueda.SUBCADENA
+
+        # Filtro mostrado en la tabla y modelo de tabla activo (para aplicar los cambios en su sitio)
+        self._active_filter: Dict[str, Any] = {"search_text": "", "genre_id": None, "search_mode": self._search_mode}
+        self._table_model: Optional[ColumnarTableModel] = None
+
+        # Búsqueda en memoria: índice y arrays del catálogo, posición de cada clave en el modelo y nombres de género
+        self._search_index: Optional[SearchIndex] = None
+        self._store: Optional[ColumnarStore] = None
+        self._catalogue_positions: Dict[Any, int] = {}
+        self._genre_names: Dict[int, str] = {}
+        # Pila de resultados recientes (consulta normalizada, género, filas): al escribir se refina la
+        # cima y al borrar se vuelve a un resultado ya calculado
+        self._refinement_stack: List[Tuple[str, Optional[int], List[int]]] = []
+        if utils_db.IN_MEMORY_SEARCH:
+            self._view._set_search_modes_enabled(False)  # En memoria solo se busca por subcadena
+
+        # Rango de fechas y periodo de la evolución de ventas (None: sin límite)
+        self._sales_range: Dict[str, Any] = {
+            "date_from": None, "date_to": None, "bucket": utils_db.EnumPeriodos.MES.value,
+        }
+        # En la búsqueda en memoria la evolución de ventas se pide al dejar de escribir
+        self._series_timer = QTimer(self._view)
+        self._series_timer.setSingleShot(True)
+        self._series_timer.setInterval(utils_db.SERIES_DEBOUNCE_MS)
+        self._series_timer.timeout.connect(self._load_sales_series)
+
+        # Notificaciones de cambios: se agrupan durante NOTIFY_DEBOUNCE_MS antes de consultar
+        self._pending_changes: Set[str] = set()
+        self._changes_in_flight: Set[str] = set()  # Códigos de la consulta de cambios en curso
+        self._resync_pending = False
+        self._notify_timer = QTimer(self._view)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.setInterval(utils_db.NOTIFY_DEBOUNCE_MS)
+        self._notify_timer.timeout.connect(self._apply_pending_changes)
+        self._notification_bridge = NotificationBridge(self._view)
+        self._notification_bridge.notification_received.connect(self._on_notification)
+        if self._model._listen_changes(self._notification_bridge._emit):
+            self._view.destroyed.connect(
+                lambda: self._model._unlisten_changes(self._notification_bridge._emit))
+
+        # Sincronización incremental: sello de cambio de los datos mostrados
+        self._sync_stamp: Optional[int] = None
+        self._sync_timer = QTimer(self._view)
+        self._sync_timer.setInterval(utils_db.SYNC_INTERVAL_MS)
+        self._sync_timer.timeout.connect(self._sync_changes)
+        if utils_db.SYNC_INTERVAL_MS > 0:
+            self._sync_timer.start()
+
+        # Actualización programada de los resúmenes materializados de ventas
+        self._rollup_timer = QTimer(self._view)
+        self._rollup_timer.setInterval(utils_db.ROLLUP_REFRESH_INTERVAL_MS)
+        self._rollup_timer.timeout.connect(self._refresh_rollups)
+        self._rollup_timer.timeout.connect(self._maintain_partitions)
+        self._rollup_timer.timeout.connect(self._prune_tombstones)
+        if utils_db.ROLLUP_REFRESH_INTERVAL_MS > 0:
+            self._rollup_timer.start()
 
         # Conectar señales
         self._view.apply_filters_signal.connect(self._apply_filters)
+        self._view.search_mode_changed_signal.connect(self._apply_search_mode)
+        self._view.apply_date_range_signal.connect(self._apply_date_range)
 
         # Inicializar vista
         self._initialize_view()
+        self._maintain_partitions()
 
     def _initialize_view(self) -> None:
         """
-        Inicializa la vista cargando datos y configurando géneros.
+        Lanza en segundo plano la carga inicial de datos y géneros.
+        """
+        on_error = lambda message: self._on_query_error("Error al inicializar la vista", message)
+        if self._model._has_async_manager():
+            self._query_runner._watch_future(
+                self._KEY_INITIAL_LOAD, self._model._run_async(self._load_initial_data_async()),
+                on_result=self._on_initial_data_loaded, on_error=on_error
+            )
+            return
+
+        self._query_runner._submit(
+            self._KEY_INITIAL_LOAD, self._load_initial_data,
+            on_result=self._on_initial_data_loaded, on_error=on_error
+        )
+
+    def _load_initial_data(self) -> Dict[str, Any]:
+        """
+        Obtiene los datos iniciales de videojuegos y géneros en un solo lote (se ejecuta en un hilo secundario).
+
+        Solo se trae la primera página de videojuegos; el resto se carga al desplazarse por la tabla.
+        Con la búsqueda en memoria se trae el catálogo completo y se indexa aquí, fuera del hilo principal.
+
+        Retorno:
+        - dict: "model_data" con columnas y primera página de videojuegos, "genres_data" con los géneros,
+          "summary" con el resumen, "stamp" con el sello de cambio y "search_index" (o None).
+        """
+        return self._initial_result(self._model._fetch_report(
+            limit=self._initial_limit(), include_genres=True, columnar=utils_db.IN_MEMORY_SEARCH))
+
+    async def _load_initial_data_async(self) -> Dict[str, Any]:
+        """
+        Versión asíncrona de _load_initial_data.
+
+        Retorno:
+        - dict: Mismo formato que _load_initial_data.
+        """
+        return self._initial_result(
+            await self._model._fetch_report_async(
+                limit=self._initial_limit(), include_genres=True, columnar=utils_db.IN_MEMORY_SEARCH))
+
+    def _initial_limit(self) -> Optional[int]:
+        """
+        Devuelve cuántos videojuegos se traen en la carga inicial.
+
+        Retorno:
+        - int | None: Una página, o None (todos) con la búsqueda en memoria.
+        """
+        return None if utils_db.IN_MEMORY_SEARCH else utils_db.PAGE_SIZE_DB
+
+    def _build_search_index(self, rows: List[Dict[str, Any]]) -> SearchIndex:
+        """
+        Indexa el catálogo para la búsqueda en memoria (se ejecuta fuera del hilo principal).
+
+        Parámetros:
+        - rows (list[dict]): Catálogo completo; el identificador de cada fila es su posición.
+
+        Retorno:
+        - SearchIndex: Índice de n-gramas del texto de búsqueda precalculado de cada fila.
+        """
+        search_index = SearchIndex()
+        search_index._add_rows(row[utils_db.SEARCH_BLOB_COLUMN] for row in rows)
+        return search_index
+
+    def _initial_result(self, report: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Adapta el lote devuelto por ReportModel._fetch_report al formato de _on_initial_data_loaded.
+
+        Parámetros:
+        - report (dict | None): Resultado de _fetch_report (None si falló).
+
+        Retorno:
+        - dict: "model_data", "genres_data", "summary", "top_sales", "stamp", "search_index" y "store".
+        """
+        if report is None:
+            return {"model_data": None, "genres_data": None, "summary": None, "top_sales": None, "stamp": None,
+                    "search_index": None, "store": None}
+        return {
+            "model_data": self._initial_model_data(report["rows"]),
+            "genres_data": report["genres"],
+            "summary": report["summary"],
+            "top_sales": report["top_sales"],
+            "stamp": report["stamp"],
+            "search_index": self._build_search_index(report["rows"]) if utils_db.IN_MEMORY_SEARCH else None,
+            "store": report["store"],
+        }
+
+    def _initial_model_data(self, first_page: Optional[List[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """
+        Agrupa las columnas de la tabla y la primera página de videojuegos en el formato de _prepare_table_data.
+
+        Parámetros:
+        - first_page (list[dict] | None): Primera página de videojuegos.
+
+        Retorno:
+        - dict con "columns" y "data", o None si no hay datos.
+        """
+        if not first_page:
+            return None
+        return {"columns": utils_db.TABLE_COLUMNS_VIDEOJUEGOS, "data": first_page}
+
+    def _on_initial_data_loaded(self, result: Dict[str, Any]) -> None:
+        """
+        Actualiza la vista con los datos iniciales (se ejecuta en el hilo principal).
+
+        Parámetros:
+        - result (dict): Resultado de _load_initial_data.
         """
         try:
             # Cargar datos iniciales de videojuegos
-            model_data = self._model._get_model(
-                utils_db.EnumTablasDB.VIDEOJUEGOS.value)
+            model_data = result.get("model_data")
             if model_data:
-                prepared_data = self._prepare_table_data(model_data)
+                search_index = result.get("search_index")
+                if search_index is not None:
+                    prepared_data = self._prepare_catalogue(model_data["data"], search_index, result["store"])
+                else:
+                    prepared_data = self._prepare_table_data(
+                        model_data, fetch_page=self._filtered_page_fetcher("", None, utils_db.EnumModosBusqueda.SUBCADENA))
+                self._table_model = prepared_data
+                self._sync_stamp = result.get("stamp")
                 self._view._set_model(prepared_data)
 
-                # Configurar gráfico inicial
-                chart_data = self._prepare_chart_data(model_data)
-                self._view._set_chart(chart_data)
+                # Configurar gráfico inicial (más vendidos, calculados en el servidor)
+                self._view._set_chart(self._sales_chart_data(result.get("top_sales") or []))
+
+                summary = result.get("summary")
+                if summary is not None:
+                    self._show_summary(summary)
+                self._load_sales_series()
             else:
                 _printv2(show_popup=False, parent=self._popup_parent,
                          message="No se encontraron datos en la tabla 'videojuegos'.")
                 self._view._clear_chart()
 
             # Cargar géneros
-            genres_data : Optional[List[Dict[str,Any]]]=self._model._fetch_data(utils_db.EnumTablasDB.GENEROS.value)
-            
-            
-            if genres_data :
+            genres_data = result.get("genres_data")
+            if genres_data:
+                self._genre_ids = {row["nombre_genero"]: row["id_genero"] for row in genres_data}
+                self._genre_names = {row["id_genero"]: row["nombre_genero"] for row in genres_data}
                 genres = [row["nombre_genero"] for row in genres_data]
                 self._view._set_genres(["Todos"] + genres)
-                
             else:
                 _printv2(show_popup=False, parent=self._popup_parent,
                          message="No se encontraron datos en la tabla generos")
-                
-            
+
+            # Con la búsqueda en memoria, el filtro escrito durante la carga se aplica ahora
+            if self._search_index is not None:
+                self._filter_in_memory(self._active_filter["search_text"], self._active_filter["genre_id"])
 
         except Exception as e:
             _printv2(show_popup=False, parent=self._popup_parent,
@@ -79,86 +315,755 @@ class ReportController:
         """
         Aplica los filtros ingresados desde la vista.
 
+        La consulta se lanza en segundo plano; si el usuario sigue escribiendo, los
+        resultados de las peticiones anteriores se descartan.
+
         Parámetros:
         - search_text (str): Texto ingresado en la barra de búsqueda.
         - genre (str): Género seleccionado.
         """
+        # El género se filtra en el servidor por su clave foránea ("Todos" no filtra)
+        self._run_filters(search_text.strip(), self._genre_ids.get(genre))
+
+    @Slot(str)
+    def _apply_search_mode(self, mode: str) -> None:
+        """
+        Cambia el modo de búsqueda del texto y vuelve a aplicar los filtros de la vista.
+
+        Parámetros:
+        - mode (str): Modo elegido (valor de utils_db.EnumModosBusqueda).
+        """
+        self._search_mode = utils_db.EnumModosBusqueda(mode)
+        self._view._emit_apply_filters_signal()
+
+    def _run_filters(self, search_text: str, genre_id: Optional[int]) -> None:
+        """
+        Muestra el filtro indicado, desde la caché o consultando en segundo plano.
+
+        El modo de búsqueda se captura aquí y viaja con la consulta y su resultado: cambiarlo
+        mientras la consulta está en curso no altera cómo se interpreta.
+
+        Parámetros:
+        - search_text (str): Texto de búsqueda ya normalizado.
+        - genre_id (int | None): Identificador del género (None para todos).
+        """
+        if utils_db.IN_MEMORY_SEARCH:
+            # Mientras se carga el catálogo solo se recuerda el filtro; se aplica al terminar la carga
+            self._active_filter = {"search_text": search_text, "genre_id": genre_id, "search_mode": utils_db.EnumModosBusqueda.SUBCADENA}
+            if self._search_index is not None:
+                self._filter_in_memory(search_text, genre_id)
+            return
+
+        search_mode = self._search_mode
+        cached = self._query_cache._get(self._filter_cache_key(search_text, genre_id, search_mode))
+        if cached is not None:
+            # Resultado ya conocido: se descarta la petición en curso y se muestra al momento
+            self._query_runner._cancel(self._KEY_FILTERS)
+            self._on_filters_computed(cached)
+            return
+
+        on_error = lambda message: self._on_query_error("Error al aplicar filtros", message)
+        if self._model._has_async_manager():
+            self._query_runner._watch_future(
+                self._KEY_FILTERS, self._model._run_async(self._compute_filters_async(search_text, genre_id, search_mode)),
+                on_result=self._on_filters_computed, on_error=on_error
+            )
+            return
+
+        self._query_runner._submit(
+            self._KEY_FILTERS, self._compute_filters, search_text, genre_id, search_mode,
+            on_result=self._on_filters_computed, on_error=on_error
+        )
+
+    def _prepare_catalogue(self, rows: List[Dict[str, Any]], search_index: SearchIndex,
+                           store: ColumnarStore) -> ColumnarTableModel:
+        """
+        Prepara el catálogo completo para la búsqueda en memoria.
+
+        Parámetros:
+        - rows (list[dict]): Todos los videojuegos, en el orden en que se indexaron.
+        - search_index (SearchIndex): Índice construido con _build_search_index.
+        - store (ColumnarStore): Las mismas filas en arrays de NumPy.
+
+        Retorno:
+        - ColumnarTableModel: Modelo con todas las filas; el filtro sustituye su vector de filas visibles.
+        """
+        key_column = utils_db.PRIMARY_KEYS_DB[utils_db.EnumTablasDB.VIDEOJUEGOS.value]
+        self._search_index = search_index
+        self._store = store
+        self._catalogue_positions = {row[key_column]: position for position, row in enumerate(rows)}
+        self._refinement_stack.clear()
+        return ColumnarTableModel._from_rows(utils_db.TABLE_COLUMNS_VIDEOJUEGOS, rows, extra_columns=[key_column])
+
+    def _filter_in_memory(self, search_text: str, genre_id: Optional[int]) -> None:
+        """
+        Filtra el catálogo en memoria y actualiza tabla, gráfico y resumen (se ejecuta en el hilo principal).
+
+        La evolución de ventas se pide al servidor cuando el filtro lleva utils_db.SERIES_DEBOUNCE_MS
+        sin cambiar, no en cada pulsación.
+
+        Parámetros:
+        - search_text (str): Texto de búsqueda ya normalizado.
+        - genre_id (int | None): Identificador del género (None para todos).
+        """
         try:
-            # Obtener datos de videojuegos
-            model_data = self._model._fetch_data(
-                utils_db.EnumTablasDB.VIDEOJUEGOS.value)
+            visible = self._refined_rows(search_text, genre_id)
+
+            self._active_filter = {"search_text": search_text, "genre_id": genre_id, "search_mode": utils_db.EnumModosBusqueda.SUBCADENA}
+            self._table_model._set_row_indices(visible)
+            self._show_summary(self._store._sales_summary(visible) or self._model._summary_from_row(None))
+            self._view._set_chart(self._catalogue_chart_data(
+                self._store._top_rows("ventas", visible, utils_db.CHART_TOP_N_DB)))
+            self._series_timer.start()  # Reinicia la espera en cada pulsación
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent,
+                     message=f"Error al aplicar filtros: {e}")
+
+    def _refined_rows(self, search_text: str, genre_id: Optional[int]) -> List[int]:
+        """
+        Devuelve las filas del catálogo que cumplen el filtro reutilizando la pila de resultados recientes.
+
+        Se desapilan los resultados que no sirven (otro género o una consulta que no está contenida
+        en la nueva, p. ej. al borrar). Si la cima es la misma consulta se reutiliza tal cual; si
+        está contenida en la nueva, solo se vuelven a comprobar sus filas. Así, cada carácter
+        escrito recorre menos filas que el anterior.
+
+        Parámetros:
+        - search_text (str): Texto de búsqueda ya normalizado.
+        - genre_id (int | None): Identificador del género (None para todos).
+
+        Retorno:
+        - list[int]: Posiciones de las filas visibles, en orden de carga (las nuevas, al final).
+        """
+        query = ReportModel._normalize_search_text(search_text)
+        stack = self._refinement_stack
+        while stack and not (stack[-1][1] == genre_id and stack[-1][0] in query):
+            stack.pop()
+        if stack and stack[-1][0] == query:
+            return stack[-1][2]
+
+        if stack:
+            visible = sorted(self._search_index._search(query, candidates=stack[-1][2]))  # Ya filtradas por género
+        else:
+            visible = sorted(self._search_index._search(query))
+            if genre_id is not None:
+                visible = self._store._select_equal("genero", self._genre_names.get(genre_id), visible)
+
+        stack.append((query, genre_id, visible))
+        del stack[:-utils_db.SEARCH_REFINEMENT_STACK_SIZE]
+        return visible
+
+    def _catalogue_chart_data(self, row_ids: List[int]) -> Dict[str, Any]:
+        """
+        Prepara el gráfico de ventas por título de unas filas del catálogo en memoria (ver ColumnarStore._top_rows).
+
+        Parámetros:
+        - row_ids (list[int]): Posiciones de las filas en el catálogo.
+
+        Retorno:
+        - dict: Datos para el gráfico (las ventas, como array de NumPy).
+        """
+        titles = self._table_model._get_column("titulo")
+        return self._prepare_chart_data({
+            utils_db.EnumEjes.EJE_X.value: [titles[row_id] for row_id in row_ids],
+            utils_db.EnumEjes.EJE_Y.value: {"Ventas": self._store._values("ventas", row_ids)},
+        })
+
+    def _apply_catalogue_changes(self, rows: List[Dict[str, Any]], removed_keys: List[Any]) -> None:
+        """
+        Aplica al catálogo en memoria y a su índice las filas cambiadas, y vuelve a filtrar.
+
+        Las filas borradas solo se quitan del índice: su posición queda libre en el modelo, pero
+        ningún filtro vuelve a mostrarla.
+
+        Parámetros:
+        - rows (list[dict]): Filas nuevas o modificadas.
+        - removed_keys (list): Códigos borrados.
+        """
+        key_column = utils_db.PRIMARY_KEYS_DB[utils_db.EnumTablasDB.VIDEOJUEGOS.value]
+        for key in removed_keys:
+            position = self._catalogue_positions.pop(key, None)
+            if position is not None:
+                self._search_index._remove(position)
+
+        for row in rows:
+            position = self._catalogue_positions.get(row[key_column])
+            if position is None:
+                position = len(self._table_model._get_column(key_column))
+                self._table_model._append_rows([row])
+                self._store._append_row(row)
+                self._catalogue_positions[row[key_column]] = position
+                self._search_index._add(position, row[utils_db.SEARCH_BLOB_COLUMN])
+            else:
+                self._table_model._update_row(position, row)
+                self._store._set_row(position, row)
+                self._search_index._update(position, row[utils_db.SEARCH_BLOB_COLUMN])
+
+        self._refinement_stack.clear()  # Los resultados guardados ya no reflejan el catálogo
+        self._filter_in_memory(self._active_filter["search_text"], self._active_filter["genre_id"])
+
+    def _server_filter(self) -> Tuple[str, Optional[int], utils_db.EnumModosBusqueda]:
+        """
+        Devuelve el filtro con el que se piden los cambios al servidor.
+
+        Con la búsqueda en memoria se necesitan todas las filas modificadas, cumplan o no el filtro activo.
+
+        Retorno:
+        - tuple: (texto de búsqueda, identificador del género, modo de búsqueda).
+        """
+        if self._search_index is not None:
+            return "", None, utils_db.EnumModosBusqueda.SUBCADENA
+        return (self._active_filter["search_text"], self._active_filter["genre_id"],
+                self._active_filter["search_mode"])
+
+    def _compute_filters(self, search_text: str, genre_id: Optional[int],
+                         search_mode: utils_db.EnumModosBusqueda) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene los videojuegos filtrados en el servidor y calcula el resumen (se ejecuta en un hilo secundario).
+
+        Parámetros:
+        - search_text (str): Texto ingresado en la barra de búsqueda.
+        - genre_id (int | None): Identificador del género seleccionado (None para todos).
+        - search_mode (EnumModosBusqueda): Modo de búsqueda capturado en _run_filters.
+
+        Retorno:
+        - dict: "data" con las filas filtradas, "summary" con el resumen y "top_sales" con los más vendidos.
+        - None si no se pudieron obtener los videojuegos.
+        """
+        # Primera página filtrada, resumen y más vendidos en un solo viaje al servidor
+        report = self._model._fetch_report(search_text, genre_id, limit=utils_db.PAGE_SIZE_DB, search_mode=search_mode)
+        if report is None:
+            return None
+        return self._cache_filter_result(self._build_filter_result(
+            search_text, genre_id, search_mode, report["rows"], report["summary"], report["top_sales"], report["stamp"]))
+
+    async def _compute_filters_async(self, search_text: str, genre_id: Optional[int],
+                                     search_mode: utils_db.EnumModosBusqueda) -> Optional[Dict[str, Any]]:
+        """
+        Versión asíncrona de _compute_filters.
+
+        Parámetros:
+        - search_text (str): Texto ingresado en la barra de búsqueda.
+        - genre_id (int | None): Identificador del género seleccionado (None para todos).
+        - search_mode (EnumModosBusqueda): Modo de búsqueda capturado en _run_filters.
+
+        Retorno:
+        - dict: "data" con las filas filtradas, "summary" con el resumen y "top_sales" con los más vendidos.
+        - None si no se pudieron obtener los videojuegos.
+        """
+        report = await self._model._fetch_report_async(
+            search_text, genre_id, limit=utils_db.PAGE_SIZE_DB, search_mode=search_mode)
+        if report is None:
+            return None
+        return self._cache_filter_result(self._build_filter_result(
+            search_text, genre_id, search_mode, report["rows"], report["summary"], report["top_sales"], report["stamp"]))
+
+    def _build_filter_result(self, search_text: str, genre_id: Optional[int],
+                             search_mode: utils_db.EnumModosBusqueda, first_page: List[Dict[str, Any]],
+                             summary: Optional[Dict[str, Any]], top_sales: Optional[List[Dict[str, Any]]],
+                             stamp: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Agrupa la primera página filtrada (con el nombre del género), el resumen y los más vendidos
+        calculados en el servidor.
+
+        Parámetros:
+        - search_text (str): Texto del filtro (necesario para pedir las páginas siguientes).
+        - genre_id (int | None): Género del filtro (necesario para pedir las páginas siguientes).
+        - search_mode (EnumModosBusqueda): Modo de búsqueda con el que se calculó el resultado.
+        - first_page (list[dict]): Primera página de videojuegos que cumplen el filtro.
+        - summary (dict | None): Resumen de ventas devuelto por ReportModel._fetch_summary.
+        - top_sales (list[dict] | None): Más vendidos devueltos por ReportModel._fetch_top_sales.
+        - stamp (int | None): Sello de cambio tomado antes de leer los datos.
+
+        Retorno:
+        - dict: "data" con la primera página, "summary" con el resumen, "top_sales" con los más
+          vendidos y los datos para paginar.
+        """
+        if summary is None:
+            summary = self._model._summary_from_row(None)
+
+        return {
+            "data": first_page,
+            "summary": summary,
+            "top_sales": top_sales or [],
+            "search_text": search_text,
+            "genre_id": genre_id,
+            "search_mode": search_mode,
+            "stamp": stamp,
+        }
+
+    def _filter_cache_key(self, search_text: str, genre_id: Optional[int],
+                          search_mode: utils_db.EnumModosBusqueda, page: Any = None) -> tuple:
+        """
+        Construye la clave de caché de una consulta filtrada de videojuegos.
+
+        La ordenación de la clave distingue la búsqueda de texto completo (por relevancia) de la
+        de subcadena (por clave primaria), porque el mismo texto da resultados distintos en cada modo.
+
+        Parámetros:
+        - search_text (str): Texto del filtro.
+        - genre_id (int | None): Género del filtro.
+        - search_mode (EnumModosBusqueda): Modo de búsqueda del filtro.
+        - page: Clave de la última fila de la página anterior (None para la primera página).
+
+        Retorno:
+        - tuple: Clave para QueryCache.
+        """
+        table_name = utils_db.EnumTablasDB.VIDEOJUEGOS.value
+        sort = "relevancia" if ReportModel._uses_full_text(search_text, search_mode) else utils_db.PRIMARY_KEYS_DB[table_name]
+        return self._query_cache._make_key(table_name, search_text, genre_id, sort, page)
+
+    def _cache_filter_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Guarda en caché el resultado de un filtro (se llama desde el hilo secundario o el bucle asíncrono).
+
+        Parámetros:
+        - result (dict): Resultado de _build_filter_result.
+
+        Retorno:
+        - dict: El mismo resultado.
+        """
+        key = self._filter_cache_key(result["search_text"], result["genre_id"], result["search_mode"])
+        self._query_cache._put(key, result, rows=len(result["data"]) + 1)
+        return result
+
+    def _filtered_page_fetcher(self, search_text: str, genre_id: Optional[int],
+                               search_mode: utils_db.EnumModosBusqueda) -> Callable[[Any, int], Optional[List[Dict[str, Any]]]]:
+        """
+        Devuelve la función con la que se obtienen las páginas siguientes de un filtro.
+
+        La función consulta la base de datos: el modelo de tabla la ejecuta en segundo plano
+        (ver _page_requester), salvo al cargar todas las páginas para exportar.
+
+        Parámetros:
+        - search_text (str): Texto del filtro.
+        - genre_id (int | None): Género del filtro.
+        - search_mode (EnumModosBusqueda): Modo de búsqueda del filtro.
+
+        Retorno:
+        - callable: (after_key, limit) -> filas de la página siguiente con el nombre del género.
+        """
+        def fetch_page(after_key: Any, limit: int) -> Optional[List[Dict[str, Any]]]:
+            key = self._filter_cache_key(search_text, genre_id, search_mode, (after_key, limit))
+            cached = self._query_cache._get(key)
+            if cached is not None:
+                return cached
+            rows = self._model._fetch_filtered(search_text, genre_id, after_key, limit, search_mode=search_mode)
+            if not rows:
+                return rows
+            self._query_cache._put(key, rows, rows=len(rows))
+            return rows
+
+        return fetch_page
+
+    def _page_requester(self, fetch_page: Callable[[Any, int], Optional[List[Dict[str, Any]]]]
+                        ) -> Callable[[Any, int, Callable[[Any, Optional[List[Dict[str, Any]]]], None]], None]:
+        """
+        Devuelve la función con la que el modelo de tabla pide en segundo plano la página siguiente.
+
+        La página se obtiene en el QueryRunner y se entrega al modelo en el hilo principal, de modo
+        que desplazarse por la tabla no bloquea la interfaz mientras se consulta el servidor.
+
+        Parámetros:
+        - fetch_page (callable): Función (after_key, limit) devuelta por _filtered_page_fetcher.
+
+        Retorno:
+        - callable: (after_key, limit, on_page) que lanza la consulta y llama a on_page(after_key, filas).
+        """
+        def request_page(after_key: Any, limit: int,
+                         on_page: Callable[[Any, Optional[List[Dict[str, Any]]]], None]) -> None:
+            def on_error(message: str) -> None:
+                self._on_query_error("Error al obtener la página siguiente", message)
+                on_page(after_key, None)
+
+            self._query_runner._submit(
+                self._KEY_PAGE, fetch_page, after_key, limit,
+                on_result=lambda rows: on_page(after_key, rows), on_error=on_error
+            )
+
+        return request_page
 
-            if not model_data:
+    def _on_filters_computed(self, result: Optional[Dict[str, Any]]) -> None:
+        """
+        Actualiza tabla, gráfico y resumen con el resultado de los filtros (se ejecuta en el hilo principal).
+
+        Parámetros:
+        - result (dict | None): Resultado de _compute_filters.
+        """
+        try:
+            if not result:
                 _printv2(show_popup=False, parent=self._popup_parent,
                          message="No se encontraron datos para aplicar filtros.")
                 self._view._clear_chart()
-                self._view._set_model(QStandardItemModel())
+                self._table_model = None
+                self._view._set_model(self._prepare_table_data({"columns": [], "data": []}))
                 self._view._update_summary(0, 0.0)
                 return
-            
-            genres_data = self._model._fetch_data(utils_db.EnumTablasDB.GENEROS.value)
-            id_to_genres = {row["id_genero"]: row["nombre_genero"] for row in genres_data} if genres_data else {}
-
-            for row in model_data:
-                row["genero"] = id_to_genres.get(row["id_genero"], "Desconocida")
-
-            
-            
-
-            # Filtrar por texto de búsqueda y género
-            filtered_data = [
-                row for row in model_data
-                if any(search_text.lower() in str(value).lower() for value in row.values())
-                and (genre == "Todos" or row["genero"] == genre)
-            ]
-
-            # Calcular resumen
-            total_games = len(filtered_data)
-            total_ventas = 0
-            for row in filtered_data:
-                total_ventas += int (row["ventas"])
-
-            # Actualizar resumen en la vista
+
+            # La página que se estuviera pidiendo pertenece al filtro anterior
+            self._query_runner._cancel(self._KEY_PAGE)
+
+            filtered_data = result["data"]
+            self._active_filter = {
+                "search_text": result["search_text"],
+                "genre_id": result["genre_id"],
+                "search_mode": result["search_mode"],
+            }
+
+            # Actualizar resumen en la vista (calculado en el servidor)
             # No hay precios en VideojuegoEntity
-            self._view._update_summary(total_games, total_ventas)
+            summary = result["summary"]
+            self._show_summary(summary)
 
-            # Actualizar tabla
+            # Actualizar tabla (las páginas siguientes se piden al desplazarse)
             prepared_data = self._prepare_table_data({
-                "columns": ["titulo", "genero", "plataforma","ventas", "fecha_lanzamiento", "descripcion"],
+                "columns": utils_db.TABLE_COLUMNS_VIDEOJUEGOS,
                 "data": filtered_data,
-            })
+            }, fetch_page=self._filtered_page_fetcher(result["search_text"], result["genre_id"], result["search_mode"]))
+            self._table_model = prepared_data
+            self._sync_stamp = result.get("stamp")  # Un resultado de la caché se pone al día en la siguiente sincronización
             self._view._set_model(prepared_data)
 
-            # Actualizar gráfico
-            chart_data = self._prepare_chart_data({
-                utils_db.EnumEjes.EJE_X.value: [row["titulo"] for row in filtered_data],
-                utils_db.EnumEjes.EJE_Y.value: {"Ventas": [int(row["ventas"]) for row in filtered_data] if filtered_data else []},
-            })
-            self._view._set_chart(chart_data)
+            # Actualizar gráfico (más vendidos del filtro, calculados en el servidor)
+            self._view._set_chart(self._sales_chart_data(result["top_sales"]))
+            self._load_sales_series()
 
         except Exception as e:
             _printv2(show_popup=False, parent=self._popup_parent,
                      message=f"Error al aplicar filtros: {e}")
 
-    def _prepare_table_data(self, model_data: Dict[str, Any]) -> QStandardItemModel:
+    @Slot(object, object, str)
+    def _apply_date_range(self, date_from: Optional[Any], date_to: Optional[Any], bucket: str) -> None:
         """
-        Prepara los datos para el modelo de tabla.
+        Aplica el rango de fechas y el periodo de la evolución de ventas elegidos en la vista.
+
+        Parámetros:
+        - date_from (datetime.date | None): Primer día incluido (None para no limitar).
+        - date_to (datetime.date | None): Último día incluido (None para no limitar).
+        - bucket (str): Periodo de agrupación (valor de utils_db.EnumPeriodos).
+        """
+        self._sales_range = {"date_from": date_from, "date_to": date_to, "bucket": bucket}
+        self._load_sales_series()
+
+    def _load_sales_series(self) -> None:
+        """
+        Pide en segundo plano la evolución de ventas con el rango de fechas y el filtro activos.
+        """
+        bucket = self._sales_range["bucket"]
+        self._query_runner._submit(
+            self._KEY_SERIES, self._model._fetch_sales_series,
+            bucket, self._sales_range["date_from"], self._sales_range["date_to"],
+            self._active_filter["search_text"], self._active_filter["genre_id"], self._active_filter["search_mode"],
+            on_result=lambda rows: self._on_sales_series_loaded(rows, bucket),
+            on_error=lambda message: self._on_query_error("Error al obtener la evolución de ventas", message)
+        )
+
+    def _on_sales_series_loaded(self, rows: Optional[List[Dict[str, Any]]], bucket: str) -> None:
+        """
+        Muestra la evolución de ventas (se ejecuta en el hilo principal).
+
+        Parámetros:
+        - rows (list[dict] | None): Resultado de ReportModel._fetch_sales_series.
+        - bucket (str): Periodo de agrupación de las filas.
+        """
+        rows = rows or []
+        self._view._set_sales_series({
+            utils_db.EnumEjes.EJE_X.value: [row["periodo"] for row in rows],
+            utils_db.EnumEjes.EJE_Y.value: {"Unidades": [row["unidades"] for row in rows]},
+        }, bucket)
+
+    def _show_summary(self, summary: Dict[str, Any]) -> None:
+        """
+        Muestra en la vista el resumen de ventas calculado en el servidor.
+
+        Parámetros:
+        - summary (dict): Resumen con "total", "suma", "minimo", "maximo" y "media".
+        """
+        self._view._update_summary(
+            summary["total"], summary["suma"],
+            min_value=summary["minimo"], max_value=summary["maximo"], avg_value=summary["media"]
+        )
+
+    def _sales_chart_data(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Prepara el gráfico de ventas por título de un conjunto de filas.
+
+        Parámetros:
+        - rows (list[dict]): Filas de videojuegos.
+
+        Retorno:
+        - dict: Datos para el gráfico.
+        """
+        return self._prepare_chart_data({
+            utils_db.EnumEjes.EJE_X.value: [row["titulo"] for row in rows],
+            utils_db.EnumEjes.EJE_Y.value: {"Ventas": [int(row["ventas"]) for row in rows] if rows else []},
+        })
+
+    @Slot(object)
+    def _on_notification(self, payload: Dict[str, Any]) -> None:
+        """
+        Acumula una notificación de cambios y programa su aplicación (se ejecuta en el hilo principal).
+
+        Parámetros:
+        - payload (dict): Notificación con "tabla", "operacion" y "codigo", o {"operacion": "RESYNC"}.
+        """
+        if payload.get("operacion") == "RESYNC":
+            self._resync_pending = True  # Pudieron perderse cambios: se recarga el filtro completo
+        elif payload.get("codigo") is not None:
+            self._pending_changes.add(payload["codigo"])
+        else:
+            return
+
+        # Los resultados guardados ya no reflejan la base de datos
+        self._query_cache._invalidate(utils_db.EnumTablasDB.VIDEOJUEGOS.value)
+        self._notify_timer.start()
+
+    def _apply_pending_changes(self) -> None:
+        """
+        Lanza en segundo plano la consulta de las filas modificadas desde la última actualización.
+        """
+        search_text, genre_id, search_mode = self._server_filter()
+
+        if self._resync_pending:
+            self._resync_pending = False
+            self._pending_changes.clear()
+            if self._search_index is not None:
+                self._initialize_view()  # El catálogo en memoria se vuelve a cargar completo
+            else:
+                self._run_filters(search_text, genre_id)
+            return
+
+        if not self._pending_changes or self._table_model is None:
+            self._pending_changes.clear()
+            return
+
+        if self._ranked_view():
+            # Resultados por relevancia (solo los primeros): se vuelve a ejecutar el filtro
+            self._pending_changes.clear()
+            self._changes_in_flight.clear()
+            self._run_filters(search_text, genre_id)
+            return
+
+        # Si había una consulta de cambios en curso, queda obsoleta: sus códigos se piden de nuevo
+        keys = sorted(self._pending_changes | self._changes_in_flight)
+        self._changes_in_flight = set(keys)
+        self._pending_changes.clear()
+        self._query_runner._submit(
+            self._KEY_CHANGES, self._compute_changes, keys, search_text, genre_id, search_mode,
+            on_result=self._on_changes_computed,
+            on_error=lambda message: self._on_query_error("Error al actualizar los cambios", message)
+        )
+
+    def _compute_changes(self, keys: List[str], search_text: str, genre_id: Optional[int],
+                         search_mode: utils_db.EnumModosBusqueda) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene las filas modificadas que cumplen el filtro y el nuevo resumen (se ejecuta en un hilo secundario).
+
+        Parámetros:
+        - keys (list[str]): Códigos de los videojuegos modificados.
+        - search_text (str): Texto del filtro activo.
+        - genre_id (int | None): Género del filtro activo.
+        - search_mode (EnumModosBusqueda): Modo de búsqueda del filtro activo.
+
+        Retorno:
+        - dict: "keys", "rows", "summary", "top_sales" y el filtro con el que se calcularon.
+        - None si no se pudieron obtener las filas.
+        """
+        rows = self._model._fetch_by_keys(keys, search_text, genre_id, search_mode)
+        if rows is None:
+            return None
+        return {
+            "keys": keys,
+            "rows": rows,
+            "summary": self._model._fetch_summary(search_text, genre_id, search_mode),
+            "top_sales": self._model._fetch_top_sales(search_text, genre_id, search_mode),
+            "search_text": search_text,
+            "genre_id": genre_id,
+            "search_mode": search_mode,
+        }
+
+    def _on_changes_computed(self, result: Optional[Dict[str, Any]]) -> None:
+        """
+        Aplica en su sitio las filas modificadas a la tabla, el gráfico y el resumen (se ejecuta en el hilo principal).
 
         Parámetros:
-        - model_data (dict): Datos de la tabla.
+        - result (dict | None): Resultado de _compute_changes.
+        """
+        self._changes_in_flight.clear()
+        if not result or self._table_model is None:
+            return
+        if (result["search_text"], result["genre_id"], result["search_mode"]) != self._server_filter():
+            return  # El filtro ha cambiado mientras tanto: la vista ya muestra datos nuevos
+
+        key_column = utils_db.PRIMARY_KEYS_DB[utils_db.EnumTablasDB.VIDEOJUEGOS.value]
+        matching_keys = {row[key_column] for row in result["rows"]}
+        removed = [key for key in result["keys"] if key not in matching_keys]
+        self._patch_table(result["rows"], removed, result["summary"], result["top_sales"])
+
+    def _sync_changes(self) -> None:
+        """
+        Lanza en segundo plano la sincronización incremental desde el último sello recibido.
+        """
+        if self._sync_stamp is None or self._table_model is None:
+            return
+        self._query_runner._submit(
+            self._KEY_SYNC, self._compute_sync, self._sync_stamp, *self._server_filter(),
+            on_result=self._on_sync_computed,
+            on_error=lambda message: self._on_query_error("Error al sincronizar los cambios", message)
+        )
+
+    def _compute_sync(self, stamp: int, search_text: str, genre_id: Optional[int],
+                      search_mode: utils_db.EnumModosBusqueda) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene los cambios de 'videojuegos' posteriores al sello y, si los hay, el nuevo resumen y
+        los más vendidos (se ejecuta en un hilo secundario).
+
+        Parámetros:
+        - stamp (int): Último sello recibido.
+        - search_text (str): Texto del filtro activo.
+        - genre_id (int | None): Género del filtro activo.
+        - search_mode (EnumModosBusqueda): Modo de búsqueda del filtro activo.
 
         Retorno:
-        - QStandardItemModel: Modelo para la tabla.
+        - dict: Resultado de ReportModel._fetch_changes_since más "summary", "top_sales" y el filtro usado.
+        - None si no se pudieron obtener los cambios.
+        """
+        delta = self._model._fetch_changes_since(
+            utils_db.EnumTablasDB.VIDEOJUEGOS.value, stamp, search_text, genre_id, search_mode)
+        if delta is None:
+            return None
+        has_changes = bool(delta["rows"] or delta["removed"])
+        delta["summary"] = self._model._fetch_summary(search_text, genre_id, search_mode) if has_changes else None
+        delta["top_sales"] = self._model._fetch_top_sales(search_text, genre_id, search_mode) if has_changes else None
+        delta["search_text"] = search_text
+        delta["genre_id"] = genre_id
+        delta["search_mode"] = search_mode
+        return delta
+
+    def _on_sync_computed(self, result: Optional[Dict[str, Any]]) -> None:
         """
-        qt_model = QStandardItemModel()
-        columns = model_data.get("columns", [])
-        qt_model.setHorizontalHeaderLabels(columns)
+        Aplica la sincronización incremental a la vista (se ejecuta en el hilo principal).
 
-        for row in model_data.get("data", []):
-            items = [QStandardItem(str(row.get(col, ""))) for col in columns]
-            qt_model.appendRow(items)
+        Parámetros:
+        - result (dict | None): Resultado de _compute_sync.
+        """
+        if not result or self._table_model is None:
+            return
+        if (result["search_text"], result["genre_id"], result["search_mode"]) != self._server_filter():
+            return
 
-        return qt_model
+        self._sync_stamp = max(self._sync_stamp or 0, result["stamp"])
+        if not result["rows"] and not result["removed"]:
+            return  # Sin cambios: solo se ha transferido la consulta vacía
+
+        self._query_cache._invalidate(utils_db.EnumTablasDB.VIDEOJUEGOS.value)
+        self._patch_table(result["rows"], result["removed"], result["summary"], result["top_sales"])
+
+    def _refresh_rollups(self) -> None:
+        """
+        Lanza en segundo plano la actualización de los resúmenes materializados de ventas.
+        """
+        self._query_runner._submit(
+            self._KEY_ROLLUPS, self._model._refresh_sales_rollups,
+            on_error=lambda message: self._on_query_error("Error al actualizar los resúmenes de ventas", message)
+        )
+
+    def _maintain_partitions(self) -> None:
+        """
+        Lanza en segundo plano el mantenimiento de las particiones mensuales de 'ventas'.
+        """
+        self._query_runner._submit(
+            self._KEY_PARTITIONS, self._model._maintain_sales_partitions,
+            on_error=lambda message: self._on_query_error("Error al mantener las particiones de ventas", message)
+        )
+
+    def _prune_tombstones(self) -> None:
+        """
+        Lanza en segundo plano la poda de las lápidas de borrados antiguas.
+        """
+        self._query_runner._submit(
+            self._KEY_TOMBSTONES, self._model._prune_change_tombstones,
+            on_error=lambda message: self._on_query_error("Error al podar las lápidas de borrados", message)
+        )
+
+    def _patch_table(self, rows: List[Dict[str, Any]], removed_keys: List[Any],
+                     summary: Optional[Dict[str, Any]], top_sales: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Actualiza en su sitio la tabla, el gráfico y el resumen con las filas cambiadas.
+
+        Parámetros:
+        - rows (list[dict]): Filas nuevas o modificadas que cumplen el filtro activo.
+        - removed_keys (list): Códigos borrados o que ya no cumplen el filtro.
+        - summary (dict | None): Nuevo resumen (None para mantener el actual).
+        - top_sales (list[dict] | None): Nuevos más vendidos (None para mantener el gráfico actual).
+        """
+        try:
+            if self._search_index is not None:
+                self._apply_catalogue_changes(rows, removed_keys)
+                return
+            if self._ranked_view():
+                # Las filas no están ordenadas por código ni son todas las que cumplen el filtro:
+                # un cambio puede mover una fila, sacarla de los primeros resultados o meter otra
+                self._query_cache._invalidate(utils_db.EnumTablasDB.VIDEOJUEGOS.value)
+                self._run_filters(self._active_filter["search_text"], self._active_filter["genre_id"])
+                return
+
+            self._table_model._remove_keys(removed_keys)
+            self._table_model._upsert_rows(rows)
+
+            if summary is not None:
+                self._show_summary(summary)
+            if top_sales is not None:
+                self._view._set_chart(self._sales_chart_data(top_sales))
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent,
+                     message=f"Error al actualizar los cambios: {e}")
+
+    def _ranked_view(self) -> bool:
+        """
+        Indica si la tabla muestra resultados de texto completo ordenados por relevancia.
+
+        Esos resultados (los utils_db.FULL_TEXT_TOP_N_DB primeros) no se pueden actualizar en su
+        sitio, porque el modelo de tabla coloca las filas por código: ante un cambio se vuelve a
+        ejecutar el filtro.
+
+        Retorno:
+        - bool: True si el filtro activo se resuelve con la búsqueda de texto completo en el servidor.
+        """
+        return self._search_index is None and ReportModel._uses_full_text(
+            self._active_filter["search_text"], self._active_filter["search_mode"])
+
+    def _on_query_error(self, context: str, message: str) -> None:
+        """
+        Notifica un error producido en una consulta en segundo plano.
+
+        Parámetros:
+        - context (str): Descripción de la operación que falló.
+        - message (str): Mensaje de error.
+        """
+        _printv2(show_popup=False, parent=self._popup_parent, message=f"{context}: {message}")
+
+    def _prepare_table_data(self, model_data: Dict[str, Any],
+                            fetch_page: Optional[Callable[[Any, int], Optional[List[Dict[str, Any]]]]] = None) -> LazyTableModel:
+        """
+        Prepara los datos para el modelo de tabla.
+
+        Parámetros:
+        - model_data (dict): Datos de la tabla ("columns" y primera página en "data").
+        - fetch_page (callable | None): Función (after_key, limit) para obtener las páginas siguientes
+          (el modelo la ejecuta en segundo plano con _page_requester).
+
+        Retorno:
+        - LazyTableModel: Modelo para la tabla, que carga más filas al desplazarse.
+        """
+        return LazyTableModel(
+            columns=model_data.get("columns", []),
+            rows=model_data.get("data", []),
+            fetch_page=fetch_page,
+            request_page=self._page_requester(fetch_page) if fetch_page is not None else None,
+            key_column=utils_db.PRIMARY_KEYS_DB[utils_db.EnumTablasDB.VIDEOJUEGOS.value],
+            page_size=utils_db.PAGE_SIZE_DB
+        )
 
     def _prepare_chart_data(self, model_data: Dict[str, Any]) -> Dict[str, Any]:
         """
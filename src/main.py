@@ -4,8 +4,9 @@ import sys
 from PySide6.QtWidgets import QApplication, QMainWindow
 from utils.utils_popup import _printv2
 from utils.utils_init import initialize_app
+from models.async_manager_db import AsyncManagerDB
 from windows.report_window import ReportWindow
-from utils import utils_sizes
+from utils import utils_sizes, utils_db
 
 
 class MainWindow(QMainWindow):
@@ -14,12 +15,13 @@ class MainWindow(QMainWindow):
     conecta el módulo de reportes.
     """
 
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, async_db_manager=None):
         """
         Inicializa la ventana principal de la aplicación.
 
         Parámetros:
         - db_manager: Instancia del gestor de la base de datos.
+        - async_db_manager: Instancia opcional del gestor asíncrono de la base de datos.
         """
         super().__init__()
 
@@ -32,7 +34,8 @@ class MainWindow(QMainWindow):
             )
 
             # Inicialización del módulo de reportes
-            self.report_window = ReportWindow(db_manager=db_manager, popup_parent=self)
+            self.report_window = ReportWindow(
+                db_manager=db_manager, popup_parent=self, async_db_manager=async_db_manager)
 
             # Establecer la vista de reportes como el widget central
             self.setCentralWidget(self.report_window.get_view())
@@ -55,8 +58,16 @@ if __name__ == "__main__":
         # Inicialización de la base de datos
         db_manager = initialize_app(show_popup=False)
 
+        # Gestor asíncrono opcional para consultas concurrentes
+        async_db_manager = None
+        if utils_db.USE_ASYNC_DB:
+            async_db_manager = AsyncManagerDB(show_popup=False)
+            if not async_db_manager.open_connection():
+                async_db_manager.close_connection()
+                async_db_manager = None  # Se continúa con el gestor síncrono
+
         # Creamos y mostramos la ventana principal
-        main_window = MainWindow(db_manager=db_manager)
+        main_window = MainWindow(db_manager=db_manager, async_db_manager=async_db_manager)
         main_window.show()
 
         # Ejecutamos el ciclo principal de eventos de la aplicación
@@ -0,0 +1,209 @@
+# Archivo: src/models/async_manager_db.py
+
+import asyncio  # Bucle de eventos para las consultas asíncronas
+import threading  # Hilo dedicado que ejecuta el bucle de eventos
+from concurrent.futures import Future  # Resultado de una corrutina enviada desde otro hilo
+from contextlib import asynccontextmanager  # Permite exponer la conexión como gestor de contexto asíncrono
+from typing import Any, AsyncIterator, Coroutine, Dict, Optional
+import psycopg  # Biblioteca para gestionar la conexión con PostgreSQL
+from psycopg_pool import AsyncConnectionPool  # Pool de conexiones asíncronas
+from utils import utils_db
+from utils.utils_popup import _printv2
+
+
+class AsyncManagerDB:
+    """
+    Variante asíncrona de ManagerDB basada en psycopg.AsyncConnection.
+
+    Mantiene un AsyncConnectionPool dentro de un bucle de asyncio que se ejecuta en un hilo
+    dedicado. Una misma ventana puede lanzar muchas consultas solapadas (p. ej. con
+    asyncio.gather) sin crear un hilo por consulta; los resultados se recogen desde Qt
+    mediante los Future devueltos por `_run_coroutine`.
+    """
+
+    def __init__(
+        self,
+        show_popup: bool = False,
+        popup_parent: Optional[object] = None,
+        pool_min_size: int = utils_db.POOL_MIN_SIZE_DB,
+        pool_max_size: int = utils_db.POOL_MAX_SIZE_DB,
+        pool_timeout: float = utils_db.POOL_TIMEOUT_DB,
+        pool_max_lifetime: float = utils_db.POOL_MAX_LIFETIME_DB,
+        pool_max_idle: float = utils_db.POOL_MAX_IDLE_DB
+    ):
+        """
+        Inicializa una instancia de AsyncManagerDB y arranca su bucle de eventos.
+
+        Parámetros:
+        - show_popup (bool): Indica si se utilizarán popups para mostrar mensajes.
+        - popup_parent (QWidget | None): Widget padre opcional para asociar los popups.
+        - pool_min_size (int): Número mínimo de conexiones abiertas en el pool.
+        - pool_max_size (int): Número máximo de conexiones del pool.
+        - pool_timeout (float): Segundos máximos de espera para obtener una conexión del pool.
+        - pool_max_lifetime (float): Segundos tras los cuales el pool recicla una conexión.
+        - pool_max_idle (float): Segundos que una conexión sobrante puede estar ociosa antes de cerrarse.
+        """
+        self._pool: Optional[AsyncConnectionPool] = None
+        self._show_popup = show_popup
+        self._popup_parent = popup_parent
+
+        self._pool_min_size = pool_min_size
+        self._pool_max_size = pool_max_size
+        self._pool_timeout = pool_timeout
+        self._pool_max_lifetime = pool_max_lifetime
+        self._pool_max_idle = pool_max_idle
+
+        # Bucle de asyncio en un hilo propio (daemon para no bloquear el cierre de la aplicación).
+        # psycopg necesita un bucle basado en selectores (en Windows el predeterminado es Proactor).
+        self._loop = asyncio.SelectorEventLoop()
+        self._loop_thread = threading.Thread(target=self._run_loop, name="AsyncManagerDB", daemon=True)
+        self._loop_thread.start()
+    # __init__ (fin)
+
+    def _run_loop(self) -> None:
+        """
+        Ejecuta el bucle de eventos en el hilo dedicado.
+        """
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+    # _run_loop (fin)
+
+    def _run_coroutine(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """
+        Envía una corrutina al bucle de eventos del gestor.
+
+        Parámetros:
+        - coro (Coroutine): Corrutina a ejecutar (p. ej. un método async de ReportModel).
+
+        Retorno:
+        - concurrent.futures.Future: Resultado de la corrutina; cancelarlo cancela la tarea.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    # _run_coroutine (fin)
+
+    def open_connection(self) -> bool:
+        """
+        Abre el pool de conexiones asíncronas (bloquea hasta que está listo).
+
+        Retorno:
+        - bool: True si el pool se abrió exitosamente, False en caso contrario.
+        """
+        try:
+            self._run_coroutine(self._open_pool()).result()
+            self._emit_messages(["Pool asíncrono de la base de datos abierto exitosamente."])
+            return True
+        except Exception as e:
+            self._emit_messages([f"Error al abrir el pool asíncrono de la base de datos:\n{e}"])
+            return False
+    # open_connection (fin)
+
+    async def _open_pool(self) -> bool:
+        """
+        Crea y abre el AsyncConnectionPool dentro del bucle de eventos del gestor.
+
+        Retorno:
+        - bool: True si el pool se abrió exitosamente.
+        """
+        self._pool = AsyncConnectionPool(
+            kwargs={
+                "dbname": utils_db.NAME_DB,
+                "user": utils_db.USER_DB,
+                "password": utils_db.PASS_DB,
+                "host": utils_db.HOSTNAME_DB,
+                "port": utils_db.PORT_DB
+            },
+            min_size=self._pool_min_size,
+            max_size=self._pool_max_size,
+            timeout=self._pool_timeout,
+            max_lifetime=self._pool_max_lifetime,
+            max_idle=self._pool_max_idle,
+            check=AsyncConnectionPool.check_connection,
+            configure=self._configure_connection,
+            name=f"{utils_db.CONNECTION_NAME}_async",
+            open=False
+        )
+        await self._pool.open(wait=True, timeout=self._pool_timeout)
+        return True
+    # _open_pool (fin)
+
+    async def _configure_connection(self, connection: psycopg.AsyncConnection) -> None:
+        """
+        Ajusta cada conexión que crea el pool asíncrono (ver ManagerDB._configure_connection).
+
+        Parámetros:
+        - connection (psycopg.AsyncConnection): Conexión recién abierta.
+        """
+        connection.prepared_max = utils_db.PREPARED_MAX_DB
+    # _configure_connection (fin)
+
+    def is_open(self) -> bool:
+        """
+        Indica si el pool asíncrono está abierto.
+
+        Retorno:
+        - bool: True si se pueden obtener conexiones.
+        """
+        return self._pool is not None and not self._pool.closed
+    # is_open (fin)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        """
+        Proporciona una conexión asíncrona del pool dentro de un bloque `async with`.
+
+        Retorno:
+        - AsyncIterator[psycopg.AsyncConnection]: Conexión activa durante el bloque.
+
+        Excepciones:
+        - ValueError: Si el pool no está abierto.
+        """
+        if not self.is_open():
+            raise ValueError("No hay un pool de conexiones asíncrono activo.")
+        async with self._pool.connection() as conn:
+            yield conn
+    # connection (fin)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Devuelve las estadísticas del pool asíncrono (mismo formato que ManagerDB.get_pool_stats).
+
+        Retorno:
+        - dict: Estadísticas del pool, o un diccionario vacío si no está abierto.
+        """
+        if self._pool is None:
+            return {}
+        return dict(self._pool.get_stats())
+    # get_pool_stats (fin)
+
+    def close_connection(self) -> bool:
+        """
+        Cierra el pool asíncrono y detiene el bucle de eventos.
+
+        Retorno:
+        - bool: True si había un pool abierto que cerrar.
+        """
+        was_open = self.is_open()
+        if was_open:
+            self._run_coroutine(self._pool.close()).result()
+            self._emit_messages(["Pool asíncrono de la base de datos cerrado exitosamente."])
+        self._pool = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        return was_open
+    # close_connection (fin)
+
+    def _emit_messages(self, messages: list[str]) -> None:
+        """
+        Emite mensajes acumulados por consola (y popup si está habilitado).
+
+        Parámetros:
+        - messages (list[str]): Lista de mensajes a emitir.
+        """
+        if messages:
+            _printv2(
+                show_popup=self._show_popup,
+                parent=self._popup_parent,
+                message="".join(messages),
+                duration=5000
+            )
+    # _emit_messages (fin)
+# AsyncManagerDB (fin)
@@ -0,0 +1,188 @@
+# Archivo: src/models/columnar_store.py
+
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np  # Columnas del catálogo como arrays para filtrar y agregar sin bucles de Python
+
+
+class ColumnarStore:
+    """
+    Almacén columnar del catálogo de videojuegos con arrays de NumPy.
+
+    Guarda las columnas numéricas y de fecha del informe como arrays ("ventas" como enteros y
+    "fecha_lanzamiento" como datetime64, con NaT si falta) y las categóricas ("genero" y
+    "plataforma") codificadas por diccionario: cada valor distinto recibe un código entero y la
+    columna es un array de códigos. Filtrar por género es entonces una máscara booleana y el
+    resumen de ventas se calcula con las funciones de NumPy sobre las filas seleccionadas.
+
+    Las filas se identifican por su posición, igual que en el modelo de tabla y en SearchIndex.
+    Los arrays reservan capacidad de más y crecen al doble, de modo que añadir filas de una en una
+    (cambios recibidos) no copia todo el almacén cada vez.
+    """
+
+    _NUMERIC_COLUMNS = {"ventas": np.int64, "fecha_lanzamiento": "datetime64[D]"}
+    _ENCODED_COLUMNS = ["genero", "plataforma"]
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Construye el almacén a partir de las filas del informe.
+
+        Parámetros:
+        - rows (list[dict]): Filas de videojuegos; la posición de cada una es su identificador.
+        """
+        self._size = len(rows)
+        self._arrays: Dict[str, np.ndarray] = {
+            column: np.array([self._numeric_value(column, row.get(column)) for row in rows], dtype=dtype)
+            for column, dtype in self._NUMERIC_COLUMNS.items()
+        }
+        self._dictionaries: Dict[str, Dict[Any, int]] = {column: {} for column in self._ENCODED_COLUMNS}
+        for column in self._ENCODED_COLUMNS:
+            self._arrays[column] = np.array([self._encode(column, row.get(column)) for row in rows], dtype=np.int32)
+    # __init__ (fin)
+
+    def __len__(self) -> int:
+        """
+        Devuelve el número de filas guardadas.
+        """
+        return self._size
+    # __len__ (fin)
+
+    @staticmethod
+    def _numeric_value(column: str, value: Any) -> Any:
+        """
+        Adapta un valor a su columna numérica (ventas nulas cuentan como 0; fechas nulas, NaT).
+
+        Parámetros:
+        - column (str): Columna numérica.
+        - value (Any): Valor leído de la base de datos.
+
+        Retorno:
+        - Any: Valor listo para el array.
+        """
+        if column == "ventas":
+            return int(value or 0)
+        return value if value is not None else np.datetime64("NaT")
+    # _numeric_value (fin)
+
+    def _encode(self, column: str, value: Any) -> int:
+        """
+        Devuelve el código de un valor categórico, asignándole uno nuevo si aún no lo tiene.
+
+        Parámetros:
+        - column (str): Columna codificada.
+        - value (Any): Valor de la columna.
+
+        Retorno:
+        - int: Código del valor.
+        """
+        dictionary = self._dictionaries[column]
+        return dictionary.setdefault(value, len(dictionary))
+    # _encode (fin)
+
+    def _set_row(self, position: int, row: Dict[str, Any]) -> None:
+        """
+        Escribe los valores de una fila en su posición.
+
+        Parámetros:
+        - position (int): Posición de la fila (menor que el número de filas).
+        - row (dict): Valores de la fila.
+        """
+        for column in self._NUMERIC_COLUMNS:
+            self._arrays[column][position] = self._numeric_value(column, row.get(column))
+        for column in self._ENCODED_COLUMNS:
+            self._arrays[column][position] = self._encode(column, row.get(column))
+    # _set_row (fin)
+
+    def _append_row(self, row: Dict[str, Any]) -> int:
+        """
+        Añade una fila al final, duplicando la capacidad de los arrays si están llenos.
+
+        Parámetros:
+        - row (dict): Valores de la fila.
+
+        Retorno:
+        - int: Posición de la nueva fila.
+        """
+        position = self._size
+        for column, values in self._arrays.items():
+            if position >= len(values):
+                grown = np.empty(max(2 * len(values), 16), dtype=values.dtype)
+                grown[:len(values)] = values
+                self._arrays[column] = grown
+        self._size += 1
+        self._set_row(position, row)
+        return position
+    # _append_row (fin)
+
+    def _select_equal(self, column: str, value: Any, row_ids: Sequence[int]) -> List[int]:
+        """
+        Devuelve, de entre unas filas, las que tienen un valor en una columna codificada (máscara booleana).
+
+        Parámetros:
+        - column (str): Columna codificada ("genero" o "plataforma").
+        - value (Any): Valor buscado.
+        - row_ids (Sequence[int]): Filas entre las que se selecciona.
+
+        Retorno:
+        - list[int]: Filas seleccionadas, en el mismo orden.
+        """
+        code = self._dictionaries[column].get(value)
+        if code is None:
+            return []
+        ids = np.asarray(row_ids, dtype=np.intp)
+        return ids[self._arrays[column][ids] == code].tolist()
+    # _select_equal (fin)
+
+    def _values(self, column: str, row_ids: Sequence[int]) -> np.ndarray:
+        """
+        Devuelve los valores de una columna numérica para unas filas (p. ej. para el gráfico).
+
+        Parámetros:
+        - column (str): Columna numérica ("ventas" o "fecha_lanzamiento").
+        - row_ids (Sequence[int]): Filas, en el orden deseado.
+
+        Retorno:
+        - np.ndarray: Valores de esas filas.
+        """
+        return self._arrays[column][np.asarray(row_ids, dtype=np.intp)]
+    # _values (fin)
+
+    def _top_rows(self, column: str, row_ids: Sequence[int], count: int) -> List[int]:
+        """
+        Devuelve, de entre unas filas, las que tienen los valores más altos de una columna numérica.
+
+        Parámetros:
+        - column (str): Columna numérica (p. ej. "ventas").
+        - row_ids (Sequence[int]): Filas entre las que se elige.
+        - count (int): Número máximo de filas.
+
+        Retorno:
+        - list[int]: Filas de mayor a menor valor (a igual valor, en el orden recibido).
+        """
+        ids = np.asarray(row_ids, dtype=np.intp)
+        order = np.argsort(-self._arrays[column][ids], kind="stable")[:count]
+        return ids[order].tolist()
+    # _top_rows (fin)
+
+    def _sales_summary(self, row_ids: Sequence[int]) -> Optional[Dict[str, Any]]:
+        """
+        Calcula el resumen de ventas de unas filas con operaciones vectorizadas.
+
+        Parámetros:
+        - row_ids (Sequence[int]): Filas a resumir.
+
+        Retorno:
+        - dict: Resumen con "total", "suma", "minimo", "maximo" y "media".
+        - None si no hay filas.
+        """
+        ventas = self._values("ventas", row_ids)
+        if not ventas.size:
+            return None
+        return {
+            "total": int(ventas.size),
+            "suma": int(np.sum(ventas)),
+            "minimo": int(np.min(ventas)),
+            "maximo": int(np.max(ventas)),
+            "media": float(np.mean(ventas)),
+        }
+    # _sales_summary (fin)
+# ColumnarStore (fin)
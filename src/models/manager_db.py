@@ -1,10 +1,17 @@
 # Archivo: src/models/manager_db.py
 
+import json  # Decodificación de las notificaciones de cambios
+import re  # Reconocimiento de las etiquetas de dollar-quoting al dividir el script SQL
+import threading  # Hilo de escucha de notificaciones (LISTEN/NOTIFY)
 import psycopg  # Biblioteca para gestionar la conexión con PostgreSQL
+from psycopg import sql  # Composición segura de identificadores (canal de LISTEN)
+from psycopg_pool import ConnectionPool  # Pool de conexiones reutilizables para psycopg
+from models.migration_runner import MigrationRunner  # Migraciones versionadas del esquema
 from utils import utils_db, utils_path  # Constantes para la configuración de la base de datos
 import os  # Manejo de rutas y validación de existencia de archivos
+from contextlib import contextmanager  # Permite exponer la conexión como gestor de contexto
 from utils.utils_popup import _printv2
-from typing import Optional
+from typing import Optional, Iterator, Dict, Any, Callable, List
 
 
 class ManagerDB:
@@ -14,20 +21,66 @@ class ManagerDB:
     Proporciona métodos para inicializar, recuperar y cerrar conexiones de forma centralizada,
     utilizando parámetros configurados externamente. También incluye la funcionalidad opcional
     de mostrar mensajes emergentes (popups) para notificaciones de estado.
+
+    Puede trabajar en dos modos:
+    - Conexión única: se mantiene una sola psycopg.Connection compartida; `connection()` la
+      entrega a un solo hilo cada vez, de modo que las transacciones no se mezclan.
+    - Pool: se utiliza un psycopg_pool.ConnectionPool, de modo que cada consulta toma
+      una conexión propia y varias consultas pueden ejecutarse a la vez.
+
+    En ambos modos, el acceso recomendado es `with db_manager.connection() as conn:`.
+
+    Además, puede escuchar las notificaciones de cambios (LISTEN/NOTIFY) en una conexión
+    dedicada en modo autocommit, atendida por un hilo propio (ver add_notification_listener).
     """
 
-    def __init__(self, show_popup: bool = False, popup_parent: Optional[object] = None):
+    # Etiqueta de apertura/cierre de una cadena con dollar-quoting ($$ o $etiqueta$)
+    _DOLLAR_TAG = re.compile(r"\$[A-Za-z_][A-Za-z_0-9]*\$|\$\$")
+
+    def __init__(
+        self,
+        show_popup: bool = False,
+        popup_parent: Optional[object] = None,
+        use_pool: bool = False,
+        pool_min_size: int = utils_db.POOL_MIN_SIZE_DB,
+        pool_max_size: int = utils_db.POOL_MAX_SIZE_DB,
+        pool_timeout: float = utils_db.POOL_TIMEOUT_DB,
+        pool_max_lifetime: float = utils_db.POOL_MAX_LIFETIME_DB,
+        pool_max_idle: float = utils_db.POOL_MAX_IDLE_DB
+    ):
         """
         Inicializa una instancia de ManagerDB con opciones configurables.
 
         Parámetros:
         - show_popup (bool): Indica si se utilizarán popups para mostrar mensajes.
         - popup_parent (QWidget | None): Widget padre opcional para asociar los popups con una ventana principal.
+        - use_pool (bool): Si es True, las conexiones se obtienen de un ConnectionPool.
+        - pool_min_size (int): Número mínimo de conexiones abiertas en el pool.
+        - pool_max_size (int): Número máximo de conexiones del pool.
+        - pool_timeout (float): Segundos máximos de espera para obtener una conexión del pool.
+        - pool_max_lifetime (float): Segundos tras los cuales el pool recicla una conexión.
+        - pool_max_idle (float): Segundos que una conexión sobrante puede estar ociosa antes de cerrarse.
         """
         self._connection = None  # Referencia a la conexión de la base de datos
+        self._connection_lock = threading.RLock()  # Uso exclusivo de la conexión única entre hilos
+        self._pool: Optional[ConnectionPool] = None  # Pool de conexiones (solo en modo pool)
         self._show_popup = show_popup  # Indicador para habilitar mensajes emergentes
         self._popup_parent = popup_parent  # Widget padre opcional para popups
 
+        # Configuración del modo pool
+        self._use_pool = use_pool
+        self._pool_min_size = pool_min_size
+        self._pool_max_size = pool_max_size
+        self._pool_timeout = pool_timeout
+        self._pool_max_lifetime = pool_max_lifetime
+        self._pool_max_idle = pool_max_idle
+
+        # Escucha de notificaciones de cambios (se arranca al registrar el primer oyente)
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._listeners_lock = threading.Lock()
+        self._listener_thread: Optional[threading.Thread] = None
+        self._listener_stop = threading.Event()
+
         # Validar las configuraciones de la base de datos al inicializar la clase
         self._validate_db_config()
     # __init__ (fin)
@@ -43,10 +96,41 @@ class ManagerDB:
             raise ValueError("Las configuraciones de la base de datos en utils_db.py no están completas.")
     # _validate_db_config (fin)
 
+    def _connection_kwargs(self) -> Dict[str, Any]:
+        """
+        Construye los parámetros de conexión a partir de la configuración de utils_db.
+
+        Retorno:
+        - dict: Parámetros aceptados por psycopg.connect.
+        """
+        return {
+            "dbname": utils_db.NAME_DB,
+            "user": utils_db.USER_DB,
+            "password": utils_db.PASS_DB,
+            "host": utils_db.HOSTNAME_DB,
+            "port": utils_db.PORT_DB
+        }
+    # _connection_kwargs (fin)
+
+    def _configure_connection(self, connection: psycopg.Connection) -> None:
+        """
+        Ajusta cada conexión nueva (la única del modo simple o las que crea el pool).
+
+        Fija el máximo de sentencias preparadas que la conexión conserva. psycopg lleva la cuenta
+        de las sentencias preparadas de cada conexión, así que tras una reconexión o al reciclar el
+        pool la conexión nueva empieza vacía y vuelve a preparar cada consulta en su primer uso.
+
+        Parámetros:
+        - connection (psycopg.Connection): Conexión recién abierta.
+        """
+        connection.prepared_max = utils_db.PREPARED_MAX_DB
+    # _configure_connection (fin)
+
     def open_connection(self) -> bool:
         """
         Abre una conexión a la base de datos utilizando los parámetros configurados.
 
+        En modo pool, crea y abre el ConnectionPool esperando a que tenga las conexiones mínimas.
         Si la conexión falla, se registra el error en la consola y se muestra un popup (si está habilitado).
 
         Retorno:
@@ -54,17 +138,31 @@ class ManagerDB:
         """
         messages = []  # Lista para acumular mensajes de estado
         try:
-            self._connection = psycopg.connect(
-                dbname=utils_db.NAME_DB,
-                user=utils_db.USER_DB,
-                password=utils_db.PASS_DB,
-                host=utils_db.HOSTNAME_DB,
-                port=utils_db.PORT_DB
-            )
-            messages.append("Conexión a la base de datos establecida exitosamente.")
+            if self._use_pool:
+                self._pool = ConnectionPool(
+                    kwargs=self._connection_kwargs(),
+                    min_size=self._pool_min_size,
+                    max_size=self._pool_max_size,
+                    timeout=self._pool_timeout,
+                    max_lifetime=self._pool_max_lifetime,
+                    max_idle=self._pool_max_idle,
+                    check=ConnectionPool.check_connection,  # Comprueba la conexión al entregarla
+                    configure=self._configure_connection,
+                    name=utils_db.CONNECTION_NAME,
+                    open=False
+                )
+                self._pool.open(wait=True, timeout=self._pool_timeout)
+                messages.append("Pool de conexiones a la base de datos abierto exitosamente.")
+            else:
+                self._connection = psycopg.connect(**self._connection_kwargs())
+                self._configure_connection(self._connection)
+                messages.append("Conexión a la base de datos establecida exitosamente.")
             return True
         except Exception as e:
             messages.append(f"Error al abrir la conexión a la base de datos:\n{e}")
+            if self._pool is not None:
+                self._pool.close()
+            self._pool = None  # Reinicia el pool en caso de error
             self._connection = None  # Reinicia la conexión en caso de error
             return False
         finally:
@@ -72,14 +170,92 @@ class ManagerDB:
             self._emit_messages(messages)
     # open_connection (fin)
 
+    def is_open(self) -> bool:
+        """
+        Indica si hay una conexión (o un pool) activa.
+
+        Retorno:
+        - bool: True si se pueden obtener conexiones, False en caso contrario.
+        """
+        if self._use_pool:
+            return self._pool is not None and not self._pool.closed
+        return self._connection is not None and not self._connection.closed
+    # is_open (fin)
+
+    @contextmanager
+    def connection(self) -> Iterator[psycopg.Connection]:
+        """
+        Proporciona una conexión lista para usar dentro de un bloque `with`.
+
+        En modo pool, la conexión se toma del pool y se devuelve al salir del bloque.
+        En modo de conexión única, se entrega la conexión compartida y los demás hilos esperan
+        a que termine el bloque (una transacción o un pipeline no pueden compartirse). En ambos
+        casos, la transacción se confirma al salir del bloque o se revierte si hubo una excepción.
+
+        Retorno:
+        - Iterator[psycopg.Connection]: Conexión activa durante el bloque `with`.
+
+        Excepciones:
+        - ValueError: Si no hay una conexión activa a la base de datos.
+        """
+        if self._use_pool:
+            if not self.is_open():
+                raise ValueError("No hay un pool de conexiones activo.")
+            with self._pool.connection() as conn:
+                yield conn
+            return
+
+        with self._connection_lock:
+            conn = self.get_connection()
+            if conn is None:
+                raise ValueError("No hay una conexión activa a la base de datos.")
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+    # connection (fin)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Devuelve las estadísticas del pool de conexiones.
+
+        Incluye las métricas de psycopg_pool (tamaño, conexiones disponibles, peticiones en
+        espera, tiempo total de espera...) y dos valores derivados:
+        - "utilizacion": fracción del tamaño máximo del pool que está en uso (0.0 - 1.0).
+        - "espera_media_ms": tiempo medio de espera por conexión en milisegundos.
+
+        Retorno:
+        - dict: Estadísticas del pool, o un diccionario vacío si no se está usando pool.
+        """
+        if not self._use_pool or self._pool is None:
+            return {}
+
+        stats: Dict[str, Any] = dict(self._pool.get_stats())
+        pool_size = stats.get("pool_size", 0)
+        pool_available = stats.get("pool_available", 0)
+        requests_num = stats.get("requests_num", 0)
+
+        stats["utilizacion"] = (pool_size - pool_available) / self._pool_max_size if self._pool_max_size else 0.0
+        stats["espera_media_ms"] = stats.get("requests_wait_ms", 0) / requests_num if requests_num else 0.0
+        return stats
+    # get_pool_stats (fin)
+
     def get_connection(self) -> Optional[psycopg.Connection]:
         """
-        Retorna la conexión activa a la base de datos.
+        Retorna la conexión activa a la base de datos (solo en modo de conexión única).
+
+        En modo pool se debe utilizar `connection()`.
 
         Retorno:
         - psycopg.Connection: Instancia activa si la conexión está abierta.
         - None: Si no hay una conexión activa o si la conexión está cerrada.
         """
+        if self._use_pool:
+            self._emit_messages(["En modo pool, las conexiones se obtienen con connection()."])
+            return None
         if self._connection and not self._connection.closed:
             return self._connection
         messages = ["La conexión a la base de datos no está activa o ha sido cerrada."]
@@ -88,19 +264,56 @@ class ManagerDB:
     # get_connection (fin)
     
     
-    def init_db(self, sql_file_path: str = utils_path.PATH_INICIALIZACION_DB) -> None:
+    def apply_migrations(self, migrations_dir: str = utils_path.MIGRATIONS_DIR) -> bool:
+        """
+        Crea o actualiza el esquema aplicando las migraciones versionadas pendientes.
+
+        Si el esquema está al día, solo se consulta el registro de migraciones aplicadas.
+        Las pendientes se aplican juntas en una transacción: si alguna falla, no se aplica ninguna.
+
+        Parámetros:
+        - migrations_dir (str): Carpeta con los scripts NNNN_descripcion.sql.
+
+        Retorno:
+        - bool: True si el esquema quedó al día, False si hubo un error.
+        """
+        messages = []  # Lista para acumular mensajes de estado
+
+        if not self.is_open():
+            print("La conexión no estaba abierta. Intentando abrir conexión...")
+            if not self.open_connection():
+                return False
+
+        try:
+            applied, up_to_date = MigrationRunner(self, migrations_dir)._migrate()
+            if up_to_date:
+                messages.append("El esquema de la base de datos está al día.")
+            else:
+                messages.append(f"Migraciones aplicadas: {', '.join(applied)}.")
+            return True
+        except Exception as e:
+            messages.append(f"Error al aplicar las migraciones de la base de datos:\n{e}")
+            return False
+        finally:
+            self._emit_messages(messages)
+    # apply_migrations (fin)
+
+    def init_db(self, sql_file_path: str) -> None:
         """
-        Inicializa la base de datos ejecutando instrucciones SQL desde un archivo.
+        Ejecuta las instrucciones SQL de un archivo (p. ej. delete_db.sql).
+
+        El esquema de la aplicación se crea con apply_migrations; este método queda para
+        scripts puntuales que no forman parte del historial de migraciones.
 
         Parámetros:
-        - sql_file_path (str): Ruta del archivo SQL que contiene las instrucciones para inicializar la base de datos.
+        - sql_file_path (str): Ruta del archivo SQL a ejecutar.
 
         Si el archivo no existe o ocurre un error durante la ejecución, se captura y notifica.
         """
         messages = []  # Lista para acumular mensajes de estado
 
         # Verifica si la conexión está activa
-        if not self.get_connection():
+        if not self.is_open():
             print("La conexión no estaba abierta. Intentando abrir conexión...")
             if not self.open_connection():
                 return  # Detiene la ejecución si no se pudo abrir la conexión
@@ -116,14 +329,8 @@ class ManagerDB:
             with open(sql_file_path, 'r', encoding='utf-8') as file:
                 sql_script = file.read()
 
-            connection = self.get_connection()
-            if not connection:
-                messages.append("No se pudo obtener una conexión activa.")
-                self._emit_messages(messages)
-                return
-
-            with connection.cursor() as cursor:
-                sql_statements = sql_script.split(';')
+            with self.connection() as connection, connection.cursor() as cursor:
+                sql_statements = self._split_sql_statements(sql_script)
                 for statement in sql_statements:
                     statement = statement.strip()
                     if statement:  # Ejecuta solo si hay una instrucción válida
@@ -131,7 +338,6 @@ class ManagerDB:
                             cursor.execute(statement)
                         except Exception as e:
                             messages.append(f"Error ejecutando la instrucción:\n{statement}\n{e}")
-                connection.commit()
                 messages.append("Base de datos inicializada exitosamente.")
         except Exception as e:
             messages.append(f"Error al inicializar la base de datos:\n{e}")
@@ -140,9 +346,151 @@ class ManagerDB:
             self._emit_messages(messages)
     # init_db (fin)
 
+    @classmethod
+    def _split_sql_statements(cls, sql_script: str) -> List[str]:
+        """
+        Divide un script SQL en instrucciones por el carácter ';'.
+
+        Los ';' dentro de cadenas ('...'), identificadores entre comillas, comentarios y cuerpos
+        con dollar-quoting ($$ ... $$, p. ej. funciones plpgsql) no se consideran separadores.
+
+        Parámetros:
+        - sql_script (str): Contenido del archivo SQL.
+
+        Retorno:
+        - list[str]: Instrucciones del script (pueden incluir espacios o comentarios sueltos).
+        """
+        statements = []
+        start = 0
+        i = 0
+        length = len(sql_script)
+        while i < length:
+            char = sql_script[i]
+            if char in ("'", '"'):
+                # Cadena o identificador; las comillas duplicadas son comillas escapadas
+                i += 1
+                while i < length:
+                    if sql_script[i] == char:
+                        if i + 1 < length and sql_script[i + 1] == char:
+                            i += 2
+                            continue
+                        break
+                    i += 1
+            elif sql_script.startswith("--", i):
+                end = sql_script.find("\n", i)
+                i = length if end == -1 else end
+            elif sql_script.startswith("/*", i):
+                end = sql_script.find("*/", i + 2)
+                i = length if end == -1 else end + 1
+            elif char == "$":
+                tag = cls._DOLLAR_TAG.match(sql_script, i)
+                if tag:
+                    end = sql_script.find(tag.group(), tag.end())
+                    i = length if end == -1 else end + len(tag.group()) - 1
+            elif char == ";":
+                statements.append(sql_script[start:i])
+                start = i + 1
+            i += 1
+        statements.append(sql_script[start:])
+        return statements
+    # _split_sql_statements (fin)
+
+    def add_notification_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Registra una función que recibirá las notificaciones de cambios de la base de datos.
+
+        La primera vez arranca el hilo de escucha sobre una conexión dedicada (fuera del pool).
+        La función se llama desde ese hilo con el JSON decodificado de cada notificación
+        ({"tabla", "operacion", "codigo"}); si la conexión se pierde y se recupera, recibe
+        {"operacion": "RESYNC"} para indicar que pudieron perderse cambios.
+
+        Parámetros:
+        - callback (callable): Función que recibe el diccionario de la notificación.
+        """
+        with self._listeners_lock:
+            self._listeners.append(callback)
+            if self._listener_thread is None or not self._listener_thread.is_alive():
+                self._listener_stop.clear()
+                self._listener_thread = threading.Thread(
+                    target=self._listen_loop, name="ManagerDB-listener", daemon=True)
+                self._listener_thread.start()
+    # add_notification_listener (fin)
+
+    def remove_notification_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Elimina una función registrada con add_notification_listener.
+
+        Si no quedan oyentes, se detiene el hilo de escucha.
+
+        Parámetros:
+        - callback (callable): Función registrada anteriormente.
+        """
+        with self._listeners_lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+            if self._listeners:
+                return
+        self._stop_listener()
+    # remove_notification_listener (fin)
+
+    def _listen_loop(self) -> None:
+        """
+        Bucle del hilo de escucha: mantiene la conexión dedicada con LISTEN y reparte las notificaciones.
+        """
+        reconnecting = False
+        while not self._listener_stop.is_set():
+            try:
+                with psycopg.connect(**self._connection_kwargs(), autocommit=True) as conn:
+                    conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(utils_db.NOTIFY_CHANNEL_DB)))
+                    if reconnecting:
+                        self._dispatch_notification({"operacion": "RESYNC"})
+                    reconnecting = False
+                    while not self._listener_stop.is_set():
+                        # Espera como máximo NOTIFY_POLL_TIMEOUT_DB para poder atender la parada
+                        for notify in conn.notifies(timeout=utils_db.NOTIFY_POLL_TIMEOUT_DB):
+                            try:
+                                payload = json.loads(notify.payload)
+                            except ValueError:
+                                continue  # Notificación ajena al formato de la aplicación
+                            self._dispatch_notification(payload)
+            except Exception as e:
+                if self._listener_stop.is_set():
+                    break
+                _printv2(show_popup=False, message=f"Escucha de notificaciones interrumpida: {e}")
+                reconnecting = True
+                self._listener_stop.wait(utils_db.NOTIFY_RECONNECT_DELAY_DB)
+    # _listen_loop (fin)
+
+    def _dispatch_notification(self, payload: Dict[str, Any]) -> None:
+        """
+        Entrega una notificación a todos los oyentes registrados (desde el hilo de escucha).
+
+        Parámetros:
+        - payload (dict): Notificación decodificada.
+        """
+        with self._listeners_lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(payload)
+            except Exception as e:
+                _printv2(show_popup=False, message=f"Error al procesar una notificación: {e}")
+    # _dispatch_notification (fin)
+
+    def _stop_listener(self) -> None:
+        """
+        Detiene el hilo de escucha de notificaciones, si está en marcha.
+        """
+        self._listener_stop.set()
+        thread = self._listener_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=utils_db.NOTIFY_POLL_TIMEOUT_DB * 2)
+        self._listener_thread = None
+    # _stop_listener (fin)
+
     def close_connection(self) -> bool:
         """
-        Cierra la conexión a la base de datos si está activa.
+        Cierra la conexión a la base de datos (o el pool) si está activa.
 
         Asegura que los recursos se liberen adecuadamente. Si no hay conexión activa,
         se notifica mediante consola y popup (si está habilitado).
@@ -151,7 +499,14 @@ class ManagerDB:
         - bool: True si la conexión se cerró exitosamente, False si no había conexión activa.
         """
         messages = []  # Lista para acumular mensajes de estado
-        if self._connection and not self._connection.closed:
+        self._stop_listener()
+        if self._use_pool and self._pool is not None and not self._pool.closed:
+            self._pool.close()
+            self._pool = None
+            messages.append("Pool de conexiones a la base de datos cerrado exitosamente.")
+            self._emit_messages(messages)
+            return True
+        elif self._connection and not self._connection.closed:
             self._connection.close()
             messages.append("Conexión a la base de datos cerrada exitosamente.")
             self._emit_messages(messages)
@@ -1,6 +1,11 @@
--- #############################################
--- # Archivo: src\models\inicializacion_db.sql #
--- #############################################
+-- ##############################################################
+-- # Archivo: src\models\migraciones\0001_esquema_inicial.sql #
+-- ##############################################################
+
+-- Migración 0001: tablas, índices y datos de ejemplo de la aplicación.
+-- Todas las instrucciones son repetibles (IF NOT EXISTS / ON CONFLICT), de modo que
+-- la migración también puede registrarse sobre una base de datos creada con el antiguo
+-- script de inicialización sin duplicar datos.
 
 -- Crear la tabla 'roles' para definir los permisos de los usuarios
 CREATE TABLE IF NOT EXISTS roles (
@@ -70,6 +75,19 @@ CREATE TABLE IF NOT EXISTS videojuegos (
     fecha_lanzamiento DATE DEFAULT CURRENT_DATE
 );
 
+-- Habilitar la extensión 'pg_trgm' para búsquedas por subcadena (ILIKE '%texto%') con índices
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Índices GIN de trigramas sobre las columnas en las que busca el filtro de texto
+-- Permiten resolver 'columna ILIKE %texto%' sin recorrer toda la tabla
+CREATE INDEX IF NOT EXISTS idx_videojuegos_codigo_trgm ON videojuegos USING GIN (codigo gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_videojuegos_titulo_trgm ON videojuegos USING GIN (titulo gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_videojuegos_descripcion_trgm ON videojuegos USING GIN (descripcion gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_videojuegos_plataforma_trgm ON videojuegos USING GIN (plataforma gin_trgm_ops);
+
+-- Índice sobre la clave foránea 'id_genero' para el filtro por género
+CREATE INDEX IF NOT EXISTS idx_videojuegos_id_genero ON videojuegos (id_genero);
+
 -- Insertar datos de ejemplo en la tabla 'videojuegos'
 -- Añadimos videojuegos de ejemplo para los géneros de 'Acción', 'Aventura', 'RPG' y 'Deportes'
 INSERT INTO videojuegos (codigo, titulo, descripcion, precio, plataforma, stock, ventas, id_genero)
@@ -107,54 +125,17 @@ CREATE TABLE IF NOT EXISTS ventas (
 
 -- Insertar datos de ejemplo en la tabla 'ventas'
 -- Añadimos ventas de ejemplo para relacionar videojuegos y usuarios
-INSERT INTO ventas (codigo_videojuego, email_usuario, cantidad_vendida, fecha_venta)
+-- Se indican los identificadores para que volver a ejecutar la instrucción no duplique las ventas
+INSERT INTO ventas (id_venta, codigo_videojuego, email_usuario, cantidad_vendida, fecha_venta)
 VALUES 
-    ('001', 'jugador1@example.com', 2, '2024-11-13'),
-    ('004', 'jugador1@example.com', 1, '2024-11-14'),
-    ('007', 'dev1@example.com', 1, '2024-11-15'),
-    ('010', 'jugador1@example.com', 3, '2024-11-15'),
-    ('012', 'jugador1@example.com', 1, '2024-11-16');
-
--- ########################################################################
--- # Consultas de verificación de datos en las tablas                     #
--- ########################################################################
-
--- Consultar todos los datos de la tabla 'roles'
-SELECT * FROM roles;
-
--- Consultar todos los datos de la tabla 'usuarios'
-SELECT * FROM usuarios;
-
--- Consultar todos los datos de la tabla 'generos'
-SELECT * FROM generos;
-
--- Consultar todos los datos de la tabla 'videojuegos'
-SELECT * FROM videojuegos;
-
--- Consultar todos los datos de la tabla 'ventas'
-SELECT * FROM ventas;
-
--- Consultar todos los usuarios y sus roles
--- Esta consulta une las tablas 'usuarios' y 'roles' para mostrar el rol de cada usuario
-SELECT u.email, u.nombre_usuario, r.nombre_rol
-FROM usuarios u
-JOIN roles r ON u.id_rol = r.id_rol;
-
--- Consultar todos los videojuegos con su género
--- Esta consulta une las tablas 'videojuegos' y 'generos' para mostrar el género de cada videojuego
-SELECT v.codigo, v.titulo, v.descripcion, v.precio, v.plataforma, v.stock, v.ventas, g.nombre_genero
-FROM videojuegos v
-JOIN generos g ON v.id_genero = g.id_genero;
-
--- Consultar todas las ventas con detalles de usuario y videojuego
--- Esta consulta une las tablas 'ventas', 'usuarios', y 'videojuegos' para mostrar quién compró qué videojuego
-SELECT v.id_venta, u.email AS usuario, vg.titulo, v.cantidad_vendida, v.fecha_venta
-FROM ventas v
-JOIN usuarios u ON v.email_usuario = u.email
-JOIN videojuegos vg ON v.codigo_videojuego = vg.codigo;
-
--- Consultar el stock total de videojuegos
--- Esta consulta muestra el título del videojuego, el stock disponible y el total vendido.
-SELECT titulo, stock, ventas FROM videojuegos;
-
--- Fin del archivo 'inicializacion_db.sql'
+    (1, '001', 'jugador1@example.com', 2, '2024-11-13'),
+    (2, '004', 'jugador1@example.com', 1, '2024-11-14'),
+    (3, '007', 'dev1@example.com', 1, '2024-11-15'),
+    (4, '010', 'jugador1@example.com', 3, '2024-11-15'),
+    (5, '012', 'jugador1@example.com', 1, '2024-11-16')
+ON CONFLICT (id_venta) DO NOTHING;
+
+-- Ajustar la secuencia de 'id_venta' tras insertar identificadores explícitos
+SELECT setval(pg_get_serial_sequence('ventas', 'id_venta'), GREATEST((SELECT MAX(id_venta) FROM ventas), 1));
+
+-- Fin del archivo '0001_esquema_inicial.sql'
@@ -0,0 +1,56 @@
+-- ###################################################################
+-- # Archivo: src\models\migraciones\0002_notificaciones_cambios.sql #
+-- ###################################################################
+
+-- Migración 0002: notificaciones de cambios (LISTEN/NOTIFY) de 'videojuegos' y 'ventas'.
+
+-- Función de disparador que publica en el canal 'cambios_datos' cada fila modificada
+-- El mensaje es un JSON con la tabla, la operación y el código del videojuego afectado,
+-- de modo que los informes abiertos solo vuelven a pedir esa fila
+CREATE OR REPLACE FUNCTION notificar_cambio() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    fila RECORD;
+    codigo_afectado VARCHAR(10);
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        fila := OLD;
+    ELSE
+        fila := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME = 'ventas' THEN
+        codigo_afectado := fila.codigo_videojuego;
+    ELSE
+        codigo_afectado := fila.codigo;
+    END IF;
+
+    PERFORM pg_notify('cambios_datos', json_build_object(
+        'tabla', TG_TABLE_NAME,
+        'operacion', TG_OP,
+        'codigo', codigo_afectado
+    )::text);
+
+    -- Si un UPDATE cambia el código, el código anterior también se ve afectado
+    IF TG_OP = 'UPDATE' AND TG_TABLE_NAME = 'videojuegos' AND OLD.codigo IS DISTINCT FROM NEW.codigo THEN
+        PERFORM pg_notify('cambios_datos', json_build_object(
+            'tabla', TG_TABLE_NAME, 'operacion', 'DELETE', 'codigo', OLD.codigo
+        )::text);
+    END IF;
+
+    RETURN NULL;  -- Disparador AFTER: el valor de retorno se ignora
+END;
+$$;
+
+-- Disparadores por fila en 'videojuegos' y 'ventas' (se recrean para que el script sea repetible)
+DROP TRIGGER IF EXISTS trg_videojuegos_notificar ON videojuegos;
+CREATE TRIGGER trg_videojuegos_notificar
+AFTER INSERT OR UPDATE OR DELETE ON videojuegos
+FOR EACH ROW EXECUTE FUNCTION notificar_cambio();
+
+DROP TRIGGER IF EXISTS trg_ventas_notificar ON ventas;
+CREATE TRIGGER trg_ventas_notificar
+AFTER INSERT OR UPDATE OR DELETE ON ventas
+FOR EACH ROW EXECUTE FUNCTION notificar_cambio();
+
+-- Fin del archivo '0002_notificaciones_cambios.sql'
@@ -0,0 +1,69 @@
+-- ##########################################################
+-- # Archivo: src\models\migraciones\0003_sellos_cambio.sql #
+-- ##########################################################
+
+-- Migración 0003: sellos de cambio y lápidas para la sincronización incremental.
+
+-- Secuencia global de sellos: cada fila insertada o modificada recibe un valor mayor que
+-- todos los anteriores, de modo que un cliente puede pedir "lo cambiado desde el sello X"
+CREATE SEQUENCE IF NOT EXISTS cambios_seq;
+
+ALTER TABLE videojuegos ADD COLUMN IF NOT EXISTS version_cambio BIGINT NOT NULL DEFAULT nextval('cambios_seq');
+ALTER TABLE ventas ADD COLUMN IF NOT EXISTS version_cambio BIGINT NOT NULL DEFAULT nextval('cambios_seq');
+
+CREATE INDEX IF NOT EXISTS idx_videojuegos_version_cambio ON videojuegos (version_cambio);
+CREATE INDEX IF NOT EXISTS idx_ventas_version_cambio ON ventas (version_cambio);
+
+-- Registro de filas borradas (lápidas), con el sello del borrado
+CREATE TABLE IF NOT EXISTS cambios_borrados (
+    tabla VARCHAR(63) NOT NULL,
+    clave VARCHAR(255) NOT NULL,
+    version_cambio BIGINT NOT NULL DEFAULT nextval('cambios_seq'),
+    fecha_borrado TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (tabla, clave)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cambios_borrados_version ON cambios_borrados (tabla, version_cambio);
+
+-- Asigna un sello nuevo a cada fila insertada o modificada
+CREATE OR REPLACE FUNCTION asignar_version_cambio() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.version_cambio := nextval('cambios_seq');
+    RETURN NEW;
+END;
+$$;
+
+-- Guarda la lápida de una fila borrada; el nombre de la clave primaria llega como argumento
+CREATE OR REPLACE FUNCTION registrar_borrado() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO cambios_borrados (tabla, clave)
+    VALUES (TG_TABLE_NAME, to_jsonb(OLD) ->> TG_ARGV[0])
+    ON CONFLICT (tabla, clave) DO UPDATE
+        SET version_cambio = nextval('cambios_seq'), fecha_borrado = now();
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_videojuegos_version ON videojuegos;
+CREATE TRIGGER trg_videojuegos_version
+BEFORE INSERT OR UPDATE ON videojuegos
+FOR EACH ROW EXECUTE FUNCTION asignar_version_cambio();
+
+DROP TRIGGER IF EXISTS trg_ventas_version ON ventas;
+CREATE TRIGGER trg_ventas_version
+BEFORE INSERT OR UPDATE ON ventas
+FOR EACH ROW EXECUTE FUNCTION asignar_version_cambio();
+
+DROP TRIGGER IF EXISTS trg_videojuegos_borrado ON videojuegos;
+CREATE TRIGGER trg_videojuegos_borrado
+AFTER DELETE ON videojuegos
+FOR EACH ROW EXECUTE FUNCTION registrar_borrado('codigo');
+
+DROP TRIGGER IF EXISTS trg_ventas_borrado ON ventas;
+CREATE TRIGGER trg_ventas_borrado
+AFTER DELETE ON ventas
+FOR EACH ROW EXECUTE FUNCTION registrar_borrado('id_venta');
+
+-- Fin del archivo '0003_sellos_cambio.sql'
@@ -0,0 +1,79 @@
+-- ##############################################################
+-- # Archivo: src\models\migraciones\0004_resumenes_ventas.sql  #
+-- ##############################################################
+
+-- Migración 0004: resúmenes materializados de la tabla 'ventas'.
+-- Los gráficos de ventas leen estas vistas (unos cientos de filas precalculadas) en lugar de
+-- agregar todo el historial en cada consulta. Se actualizan con
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY (ReportModel._refresh_sales_rollups), que no bloquea
+-- las lecturas; para ello cada vista necesita un índice único sobre columnas simples.
+
+-- Ventas por videojuego
+CREATE MATERIALIZED VIEW IF NOT EXISTS resumen_ventas_videojuego AS
+SELECT v.codigo_videojuego,
+       SUM(v.cantidad_vendida)::BIGINT AS unidades,
+       COUNT(*)::BIGINT AS num_ventas,
+       MAX(v.fecha_venta) AS ultima_venta
+FROM ventas v
+WHERE v.codigo_videojuego IS NOT NULL
+GROUP BY v.codigo_videojuego
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumen_ventas_videojuego
+ON resumen_ventas_videojuego (codigo_videojuego);
+
+-- Ventas por género (id_genero 0 agrupa los videojuegos sin género)
+CREATE MATERIALIZED VIEW IF NOT EXISTS resumen_ventas_genero AS
+SELECT COALESCE(j.id_genero, 0) AS id_genero,
+       COALESCE(g.nombre_genero, 'Desconocida') AS nombre_genero,
+       SUM(v.cantidad_vendida)::BIGINT AS unidades,
+       COUNT(*)::BIGINT AS num_ventas
+FROM ventas v
+JOIN videojuegos j ON j.codigo = v.codigo_videojuego
+LEFT JOIN generos g ON g.id_genero = j.id_genero
+GROUP BY COALESCE(j.id_genero, 0), COALESCE(g.nombre_genero, 'Desconocida')
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumen_ventas_genero
+ON resumen_ventas_genero (id_genero);
+
+-- Ventas por plataforma
+CREATE MATERIALIZED VIEW IF NOT EXISTS resumen_ventas_plataforma AS
+SELECT j.plataforma,
+       SUM(v.cantidad_vendida)::BIGINT AS unidades,
+       COUNT(*)::BIGINT AS num_ventas
+FROM ventas v
+JOIN videojuegos j ON j.codigo = v.codigo_videojuego
+GROUP BY j.plataforma
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumen_ventas_plataforma
+ON resumen_ventas_plataforma (plataforma);
+
+-- Ventas por día
+CREATE MATERIALIZED VIEW IF NOT EXISTS resumen_ventas_dia AS
+SELECT v.fecha_venta AS periodo,
+       SUM(v.cantidad_vendida)::BIGINT AS unidades,
+       COUNT(*)::BIGINT AS num_ventas
+FROM ventas v
+WHERE v.fecha_venta IS NOT NULL
+GROUP BY v.fecha_venta
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumen_ventas_dia
+ON resumen_ventas_dia (periodo);
+
+-- Ventas por mes (primer día del mes)
+CREATE MATERIALIZED VIEW IF NOT EXISTS resumen_ventas_mes AS
+SELECT date_trunc('month', v.fecha_venta)::DATE AS periodo,
+       SUM(v.cantidad_vendida)::BIGINT AS unidades,
+       COUNT(*)::BIGINT AS num_ventas
+FROM ventas v
+WHERE v.fecha_venta IS NOT NULL
+GROUP BY date_trunc('month', v.fecha_venta)::DATE
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumen_ventas_mes
+ON resumen_ventas_mes (periodo);
+
+-- Fin del archivo '0004_resumenes_ventas.sql'
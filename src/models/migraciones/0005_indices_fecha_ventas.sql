@@ -0,0 +1,17 @@
+-- ##################################################################
+-- # Archivo: src\models\migraciones\0005_indices_fecha_ventas.sql  #
+-- ##################################################################
+
+-- Migración 0005: índices para los informes de ventas por rango de fechas.
+
+-- Índice BRIN sobre la fecha de venta: las ventas se insertan en orden cronológico, así que
+-- cada bloque de la tabla abarca un rango de fechas estrecho. El índice ocupa unos pocos
+-- kilobytes incluso con cientos de millones de filas y permite saltarse los bloques que
+-- quedan fuera del rango pedido.
+CREATE INDEX IF NOT EXISTS idx_ventas_fecha_venta_brin ON ventas USING BRIN (fecha_venta);
+
+-- Índice B-tree compuesto para la serie de ventas de unos videojuegos concretos (filtro de
+-- texto o de género): localiza cada videojuego y recorre solo su tramo de fechas.
+CREATE INDEX IF NOT EXISTS idx_ventas_codigo_fecha ON ventas (codigo_videojuego, fecha_venta);
+
+-- Fin del archivo '0005_indices_fecha_ventas.sql'
@@ -0,0 +1,257 @@
+-- ###############################################################
+-- # Archivo: src\models\migraciones\0006_particiones_ventas.sql #
+-- ###############################################################
+
+-- Migración 0006: 'ventas' particionada por meses de 'fecha_venta' (particionado declarativo).
+-- Cada mes vive en su propia partición (ventas_AAAA_MM): las consultas que filtran
+-- 'fecha_venta' con comparaciones directas (>=, <) solo leen las particiones del rango
+-- (poda de particiones), las inserciones mantienen índices pequeños y los meses antiguos se
+-- pueden separar para archivarlos sin borrar filas.
+--
+-- PostgreSQL no convierte una tabla en particionada, así que se crea una tabla nueva, se
+-- copian las filas y se eliminan la tabla antigua y los objetos que dependían de ella
+-- (resúmenes materializados de la migración 0004), que se vuelven a crear al final.
+-- Requiere PostgreSQL 13 o superior (disparadores BEFORE por fila en tablas particionadas).
+
+-- Crea la partición del mes que contiene 'mes' si no existe. Devuelve TRUE si la ha creado.
+-- El bloqueo consultivo 40403 lo comparten las funciones de mantenimiento de particiones, para
+-- que dos clientes no creen ni separen particiones a la vez.
+CREATE OR REPLACE FUNCTION crear_particion_ventas(mes DATE) RETURNS BOOLEAN
+LANGUAGE plpgsql AS $$
+DECLARE
+    desde DATE := date_trunc('month', mes)::DATE;
+    hasta DATE := (date_trunc('month', mes) + INTERVAL '1 month')::DATE;
+    nombre TEXT := 'ventas_' || to_char(mes, 'YYYY_MM');
+BEGIN
+    PERFORM pg_advisory_xact_lock(40403);
+    IF to_regclass(nombre) IS NOT NULL THEN
+        RETURN FALSE;
+    END IF;
+    EXECUTE format('CREATE TABLE %I PARTITION OF ventas FOR VALUES FROM (%L) TO (%L)', nombre, desde, hasta);
+    RETURN TRUE;
+END;
+$$;
+
+-- Crea por adelantado las particiones del mes actual y de los 'meses_adelante' siguientes.
+-- Devuelve el número de particiones creadas (0 si ya existían todas).
+CREATE OR REPLACE FUNCTION crear_particiones_ventas(meses_adelante INT DEFAULT 3) RETURNS INT
+LANGUAGE plpgsql AS $$
+DECLARE
+    creadas INT := 0;
+BEGIN
+    FOR i IN 0..meses_adelante LOOP
+        IF crear_particion_ventas((date_trunc('month', CURRENT_DATE) + make_interval(months => i))::DATE) THEN
+            creadas := creadas + 1;
+        END IF;
+    END LOOP;
+    RETURN creadas;
+END;
+$$;
+
+-- Separa las particiones cuyos meses terminan antes de 'antes_de' y las renombra a
+-- archivo_ventas_AAAA_MM: dejan de formar parte de 'ventas' (y de los informes) pero conservan
+-- sus filas para exportarlas o eliminarlas. Devuelve los nombres de las tablas separadas.
+CREATE OR REPLACE FUNCTION separar_particiones_ventas(antes_de DATE) RETURNS SETOF TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    particion RECORD;
+BEGIN
+    PERFORM pg_advisory_xact_lock(40403);
+    FOR particion IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'ventas'::regclass
+          AND c.relname ~ '^ventas_[0-9]{4}_[0-9]{2}$'
+          AND to_date(substr(c.relname, 8), 'YYYY_MM') + INTERVAL '1 month' <= antes_de
+        ORDER BY c.relname
+    LOOP
+        EXECUTE format('ALTER TABLE ventas DETACH PARTITION %I', particion.relname);
+        EXECUTE format('ALTER TABLE %I RENAME TO %I', particion.relname, 'archivo_' || particion.relname);
+        RETURN NEXT 'archivo_' || particion.relname;
+    END LOOP;
+END;
+$$;
+
+-- En una tabla particionada los disparadores se ejecutan en cada partición, de modo que
+-- TG_TABLE_NAME es el nombre de la partición (ventas_AAAA_MM). El nombre lógico de la tabla
+-- llega ahora como argumento opcional del disparador.
+CREATE OR REPLACE FUNCTION notificar_cambio() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    fila RECORD;
+    tabla TEXT := COALESCE(TG_ARGV[0], TG_TABLE_NAME);
+    codigo_afectado VARCHAR(10);
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        fila := OLD;
+    ELSE
+        fila := NEW;
+    END IF;
+
+    IF tabla = 'ventas' THEN
+        codigo_afectado := fila.codigo_videojuego;
+    ELSE
+        codigo_afectado := fila.codigo;
+    END IF;
+
+    PERFORM pg_notify('cambios_datos', json_build_object(
+        'tabla', tabla,
+        'operacion', TG_OP,
+        'codigo', codigo_afectado
+    )::text);
+
+    -- Si un UPDATE cambia el código, el código anterior también se ve afectado
+    IF TG_OP = 'UPDATE' AND tabla = 'videojuegos' AND OLD.codigo IS DISTINCT FROM NEW.codigo THEN
+        PERFORM pg_notify('cambios_datos', json_build_object(
+            'tabla', tabla, 'operacion', 'DELETE', 'codigo', OLD.codigo
+        )::text);
+    END IF;
+
+    RETURN NULL;  -- Disparador AFTER: el valor de retorno se ignora
+END;
+$$;
+
+-- Un UPDATE que cambia 'fecha_venta' de mes mueve la fila de partición (se ejecuta como DELETE
+-- e INSERT); si la clave sigue existiendo no se deja lápida. El segundo argumento, opcional, es
+-- el nombre lógico de la tabla.
+CREATE OR REPLACE FUNCTION registrar_borrado() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    nombre_tabla TEXT := COALESCE(TG_ARGV[1], TG_TABLE_NAME);
+    valor_clave TEXT := to_jsonb(OLD) ->> TG_ARGV[0];
+    sigue_existiendo BOOLEAN;
+BEGIN
+    EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I WHERE %I = ($1).%I)', nombre_tabla, TG_ARGV[0], TG_ARGV[0])
+        INTO sigue_existiendo USING OLD;
+    IF sigue_existiendo THEN
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO cambios_borrados (tabla, clave)
+    VALUES (nombre_tabla, valor_clave)
+    ON CONFLICT (tabla, clave) DO UPDATE
+        SET version_cambio = nextval('cambios_seq'), fecha_borrado = now();
+    RETURN NULL;
+END;
+$$;
+
+-- Los resúmenes materializados dependen de la tabla antigua
+DROP MATERIALIZED VIEW IF EXISTS resumen_ventas_videojuego, resumen_ventas_genero,
+    resumen_ventas_plataforma, resumen_ventas_dia, resumen_ventas_mes;
+
+-- Se aparta la tabla antigua; la secuencia de 'id_venta' pasa a la tabla nueva
+ALTER TABLE ventas RENAME TO ventas_sin_particionar;
+ALTER SEQUENCE ventas_id_venta_seq OWNED BY NONE;
+
+-- La clave primaria de una tabla particionada debe incluir la columna de partición
+CREATE TABLE ventas (
+    id_venta INT NOT NULL DEFAULT nextval('ventas_id_venta_seq'),
+    codigo_videojuego VARCHAR(10) REFERENCES videojuegos(codigo),
+    email_usuario VARCHAR(255) REFERENCES usuarios(email),
+    cantidad_vendida INT NOT NULL,
+    fecha_venta DATE NOT NULL DEFAULT CURRENT_DATE,
+    version_cambio BIGINT NOT NULL DEFAULT nextval('cambios_seq')
+) PARTITION BY RANGE (fecha_venta);
+
+-- Particiones de todos los meses con ventas y de los próximos meses
+SELECT crear_particion_ventas(mes::DATE)
+FROM generate_series(
+    (SELECT date_trunc('month', MIN(COALESCE(fecha_venta, CURRENT_DATE))) FROM ventas_sin_particionar),
+    (SELECT date_trunc('month', MAX(COALESCE(fecha_venta, CURRENT_DATE))) FROM ventas_sin_particionar),
+    INTERVAL '1 month'
+) AS mes;
+SELECT crear_particiones_ventas(3);
+
+-- Copia de las filas antes de crear índices y disparadores (se conservan los sellos de cambio
+-- y no se envían notificaciones)
+INSERT INTO ventas (id_venta, codigo_videojuego, email_usuario, cantidad_vendida, fecha_venta, version_cambio)
+SELECT id_venta, codigo_videojuego, email_usuario, cantidad_vendida,
+       COALESCE(fecha_venta, CURRENT_DATE), version_cambio
+FROM ventas_sin_particionar;
+
+DROP TABLE ventas_sin_particionar;
+ALTER SEQUENCE ventas_id_venta_seq OWNED BY ventas.id_venta;
+
+-- Índices (se crean en cada partición, también en las que se añadan después)
+ALTER TABLE ventas ADD CONSTRAINT ventas_pkey PRIMARY KEY (id_venta, fecha_venta);
+CREATE INDEX IF NOT EXISTS idx_ventas_version_cambio ON ventas (version_cambio);
+CREATE INDEX IF NOT EXISTS idx_ventas_fecha_venta_brin ON ventas USING BRIN (fecha_venta);
+CREATE INDEX IF NOT EXISTS idx_ventas_codigo_fecha ON ventas (codigo_videojuego, fecha_venta);
+
+-- Disparadores de las migraciones 0002 y 0003, ahora con el nombre lógico de la tabla
+CREATE TRIGGER trg_ventas_notificar
+AFTER INSERT OR UPDATE OR DELETE ON ventas
+FOR EACH ROW EXECUTE FUNCTION notificar_cambio('ventas');
+
+CREATE TRIGGER trg_ventas_version
+BEFORE INSERT OR UPDATE ON ventas
+FOR EACH ROW EXECUTE FUNCTION asignar_version_cambio();
+
+CREATE TRIGGER trg_ventas_borrado
+AFTER DELETE ON ventas
+FOR EACH ROW EXECUTE FUNCTION registrar_borrado('id_venta', 'ventas');
+
+-- Resúmenes materializados de la migración 0004 ('fecha_venta' ya no admite nulos)
+CREATE MATERIALIZED VIEW IF NOT EXISTS resumen_ventas_videojuego AS
+SELECT v.codigo_videojuego,
+       SUM(v.cantidad_vendida)::BIGINT AS unidades,
+       COUNT(*)::BIGINT AS num_ventas,
+       MAX(v.fecha_venta) AS ultima_venta
+FROM ventas v
+WHERE v.codigo_videojuego IS NOT NULL
+GROUP BY v.codigo_videojuego
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumen_ventas_videojuego
+ON resumen_ventas_videojuego (codigo_videojuego);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS resumen_ventas_genero AS
+SELECT COALESCE(j.id_genero, 0) AS id_genero,
+       COALESCE(g.nombre_genero, 'Desconocida') AS nombre_genero,
+       SUM(v.cantidad_vendida)::BIGINT AS unidades,
+       COUNT(*)::BIGINT AS num_ventas
+FROM ventas v
+JOIN videojuegos j ON j.codigo = v.codigo_videojuego
+LEFT JOIN generos g ON g.id_genero = j.id_genero
+GROUP BY COALESCE(j.id_genero, 0), COALESCE(g.nombre_genero, 'Desconocida')
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumen_ventas_genero
+ON resumen_ventas_genero (id_genero);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS resumen_ventas_plataforma AS
+SELECT j.plataforma,
+       SUM(v.cantidad_vendida)::BIGINT AS unidades,
+       COUNT(*)::BIGINT AS num_ventas
+FROM ventas v
+JOIN videojuegos j ON j.codigo = v.codigo_videojuego
+GROUP BY j.plataforma
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumen_ventas_plataforma
+ON resumen_ventas_plataforma (plataforma);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS resumen_ventas_dia AS
+SELECT v.fecha_venta AS periodo,
+       SUM(v.cantidad_vendida)::BIGINT AS unidades,
+       COUNT(*)::BIGINT AS num_ventas
+FROM ventas v
+GROUP BY v.fecha_venta
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumen_ventas_dia
+ON resumen_ventas_dia (periodo);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS resumen_ventas_mes AS
+SELECT date_trunc('month', v.fecha_venta)::DATE AS periodo,
+       SUM(v.cantidad_vendida)::BIGINT AS unidades,
+       COUNT(*)::BIGINT AS num_ventas
+FROM ventas v
+GROUP BY date_trunc('month', v.fecha_venta)::DATE
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_resumen_ventas_mes
+ON resumen_ventas_mes (periodo);
+
+-- Fin del archivo '0006_particiones_ventas.sql'
@@ -0,0 +1,29 @@
+-- ####################################################################
+-- # Archivo: src\models\migraciones\0007_busqueda_texto_completo.sql #
+-- ####################################################################
+
+-- Migración 0007: búsqueda de texto completo en 'videojuegos' (título y descripción).
+-- La columna generada 'busqueda' guarda el tsvector de cada fila, calculado con la
+-- configuración 'spanish' (raíces: "aventura" encuentra "Aventuras") sobre el texto sin tildes.
+-- PostgreSQL la mantiene al insertar o modificar la fila y el índice GIN resuelve
+-- 'busqueda @@ consulta' sin recorrer la tabla. El título pesa más que la descripción (ts_rank).
+
+-- Extensión para eliminar tildes y diacríticos
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- unaccent() es STABLE (depende del diccionario de la ruta de búsqueda) y no puede usarse en una
+-- columna generada ni en un índice; este envoltorio fija el diccionario y puede declararse IMMUTABLE
+CREATE OR REPLACE FUNCTION f_unaccent(texto TEXT) RETURNS TEXT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT AS $$
+    SELECT public.unaccent('public.unaccent'::regdictionary, texto);
+$$;
+
+ALTER TABLE videojuegos ADD COLUMN IF NOT EXISTS busqueda TSVECTOR
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('spanish'::regconfig, f_unaccent(COALESCE(titulo, ''))), 'A') ||
+    setweight(to_tsvector('spanish'::regconfig, f_unaccent(COALESCE(descripcion, ''))), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_videojuegos_busqueda ON videojuegos USING GIN (busqueda);
+
+-- Fin del archivo '0007_busqueda_texto_completo.sql'
@@ -0,0 +1,72 @@
+-- #####################################################################
+-- # Archivo: src\models\migraciones\0008_particion_ventas_defecto.sql #
+-- #####################################################################
+
+-- Migración 0008: partición DEFAULT de 'ventas'.
+-- Sin ella, una venta con 'fecha_venta' fuera de las particiones mensuales creadas (un mes
+-- lejano o uno ya separado) hace fallar el INSERT. Esas filas quedan ahora en ventas_default,
+-- y crear_particion_ventas las traslada a la partición de su mes al crearla: el
+-- mantenimiento periódico (crear_particiones_ventas) crea también las particiones de los meses
+-- que tengan filas en ventas_default, salvo los ya archivados (archivo_ventas_AAAA_MM), cuyas
+-- filas tardías se quedan en ventas_default.
+
+CREATE TABLE IF NOT EXISTS ventas_default PARTITION OF ventas DEFAULT;
+
+-- Con partición DEFAULT, crear una partición cuyo rango tenga filas en ella falla; por eso la
+-- tabla del mes se crea suelta, recibe las filas de ventas_default y después se adjunta a
+-- 'ventas' (ATTACH crea sus índices y restricciones). Al borrarlas de ventas_default, los
+-- disparadores de la partición dejan una lápida en 'cambios_borrados' para cada fila, que se
+-- elimina al final porque la fila sigue existiendo (con el mismo sello de cambio).
+CREATE OR REPLACE FUNCTION crear_particion_ventas(mes DATE) RETURNS BOOLEAN
+LANGUAGE plpgsql AS $$
+DECLARE
+    desde DATE := date_trunc('month', mes)::DATE;
+    hasta DATE := (date_trunc('month', mes) + INTERVAL '1 month')::DATE;
+    nombre TEXT := 'ventas_' || to_char(mes, 'YYYY_MM');
+BEGIN
+    PERFORM pg_advisory_xact_lock(40403);
+    IF to_regclass(nombre) IS NOT NULL THEN
+        RETURN FALSE;
+    END IF;
+    EXECUTE format('CREATE TABLE %I (LIKE ventas INCLUDING DEFAULTS)', nombre);
+    EXECUTE format(
+        'WITH movidas AS (DELETE FROM ventas_default WHERE fecha_venta >= %L AND fecha_venta < %L RETURNING *) '
+        'INSERT INTO %I SELECT * FROM movidas', desde, hasta, nombre);
+    EXECUTE format('ALTER TABLE ventas ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)', nombre, desde, hasta);
+    EXECUTE format(
+        'DELETE FROM cambios_borrados WHERE tabla = ''ventas'' AND clave IN (SELECT id_venta::TEXT FROM %I)',
+        nombre);
+    RETURN TRUE;
+END;
+$$;
+
+-- Crea por adelantado las particiones del mes actual y de los 'meses_adelante' siguientes, y
+-- las de los meses no archivados con filas en ventas_default. Devuelve el número de
+-- particiones creadas (0 si ya existían todas).
+CREATE OR REPLACE FUNCTION crear_particiones_ventas(meses_adelante INT DEFAULT 3) RETURNS INT
+LANGUAGE plpgsql AS $$
+DECLARE
+    creadas INT := 0;
+    mes DATE;
+BEGIN
+    FOR i IN 0..meses_adelante LOOP
+        IF crear_particion_ventas((date_trunc('month', CURRENT_DATE) + make_interval(months => i))::DATE) THEN
+            creadas := creadas + 1;
+        END IF;
+    END LOOP;
+
+    FOR mes IN
+        SELECT DISTINCT date_trunc('month', fecha_venta)::DATE
+        FROM ventas_default
+        ORDER BY 1
+    LOOP
+        IF to_regclass('archivo_ventas_' || to_char(mes, 'YYYY_MM')) IS NULL
+                AND crear_particion_ventas(mes) THEN
+            creadas := creadas + 1;
+        END IF;
+    END LOOP;
+    RETURN creadas;
+END;
+$$;
+
+-- Fin del archivo '0008_particion_ventas_defecto.sql'
@@ -0,0 +1,13 @@
+-- #######################################################################
+-- # Archivo: src\models\migraciones\0009_eliminar_resumenes_sin_uso.sql #
+-- #######################################################################
+
+-- Migración 0009: elimina los resúmenes materializados por videojuego, género y plataforma.
+-- Ningún informe los lee (el gráfico de ventas por título usa 'videojuegos.ventas' con el filtro
+-- activo), pero cada actualización periódica los recalculaba sobre todo el historial de
+-- 'ventas'. Se conservan los resúmenes por día y por mes, que usa la evolución de ventas.
+
+DROP MATERIALIZED VIEW IF EXISTS resumen_ventas_videojuego, resumen_ventas_genero,
+    resumen_ventas_plataforma;
+
+-- Fin del archivo '0009_eliminar_resumenes_sin_uso.sql'
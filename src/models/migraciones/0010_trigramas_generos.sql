@@ -0,0 +1,13 @@
+-- ##############################################################
+-- # Archivo: src\models\migraciones\0010_trigramas_generos.sql #
+-- ##############################################################
+
+-- Migración 0010: índice de trigramas sobre el nombre del género.
+-- La búsqueda por subcadena de 'videojuegos' también compara el texto con el nombre de su
+-- género ("id_genero IN (SELECT id_genero FROM generos WHERE nombre_genero ILIKE '%texto%')"),
+-- como la columna "genero" que muestra la tabla. El índice GIN con pg_trgm (extensión de la
+-- migración 0001) resuelve esa condición sin recorrer 'generos'.
+
+CREATE INDEX IF NOT EXISTS idx_generos_nombre_genero_trgm ON generos USING GIN (nombre_genero gin_trgm_ops);
+
+-- Fin del archivo '0010_trigramas_generos.sql'
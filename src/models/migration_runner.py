@@ -0,0 +1,159 @@
+# Archivo: src/models/migration_runner.py
+
+import hashlib  # Suma de comprobación de cada script de migración
+import os  # Listado de los scripts de la carpeta de migraciones
+import re  # Reconocimiento del número de versión en el nombre del archivo
+from typing import Any, Dict, List, Tuple
+import psycopg  # Errores de PostgreSQL (tabla de registro inexistente)
+from utils import utils_path
+
+
+class MigrationRunner:
+    """
+    Aplica los scripts versionados de la carpeta de migraciones y los anota en un registro.
+
+    La tabla `schema_migraciones` guarda la versión, el nombre y la suma de comprobación de cada
+    script aplicado. Al arrancar basta una consulta a ese registro para saber que el esquema está
+    al día; si hay scripts pendientes, se aplican todos en una sola transacción (cada script en
+    un único viaje al servidor) y, ante cualquier error, no queda ninguno aplicado a medias.
+    """
+
+    # Nombre de los scripts: número de versión, guion bajo y descripción
+    _FILE_PATTERN = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+    # Identificador del bloqueo consultivo que impide que dos arranques migren a la vez
+    _ADVISORY_LOCK_ID = 40401
+
+    _CREATE_LEDGER = """
+        CREATE TABLE IF NOT EXISTS schema_migraciones (
+            version INT PRIMARY KEY,
+            nombre VARCHAR(255) NOT NULL,
+            checksum CHAR(64) NOT NULL,
+            aplicada_en TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+    """
+    _SELECT_LEDGER = "SELECT version, checksum FROM schema_migraciones;"
+    _INSERT_LEDGER = "INSERT INTO schema_migraciones (version, nombre, checksum) VALUES (%s, %s, %s);"
+
+    def __init__(self, db_manager, migrations_dir: str = utils_path.MIGRATIONS_DIR) -> None:
+        """
+        Inicializa el ejecutor de migraciones.
+
+        Parámetros:
+        - db_manager: Instancia de ManagerDB con la conexión abierta.
+        - migrations_dir (str): Carpeta con los scripts NNNN_descripcion.sql.
+        """
+        self._db_manager = db_manager
+        self._migrations_dir = migrations_dir
+    # __init__ (fin)
+
+    def _load_migrations(self) -> List[Dict[str, Any]]:
+        """
+        Lee los scripts de la carpeta de migraciones (NNNN_descripcion.sql) ordenados por versión.
+
+        La suma de comprobación se calcula con los saltos de línea normalizados, para que
+        el mismo script dé el mismo resultado en Windows y en Linux.
+
+        Retorno:
+        - list[dict]: Migraciones disponibles con "version", "name", "path" y "checksum".
+
+        Excepciones:
+        - ValueError: Si dos scripts tienen el mismo número de versión.
+        """
+        migrations: Dict[int, Dict[str, Any]] = {}
+        for file_name in sorted(os.listdir(self._migrations_dir)):
+            match = self._FILE_PATTERN.match(file_name)
+            if not match:
+                continue
+            version = int(match.group(1))
+            if version in migrations:
+                raise ValueError(f"Versión de migración duplicada: {version} ({file_name}).")
+
+            path = os.path.join(self._migrations_dir, file_name)
+            with open(path, "rb") as file:
+                content = file.read().replace(b"\r\n", b"\n")
+            migrations[version] = {
+                "version": version,
+                "name": file_name,
+                "path": path,
+                "checksum": hashlib.sha256(content).hexdigest(),
+            }
+        return [migrations[version] for version in sorted(migrations)]
+    # _load_migrations (fin)
+
+    def _pending(self, migrations: List[Dict[str, Any]], applied: Dict[int, str]) -> List[Dict[str, Any]]:
+        """
+        Calcula las migraciones pendientes y comprueba que las aplicadas no se hayan modificado.
+
+        Parámetros:
+        - migrations (list[dict]): Migraciones disponibles.
+        - applied (dict[int, str]): Versión -> suma de comprobación registrada.
+
+        Retorno:
+        - list[dict]: Migraciones sin aplicar, en orden.
+
+        Excepciones:
+        - ValueError: Si un script ya aplicado ha cambiado.
+        """
+        for migration in migrations:
+            checksum = applied.get(migration["version"])
+            if checksum is not None and checksum.strip() != migration["checksum"]:
+                name = migration["name"]
+                raise ValueError(
+                    f"La migración '{name}' ya está aplicada y su contenido ha cambiado. "
+                    "Crea una migración nueva en lugar de modificarla.")
+        return [migration for migration in migrations if migration["version"] not in applied]
+    # _pending (fin)
+
+    def _read_ledger(self, connection: psycopg.Connection) -> Dict[int, str]:
+        """
+        Lee el registro de migraciones aplicadas.
+
+        Parámetros:
+        - connection (psycopg.Connection): Conexión activa.
+
+        Retorno:
+        - dict[int, str]: Versión -> suma de comprobación (vacío si el registro aún no existe).
+        """
+        try:
+            with connection.transaction(), connection.cursor() as cursor:
+                cursor.execute(self._SELECT_LEDGER)
+                return {version: checksum for version, checksum in cursor.fetchall()}
+        except psycopg.errors.UndefinedTable:
+            return {}
+    # _read_ledger (fin)
+
+    def _migrate(self) -> Tuple[List[str], bool]:
+        """
+        Aplica las migraciones pendientes.
+
+        Retorno:
+        - tuple: (nombres de las migraciones aplicadas, True si el esquema ya estaba al día).
+
+        Excepciones:
+        - ValueError: Si un script aplicado ha cambiado o hay versiones duplicadas.
+        - psycopg.Error: Si falla algún script (la transacción se revierte por completo).
+        """
+        migrations = self._load_migrations()
+
+        with self._db_manager.connection() as connection:
+            # Caso habitual: una sola consulta confirma que no hay nada pendiente
+            if not self._pending(migrations, self._read_ledger(connection)):
+                return [], True
+
+            with connection.transaction(), connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(%s);", (self._ADVISORY_LOCK_ID,))
+                cursor.execute(self._CREATE_LEDGER)
+
+                # Se vuelve a leer con el bloqueo adquirido por si otra instancia migró mientras tanto
+                cursor.execute(self._SELECT_LEDGER)
+                pending = self._pending(migrations, dict(cursor.fetchall()))
+
+                for migration in pending:
+                    with open(migration["path"], "r", encoding="utf-8") as file:
+                        cursor.execute(file.read())  # Sin parámetros: el script completo en un viaje
+                    cursor.execute(self._INSERT_LEDGER, (migration["version"], migration["name"], migration["checksum"]))
+
+            return [migration["name"] for migration in pending], False
+    # _migrate (fin)
+# MigrationRunner (fin)
@@ -0,0 +1,511 @@
+# Archivo: src/models/query_builder.py
+
+import re  # Separación en palabras de la consulta de texto completo
+from typing import Any, List, Optional, Sequence, Tuple
+from psycopg import sql  # Composición segura de identificadores SQL
+
+
+class QueryBuilder:
+    """
+    Constructor de consultas SELECT parametrizadas sobre una tabla.
+
+    Cubre lo que necesitan los informes: proyección de columnas, filtros (igualdad, lista de
+    valores, comparación keyset, rango, búsqueda ILIKE en varias columnas, texto completo),
+    uniones, agregados con agrupación (también por periodos de fecha con date_trunc), ordenación
+    (también por relevancia con ts_rank) y límite. Los nombres de tablas y columnas se componen
+    con sql.Identifier y los valores viajan siempre como parámetros, nunca interpolados en el
+    texto SQL.
+
+    Cada cláusula guarda además una "forma" sin valores; _shape() devuelve la de toda la consulta,
+    de modo que dos consultas con la misma forma generan el mismo SQL y pueden compartir la
+    sentencia registrada en StatementRegistry.
+
+    Los métodos de construcción devuelven la propia instancia para poder encadenarlos:
+
+        query, params = (QueryBuilder("videojuegos")
+                         ._select("codigo", "titulo")
+                         ._where_equals("id_genero", 2)
+                         ._order_by("codigo")
+                         ._limit(200)
+                         ._build())
+
+    Las columnas pueden calificarse con el nombre de la tabla ("generos.nombre_genero").
+    """
+
+    # Funciones de agregado admitidas por _aggregate
+    _AGGREGATES = ("COUNT", "SUM", "MIN", "MAX", "AVG")
+
+    # Periodos admitidos por _select_date_trunc
+    _DATE_UNITS = ("day", "week", "month", "quarter", "year")
+
+    # Palabras de una consulta de texto completo (letras, dígitos y '_', también con tildes)
+    _WORD_PATTERN = re.compile(r"\w+")
+
+    def __init__(self, table: str) -> None:
+        """
+        Inicializa una consulta vacía sobre una tabla.
+
+        Parámetros:
+        - table (str): Tabla principal de la consulta (ya validada por el llamador).
+        """
+        self._table = table
+        # Cada cláusula es una tupla (forma, SQL compuesto, parámetros)
+        self._projection: List[Tuple[Any, sql.Composable, List[Any]]] = []
+        self._joins: List[Tuple[Any, sql.Composable, List[Any]]] = []
+        self._conditions: List[Tuple[Any, sql.Composable, List[Any]]] = []
+        self._grouping: List[Tuple[Any, sql.Composable, List[Any]]] = []
+        self._ordering: List[Tuple[Any, sql.Composable, List[Any]]] = []
+        self._limit_value: Optional[int] = None
+    # __init__ (fin)
+
+    def _identifier(self, column: str) -> sql.Identifier:
+        """
+        Convierte un nombre de columna, opcionalmente calificado ("tabla.columna"), en identificador.
+
+        Parámetros:
+        - column (str): Nombre de la columna.
+
+        Retorno:
+        - sql.Identifier: Identificador entrecomillado.
+        """
+        return sql.Identifier(*column.split("."))
+    # _identifier (fin)
+
+    def _select(self, *columns: str) -> "QueryBuilder":
+        """
+        Añade columnas a la proyección ("*" selecciona todas las de la tabla principal).
+
+        Parámetros:
+        - columns (str): Nombres de las columnas.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        for column in columns:
+            composed = sql.SQL("*") if column == "*" else self._identifier(column)
+            self._projection.append((("columna", column), composed, []))
+        return self
+    # _select (fin)
+
+    def _select_as(self, column: str, alias: str, default: Optional[Any] = None) -> "QueryBuilder":
+        """
+        Añade una columna a la proyección con otro nombre.
+
+        Parámetros:
+        - column (str): Nombre de la columna (puede estar calificado).
+        - alias (str): Nombre con el que se devuelve.
+        - default (Any | None): Valor devuelto en lugar de NULL (COALESCE), p. ej. en un LEFT JOIN sin pareja.
+          Es una constante de la consulta, no un parámetro: forma parte de su forma.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        expression = self._identifier(column)
+        if default is not None:
+            expression = sql.SQL("COALESCE({}, {})").format(expression, sql.Literal(default))
+        composed = sql.SQL("{} AS {}").format(expression, sql.Identifier(alias))
+        self._projection.append((("alias", column, alias, default), composed, []))
+        return self
+    # _select_as (fin)
+
+    def _select_match(self, other: "QueryBuilder", alias: str) -> "QueryBuilder":
+        """
+        Proyecta como columna booleana si cada fila cumple los filtros de otra consulta.
+
+        Parámetros:
+        - other (QueryBuilder): Consulta cuyos filtros (WHERE) se evalúan.
+        - alias (str): Nombre de la columna resultante.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        conditions = [composed for _, composed, _ in other._conditions]
+        expression = sql.SQL(" AND ").join(conditions) if conditions else sql.SQL("TRUE")
+        params = [param for _, _, clause_params in other._conditions for param in clause_params]
+        shape = ("coincide", alias, tuple(clause_shape for clause_shape, _, _ in other._conditions))
+        self._projection.append((shape, sql.SQL("({}) AS {}").format(expression, sql.Identifier(alias)), params))
+        return self
+    # _select_match (fin)
+
+    def _aggregate(self, function: str, column: str = "*", alias: Optional[str] = None,
+                   default: Optional[Any] = None) -> "QueryBuilder":
+        """
+        Añade un agregado a la proyección.
+
+        Parámetros:
+        - function (str): COUNT, SUM, MIN, MAX o AVG.
+        - column (str): Columna agregada ("*" solo tiene sentido con COUNT).
+        - alias (str | None): Nombre del resultado (por defecto, el de la función en minúsculas).
+        - default (Any | None): Valor devuelto en lugar de NULL si no hay filas (COALESCE).
+          Es una constante de la consulta, no un parámetro: forma parte de su forma.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+
+        Excepciones:
+        - ValueError: Si la función no está admitida.
+        """
+        function = function.upper()
+        if function not in self._AGGREGATES:
+            raise ValueError(f"Función de agregado no admitida: {function}.")
+
+        target = sql.SQL("*") if column == "*" else self._identifier(column)
+        expression = sql.SQL("{}({})").format(sql.SQL(function), target)
+        if default is not None:
+            expression = sql.SQL("COALESCE({}, {})").format(expression, sql.Literal(default))
+        alias = alias or function.lower()
+        self._projection.append((("agregado", function, column, alias, default),
+                                 sql.SQL("{} AS {}").format(expression, sql.Identifier(alias)), []))
+        return self
+    # _aggregate (fin)
+
+    def _select_date_trunc(self, column: str, unit: str, alias: str) -> "QueryBuilder":
+        """
+        Proyecta una columna de fecha truncada al inicio de su periodo (date_trunc), como DATE.
+
+        Parámetros:
+        - column (str): Columna de fecha.
+        - unit (str): Periodo: day, week (lunes ISO), month, quarter o year.
+        - alias (str): Nombre del resultado (útil para _group_by y _order_by).
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+
+        Excepciones:
+        - ValueError: Si el periodo no está admitido.
+        """
+        if unit not in self._DATE_UNITS:
+            raise ValueError(f"Periodo no admitido: {unit}.")
+        composed = sql.SQL("date_trunc({}, {})::date AS {}").format(
+            sql.Literal(unit), self._identifier(column), sql.Identifier(alias))
+        self._projection.append((("periodo", column, unit, alias), composed, []))
+        return self
+    # _select_date_trunc (fin)
+
+    def _join(self, table: str, left_column: str, right_column: str, outer: bool = False) -> "QueryBuilder":
+        """
+        Une otra tabla por igualdad de columnas.
+
+        Parámetros:
+        - table (str): Tabla que se une.
+        - left_column (str): Columna de la tabla principal (o calificada).
+        - right_column (str): Columna de la tabla unida (o calificada).
+        - outer (bool): Si es True se usa LEFT JOIN (se conservan las filas sin pareja).
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        kind = "LEFT JOIN" if outer else "JOIN"
+        composed = sql.SQL(" {} {} ON {} = {}").format(
+            sql.SQL(kind), sql.Identifier(table), self._identifier(left_column), self._identifier(right_column))
+        self._joins.append(((kind, table, left_column, right_column), composed, []))
+        return self
+    # _join (fin)
+
+    def _where_equals(self, column: str, value: Any) -> "QueryBuilder":
+        """
+        Filtra las filas cuya columna es igual a un valor.
+
+        Parámetros:
+        - column (str): Columna filtrada.
+        - value (Any): Valor buscado.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        self._conditions.append((("igual", column), sql.SQL("{} = %s").format(self._identifier(column)), [value]))
+        return self
+    # _where_equals (fin)
+
+    def _where_in(self, column: str, values: Sequence[Any]) -> "QueryBuilder":
+        """
+        Filtra las filas cuya columna está en una lista de valores (un único parámetro array).
+
+        Parámetros:
+        - column (str): Columna filtrada.
+        - values (Sequence): Valores admitidos.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        self._conditions.append((("en", column), sql.SQL("{} = ANY(%s)").format(self._identifier(column)),
+                                 [list(values)]))
+        return self
+    # _where_in (fin)
+
+    def _where_after(self, columns: Sequence[str], values: Sequence[Any]) -> "QueryBuilder":
+        """
+        Filtra las filas estrictamente posteriores a una clave (paginación keyset).
+
+        Con una columna se compara `columna > %s`; con varias, la tupla completa `(a, b) > (%s, %s)`.
+
+        Parámetros:
+        - columns (Sequence[str]): Columnas de la clave de ordenación.
+        - values (Sequence): Valores de la última fila recibida, en el mismo orden.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        columns = list(columns)
+        if len(columns) == 1:
+            composed = sql.SQL("{} > %s").format(self._identifier(columns[0]))
+        else:
+            composed = sql.SQL("({}) > ({})").format(
+                sql.SQL(", ").join(self._identifier(column) for column in columns),
+                sql.SQL(", ").join(sql.Placeholder() for _ in columns))
+        self._conditions.append((("despues", tuple(columns)), composed, list(values)))
+        return self
+    # _where_after (fin)
+
+    def _where_ilike_any(self, columns: Sequence[str], text: str,
+                         lookups: Sequence[Tuple[str, str, str, str, Optional[str]]] = ()) -> "QueryBuilder":
+        """
+        Filtra las filas en las que alguna de las columnas contiene el texto (ILIKE '%texto%').
+
+        Los comodines de LIKE del texto se escapan para que se busque literalmente. Cada búsqueda en
+        otra tabla (lookup) compara el texto con una columna de la fila referenciada por una clave
+        foránea, con la forma "fk IN (SELECT clave FROM tabla WHERE columna ILIKE ...)" para que
+        PostgreSQL pueda usar el índice de trigramas de esa columna. Si se indica un valor por
+        defecto, las filas con la clave foránea a NULL se comparan con él (como un COALESCE).
+
+        Parámetros:
+        - columns (Sequence[str]): Columnas en las que se busca.
+        - text (str): Texto buscado.
+        - lookups (Sequence[tuple]): Tuplas (clave foránea, tabla, clave, columna, valor por defecto o None).
+          El valor por defecto es una constante de la consulta y forma parte de su forma.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        parts = [sql.SQL("{} ILIKE %s").format(self._identifier(column)) for column in columns]
+        params = [pattern] * len(columns)
+        for foreign_key, table, key, column, default in lookups:
+            parts.append(sql.SQL("{} IN (SELECT {} FROM {} WHERE {} ILIKE %s)").format(
+                self._identifier(foreign_key), sql.Identifier(key), sql.Identifier(table), sql.Identifier(column)))
+            params.append(pattern)
+            if default is not None:
+                parts.append(sql.SQL("({} IS NULL AND {} ILIKE %s)").format(
+                    self._identifier(foreign_key), sql.Literal(default)))
+                params.append(pattern)
+        composed = sql.SQL("({})").format(sql.SQL(" OR ").join(parts))
+        self._conditions.append((("contiene", tuple(columns), tuple(lookups)), composed, params))
+        return self
+    # _where_ilike_any (fin)
+
+    @staticmethod
+    def _text_query(text: str) -> str:
+        """
+        Convierte el texto escrito por el usuario en una consulta para to_tsquery.
+
+        Cada palabra se busca como prefijo (palabra:*) para que los resultados aparezcan mientras
+        se escribe, y todas deben aparecer (&). Solo se conservan letras, dígitos y '_', de modo
+        que el texto nunca se interpreta como operadores de tsquery.
+
+        Parámetros:
+        - text (str): Texto buscado.
+
+        Retorno:
+        - str: Consulta (vacía si el texto no contiene palabras).
+        """
+        return " & ".join(f"{word}:*" for word in QueryBuilder._WORD_PATTERN.findall(text))
+    # _text_query (fin)
+
+    def _where_text_search(self, column: str, config: str, text: str) -> "QueryBuilder":
+        """
+        Filtra las filas cuyo tsvector coincide con el texto (column @@ to_tsquery).
+
+        El texto se analiza con la configuración indicada y sin tildes (f_unaccent), igual que la
+        columna (migración 0007_busqueda_texto_completo.sql).
+
+        Parámetros:
+        - column (str): Columna tsvector.
+        - config (str): Configuración de búsqueda de texto de PostgreSQL (p. ej. "spanish").
+        - text (str): Texto buscado.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        composed = sql.SQL("{} @@ to_tsquery({}::regconfig, f_unaccent(%s))").format(
+            self._identifier(column), sql.Literal(config))
+        self._conditions.append((("texto_completo", column, config), composed, [self._text_query(text)]))
+        return self
+    # _where_text_search (fin)
+
+    def _where_range(self, column: str, start: Optional[Any] = None, end: Optional[Any] = None) -> "QueryBuilder":
+        """
+        Filtra las filas cuya columna está en el rango semiabierto [start, end).
+
+        Cada límite es opcional; si faltan ambos no se añade ninguna condición.
+
+        Parámetros:
+        - column (str): Columna filtrada.
+        - start (Any | None): Límite inferior (incluido).
+        - end (Any | None): Límite superior (excluido).
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        if start is not None:
+            self._conditions.append((("desde", column), sql.SQL("{} >= %s").format(self._identifier(column)), [start]))
+        if end is not None:
+            self._conditions.append((("hasta", column), sql.SQL("{} < %s").format(self._identifier(column)), [end]))
+        return self
+    # _where_range (fin)
+
+    def _where_all(self, other: "QueryBuilder") -> "QueryBuilder":
+        """
+        Añade los filtros (WHERE) de otra consulta, p. ej. los de una tabla unida.
+
+        Parámetros:
+        - other (QueryBuilder): Consulta cuyos filtros se copian.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        self._conditions.extend(other._conditions)
+        return self
+    # _where_all (fin)
+
+    def _group_by(self, *columns: str) -> "QueryBuilder":
+        """
+        Agrupa las filas por columnas o por alias de la proyección.
+
+        Parámetros:
+        - columns (str): Columnas o alias de agrupación.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        for column in columns:
+            self._grouping.append((("grupo", column), self._identifier(column), []))
+        return self
+    # _group_by (fin)
+
+    def _order_by(self, *columns: str, descending: bool = False) -> "QueryBuilder":
+        """
+        Añade columnas a la ordenación.
+
+        Parámetros:
+        - columns (str): Columnas de ordenación.
+        - descending (bool): Si es True, el orden es descendente.
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        direction = sql.SQL(" DESC" if descending else "")
+        for column in columns:
+            self._ordering.append((("orden", column, descending), self._identifier(column) + direction, []))
+        return self
+    # _order_by (fin)
+
+    def _order_by_rank(self, column: str, config: str, text: str) -> "QueryBuilder":
+        """
+        Ordena las filas de más a menos relevantes para el texto (ts_rank).
+
+        Parámetros:
+        - column (str): Columna tsvector.
+        - config (str): Configuración de búsqueda de texto de PostgreSQL.
+        - text (str): Texto buscado (el mismo que en _where_text_search).
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        composed = sql.SQL("ts_rank({}, to_tsquery({}::regconfig, f_unaccent(%s))) DESC").format(
+            self._identifier(column), sql.Literal(config))
+        self._ordering.append((("relevancia", column, config), composed, [self._text_query(text)]))
+        return self
+    # _order_by_rank (fin)
+
+    def _limit(self, limit: Optional[int]) -> "QueryBuilder":
+        """
+        Limita el número de filas devueltas.
+
+        Parámetros:
+        - limit (int | None): Número máximo de filas (None para no limitar).
+
+        Retorno:
+        - QueryBuilder: La propia instancia.
+        """
+        self._limit_value = limit
+        return self
+    # _limit (fin)
+
+    def _selects_all(self) -> bool:
+        """
+        Indica si la proyección incluye "*" (columnas que dependen del esquema vivo de la tabla).
+
+        Retorno:
+        - bool: True si alguna columna seleccionada es "*".
+        """
+        return any(shape == ("columna", "*") for shape, _, _ in self._projection)
+    # _selects_all (fin)
+
+    def _shape(self) -> tuple:
+        """
+        Devuelve la forma de la consulta: todo lo que determina su texto SQL, sin los valores.
+
+        Retorno:
+        - tuple: Forma hashable (clave de StatementRegistry).
+        """
+        return (
+            self._table,
+            tuple(shape for shape, _, _ in self._projection),
+            tuple(shape for shape, _, _ in self._joins),
+            tuple(shape for shape, _, _ in self._conditions),
+            tuple(shape for shape, _, _ in self._grouping),
+            tuple(shape for shape, _, _ in self._ordering),
+            self._limit_value is not None,
+        )
+    # _shape (fin)
+
+    def _build_query(self) -> sql.Composed:
+        """
+        Compone el texto SQL de la consulta.
+
+        Retorno:
+        - sql.Composed: Consulta con marcadores %s para los parámetros de _params().
+        """
+        projection = sql.SQL(", ").join(composed for _, composed, _ in self._projection) \
+            if self._projection else sql.SQL("*")
+        query = sql.SQL("SELECT {} FROM {}").format(projection, sql.Identifier(self._table))
+        for _, composed, _ in self._joins:
+            query += composed
+        if self._conditions:
+            query += sql.SQL(" WHERE ") + sql.SQL(" AND ").join(composed for _, composed, _ in self._conditions)
+        if self._grouping:
+            query += sql.SQL(" GROUP BY ") + sql.SQL(", ").join(composed for _, composed, _ in self._grouping)
+        if self._ordering:
+            query += sql.SQL(" ORDER BY ") + sql.SQL(", ").join(composed for _, composed, _ in self._ordering)
+        if self._limit_value is not None:
+            query += sql.SQL(" LIMIT %s")
+        return query
+    # _build_query (fin)
+
+    def _params(self) -> List[Any]:
+        """
+        Devuelve los parámetros de la consulta en el orden de sus marcadores.
+
+        Retorno:
+        - list: Parámetros (proyección, uniones, filtros, agrupación, ordenación y límite).
+        """
+        params: List[Any] = []
+        for clauses in (self._projection, self._joins, self._conditions, self._grouping, self._ordering):
+            for _, _, clause_params in clauses:
+                params.extend(clause_params)
+        if self._limit_value is not None:
+            params.append(self._limit_value)
+        return params
+    # _params (fin)
+
+    def _build(self) -> Tuple[sql.Composed, List[Any]]:
+        """
+        Compone la consulta y sus parámetros.
+
+        Retorno:
+        - tuple: (consulta, parámetros), listos para `cursor.execute`.
+        """
+        return self._build_query(), self._params()
+    # _build (fin)
+# QueryBuilder (fin)
@@ -0,0 +1,154 @@
+# Archivo: src/models/query_cache.py
+
+import threading  # La caché se consulta desde el hilo principal y desde los workers
+import time  # Caducidad (TTL) de las entradas
+from collections import OrderedDict  # Orden de uso para la política LRU
+from typing import Any, Dict, Hashable, Optional, Tuple
+from utils import utils_db
+
+
+class QueryCache:
+    """
+    Caché de resultados de consultas con política LRU y caducidad opcional (TTL).
+
+    Se sitúa entre ReportController y ReportModel: las claves identifican una consulta por
+    (tabla, texto de búsqueda normalizado, género, orden, página) y los valores son los
+    resultados ya preparados. El tamaño se limita por número de entradas y por número total
+    de filas almacenadas (aproximación de la memoria usada).
+    """
+
+    def __init__(self, max_entries: int = utils_db.QUERY_CACHE_MAX_ENTRIES,
+                 max_rows: int = utils_db.QUERY_CACHE_MAX_ROWS,
+                 ttl: Optional[float] = utils_db.QUERY_CACHE_TTL) -> None:
+        """
+        Inicializa la caché vacía.
+
+        Parámetros:
+        - max_entries (int): Número máximo de entradas.
+        - max_rows (int): Número máximo de filas sumando todas las entradas.
+        - ttl (float | None): Segundos de validez de cada entrada (None para no caducar).
+        """
+        self._max_entries = max_entries
+        self._max_rows = max_rows
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, Optional[float]]]" = OrderedDict()
+        self._total_rows = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+    # __init__ (fin)
+
+    @staticmethod
+    def _make_key(table_name: str, search_text: str = "", genre: Any = None,
+                  sort: Optional[str] = None, page: Any = None) -> Tuple[Any, ...]:
+        """
+        Construye la clave de una consulta, normalizando el texto de búsqueda.
+
+        Parámetros:
+        - table_name (str): Tabla consultada.
+        - search_text (str): Texto de búsqueda (se ignoran mayúsculas, igual que ILIKE, y espacios en los extremos).
+        - genre: Género filtrado (None para todos).
+        - sort (str | None): Columna de ordenación.
+        - page: Identificador de la página (p. ej. la clave keyset; None para la primera).
+
+        Retorno:
+        - tuple: Clave hashable.
+        """
+        return (table_name, (search_text or "").strip().lower(), genre, sort, page)
+    # _make_key (fin)
+
+    def _get(self, key: Hashable) -> Optional[Any]:
+        """
+        Devuelve el valor almacenado para una clave, o None si no está o ha caducado.
+
+        Parámetros:
+        - key (Hashable): Clave creada con _make_key.
+
+        Retorno:
+        - Valor almacenado o None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, rows, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                self._remove(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)  # Uso más reciente
+            self._hits += 1
+            return value
+    # _get (fin)
+
+    def _put(self, key: Hashable, value: Any, rows: int = 1) -> None:
+        """
+        Guarda un valor y expulsa las entradas menos usadas si se superan los límites.
+
+        Parámetros:
+        - key (Hashable): Clave creada con _make_key.
+        - value: Resultado a guardar.
+        - rows (int): Número de filas del resultado (peso de la entrada).
+        """
+        if rows > self._max_rows:
+            return  # Un resultado mayor que la caché entera no se guarda
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+            self._entries[key] = (value, rows, expires_at)
+            self._total_rows += rows
+
+            while self._entries and (len(self._entries) > self._max_entries or self._total_rows > self._max_rows):
+                self._remove(next(iter(self._entries)))
+    # _put (fin)
+
+    def _invalidate(self, table_name: Optional[str] = None) -> None:
+        """
+        Elimina las entradas de una tabla, o todas si no se indica tabla.
+
+        Parámetros:
+        - table_name (str | None): Tabla cuyas consultas ya no son válidas.
+        """
+        with self._lock:
+            if table_name is None:
+                self._entries.clear()
+                self._total_rows = 0
+                return
+            for key in [key for key in self._entries if key[0] == table_name]:
+                self._remove(key)
+    # _invalidate (fin)
+
+    def _remove(self, key: Hashable) -> None:
+        """
+        Elimina una entrada (debe llamarse con el cerrojo adquirido).
+
+        Parámetros:
+        - key (Hashable): Clave a eliminar.
+        """
+        _, rows, _ = self._entries.pop(key)
+        self._total_rows -= rows
+    # _remove (fin)
+
+    def _get_stats(self) -> Dict[str, Any]:
+        """
+        Devuelve los contadores de la caché.
+
+        Retorno:
+        - dict: "aciertos", "fallos", "ratio_aciertos", "entradas" y "filas".
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "aciertos": self._hits,
+                "fallos": self._misses,
+                "ratio_aciertos": self._hits / total if total else 0.0,
+                "entradas": len(self._entries),
+                "filas": self._total_rows,
+            }
+    # _get_stats (fin)
+# QueryCache (fin)
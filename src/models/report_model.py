@@ -6,10 +6,21 @@ WEBGRAFIA:
 """
 # Archivo: src/models/report_model.py
 
-from typing import List, Dict, Optional, Union
+import asyncio  # Permite lanzar varias consultas asíncronas a la vez
+import itertools  # Contador para nombrar los cursores del servidor
+import threading  # Protege la caché de metadatos frente a consultas concurrentes
+import time  # Controla cada cuánto se comprueba la huella del esquema
+import unicodedata  # Eliminación de tildes en el texto de búsqueda en memoria
+from concurrent.futures import Future
+from datetime import date, timedelta  # Rango de fechas de la serie de ventas
+from typing import Any, Callable, Coroutine, Iterator, List, Dict, Optional, Sequence, Tuple, Union
 import psycopg  # Biblioteca para consultas SQL
+from psycopg import sql  # Composición segura de identificadores SQL
 from utils.utils_popup import _printv2  # Utilidad para mostrar popups
 from utils import utils_db
+from models.statement_registry import StatementRegistry  # Consultas con nombre, preparadas una vez por conexión
+from models.query_builder import QueryBuilder  # Composición de consultas con proyección y parámetros
+from models.columnar_store import ColumnarStore  # Catálogo en arrays de NumPy (búsqueda en memoria)
 
 
 class ReportModel:
@@ -18,26 +29,81 @@ class ReportModel:
 
     Facilita la ejecución de consultas SQL y la obtención de datos
     desde PostgreSQL, utilizando la conexión administrada por ManagerDB.
+
+    Las consultas se construyen con QueryBuilder (solo las columnas necesarias y los valores
+    siempre como parámetros), salen del registro de sentencias (StatementRegistry) según su forma
+    y se ejecutan con `prepare=True`, de modo que cada una se analiza y planifica una sola vez
+    por conexión (salvo las que seleccionan "*", ver StatementRegistry).
+    """
+
+    # Columnas (nombre y tipo, en orden) de una tabla del esquema actual
+    _COLUMN_METADATA_QUERY = """
+        SELECT column_name, data_type
+        FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = %s
+        ORDER BY ordinal_position;
+    """
+
+    # Huella del esquema de las tablas de la aplicación: cambia si se añaden, eliminan,
+    # renombran o cambian de tipo sus columnas. Consulta pg_attribute por su índice (attrelid),
+    # mucho más barata que las vistas de information_schema. Los nombres se resuelven con
+    # to_regclass(), que devuelve NULL para una tabla inexistente (un cast a regclass fallaría):
+    # la tabla ausente solo cambia la huella.
+    _SCHEMA_FINGERPRINT_QUERY = """
+        SELECT md5(string_agg(
+                   t.nombre || '.' || COALESCE(
+                       a.attrelid::text || '.' || a.attnum || ':' || a.attname || ':' ||
+                       a.atttypid::text || ':' || a.atttypmod || ':' || a.attisdropped::text,
+                       'ausente'),
+                   ',' ORDER BY t.nombre, a.attnum))
+        FROM unnest(%s::text[]) AS t(nombre)
+        LEFT JOIN pg_attribute a ON a.attrelid = to_regclass(t.nombre) AND a.attnum > 0;
+    """
+
+    # Último sello de cambio asignado por la secuencia 'cambios_seq' (0 si aún no se ha usado)
+    _CURRENT_STAMP_QUERY = "SELECT CASE WHEN is_called THEN last_value ELSE 0 END AS sello FROM cambios_seq;"
+
+    # Poda de lápidas: borra, tabla a tabla (índice (tabla, version_cambio)), las de sello menor o
+    # igual que el de la lápida más reciente anterior al periodo de retención
+    _PRUNE_TOMBSTONES_QUERY = """
+        DELETE FROM cambios_borrados
+        WHERE tabla = ANY(%s) AND version_cambio <= (
+            SELECT max(version_cambio) FROM cambios_borrados
+            WHERE fecha_borrado < now() - make_interval(hours => %s));
     """
 
-    def __init__(self, db_manager, popup_parent: Optional[object] = None) -> None:
+    def __init__(self, db_manager, popup_parent: Optional[object] = None, async_db_manager=None) -> None:
         """
         Inicializa el ReportModel utilizando una instancia de ManagerDB.
 
         Parámetros:
         - db_manager: Instancia de ManagerDB para gestionar la conexión a la base de datos.
+          Cada consulta toma su conexión con `db_manager.connection()`, por lo que en modo pool
+          varias consultas pueden ejecutarse en paralelo.
         - popup_parent: Widget padre opcional para mostrar popups.
+        - async_db_manager: Instancia opcional de AsyncManagerDB para los métodos asíncronos (*_async).
         """
         self._db_manager = db_manager
         self._popup_parent = popup_parent
+        self._async_db_manager = async_db_manager
+        self._cursor_counter = itertools.count()  # Nombres únicos para los cursores del servidor
+        self._statements = StatementRegistry()  # Consultas compuestas una vez por nombre y forma
+
+        # Caché de metadatos de columnas: tabla -> [{"name": ..., "type": ...}, ...] en orden
+        self._columns_cache: Dict[str, List[Dict[str, str]]] = {}
+        self._schema_fingerprint: Optional[str] = None
+        self._schema_checked_at: Optional[float] = None
+        self._metadata_lock = threading.Lock()
     # __init__ (fin)
 
-    def _fetch_data(self, table_name: str) -> Optional[List[Dict[str, Union[str, int, float]]]]:
+    def _fetch_data(self, table_name: str,
+                    columns: Optional[List[str]] = None) -> Optional[List[Dict[str, Union[str, int, float]]]]:
         """
         Obtiene todos los datos de una tabla específica desde PostgreSQL.
 
         Parámetros:
         - table_name: Nombre de la tabla en PostgreSQL.
+        - columns: Columnas a traer (None para todas).
 
         Retorno:
         - Lista de registros obtenidos como diccionarios clave-valor.
@@ -48,25 +114,152 @@ class ReportModel:
             return None
 
         try:
-            connection = self._db_manager.get_connection()
-            if connection is None:
-                raise ValueError("No hay una conexión activa a la base de datos.")
-
-            query = f"SELECT * FROM {table_name};"
-            with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-                cursor.execute(query)
-                data = []
-                for row in cursor.fetchall():
-                    data.append(row)  # Construimos la lista de registros explícitamente
-                return data
+            query = self._table_query(table_name, columns)
+            with self._db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                cursor.execute(query, prepare=self._statements._prepares(query))
+                return cursor.fetchall()
         except Exception as e:
             _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener datos de '{table_name}': {e}")
             return None
     # _fetch_data (fin)
 
+    def _table_query(self, table_name: str, columns: Optional[List[str]] = None) -> sql.Composable:
+        """
+        Devuelve la consulta registrada que lee una tabla completa.
+
+        Parámetros:
+        - table_name: Nombre de la tabla (ya validado).
+        - columns: Columnas a traer (None para todas).
+
+        Retorno:
+        - Consulta "SELECT columnas FROM tabla" (sin parámetros).
+        """
+        query, _ = self._registered("tabla_completa", QueryBuilder(table_name)._select(*(columns or ["*"])))
+        return query
+    # _table_query (fin)
+
+    def _registered(self, name: str, builder: QueryBuilder) -> Tuple[sql.Composable, List[Any]]:
+        """
+        Obtiene del registro de sentencias la consulta de un QueryBuilder y sus parámetros.
+
+        Las consultas que seleccionan "*" se registran sin preparar (StatementRegistry._prepares).
+
+        Parámetros:
+        - name: Nombre de la consulta en el registro.
+        - builder: Consulta construida; su forma identifica la sentencia registrada.
+
+        Retorno:
+        - Tupla (consulta, parámetros).
+        """
+        statement = self._statements._get(name, builder._shape(), builder._build_query, prepare=not builder._selects_all())
+        return statement, builder._params()
+    # _registered (fin)
+
+    def _fetch_page(self, table_name: str, after_key: Optional[Any] = None, limit: int = utils_db.PAGE_SIZE_DB,
+                    order_by: Optional[str] = None,
+                    columns: Optional[List[str]] = None) -> Optional[List[Dict[str, Union[str, int, float]]]]:
+        """
+        Obtiene una página de una tabla usando paginación por clave (keyset).
+
+        En lugar de OFFSET, se piden las filas posteriores a la última clave recibida, por lo que
+        cada página cuesta lo mismo sin importar lo avanzada que esté y el índice de la clave primaria
+        resuelve la consulta.
+
+        Parámetros:
+        - table_name: Nombre de la tabla en PostgreSQL.
+        - after_key: Clave de la última fila de la página anterior (None para la primera página).
+          Si se ordena por la clave primaria es su valor; si se ordena por otra columna es la
+          tupla (valor de order_by, clave primaria), tal como la devuelve _page_key.
+        - limit: Número máximo de filas de la página.
+        - order_by: Columna de ordenación (por defecto, la clave primaria). No debe contener nulos.
+        - columns: Columnas a traer (None para todas); deben incluir las de ordenación para calcular _page_key.
+
+        Retorno:
+        - Lista de registros de la página como diccionarios clave-valor (vacía al llegar al final).
+        - None si ocurre un error.
+        """
+        if not self._validate_table_name(table_name):
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Tabla '{table_name}' no es válida.")
+            return None
+
+        try:
+            primary_key = utils_db.PRIMARY_KEYS_DB[table_name]
+            order_by = order_by or primary_key
+            order = [primary_key] if order_by == primary_key else [order_by, primary_key]
+
+            builder = QueryBuilder(table_name)._select(*(columns or ["*"]))
+            if after_key is not None:
+                # Condición keyset: filas estrictamente posteriores a la última clave recibida
+                builder._where_after(order, [after_key] if len(order) == 1 else list(after_key))
+            query, params = self._registered("pagina", builder._order_by(*order)._limit(limit))
+
+            with self._db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                cursor.execute(query, params, prepare=self._statements._prepares(query))
+                return cursor.fetchall()
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener página de '{table_name}': {e}")
+            return None
+    # _fetch_page (fin)
+
+    def _page_key(self, table_name: str, row: Dict[str, Any], order_by: Optional[str] = None) -> Any:
+        """
+        Calcula la clave de paginación de una fila, para pedir la página siguiente con _fetch_page.
+
+        Parámetros:
+        - table_name: Nombre de la tabla en PostgreSQL.
+        - row: Última fila recibida.
+        - order_by: Columna de ordenación utilizada en _fetch_page (por defecto, la clave primaria).
+
+        Retorno:
+        - Valor de la clave primaria, o tupla (valor de order_by, clave primaria).
+        """
+        primary_key = utils_db.PRIMARY_KEYS_DB[table_name]
+        if not order_by or order_by == primary_key:
+            return row[primary_key]
+        return (row[order_by], row[primary_key])
+    # _page_key (fin)
+
+    def _stream_data(self, table_name: str, itersize: int = utils_db.STREAM_ITERSIZE_DB,
+                     order_by: Optional[str] = None) -> Iterator[Dict[str, Union[str, int, float]]]:
+        """
+        Recorre todas las filas de una tabla con un cursor con nombre del servidor.
+
+        Las filas llegan en bloques de `itersize`, de modo que la memoria usada no depende del
+        tamaño de la tabla. La conexión queda ocupada hasta que el generador se agota o se cierra.
+
+        Parámetros:
+        - table_name: Nombre de la tabla en PostgreSQL.
+        - itersize: Filas que se traen del servidor en cada viaje.
+        - order_by: Columna de ordenación (por defecto, la clave primaria).
+
+        Retorno:
+        - Generador de registros como diccionarios clave-valor.
+        """
+        if not self._validate_table_name(table_name):
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Tabla '{table_name}' no es válida.")
+            return
+
+        try:
+            order_by = order_by or utils_db.PRIMARY_KEYS_DB[table_name]
+            # Los cursores con nombre se declaran con DECLARE y no admiten prepare; solo se reutiliza la composición
+            query, _ = self._registered("recorrido", QueryBuilder(table_name)._select("*")._order_by(order_by))
+            cursor_name = f"stream_{table_name}_{next(self._cursor_counter)}"
+            with self._db_manager.connection() as connection, \
+                    connection.cursor(name=cursor_name, row_factory=psycopg.rows.dict_row) as cursor:
+                cursor.itersize = itersize
+                cursor.execute(query)
+                yield from cursor
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al recorrer '{table_name}': {e}")
+    # _stream_data (fin)
+
     def _fetch_columns(self, table_name: str) -> Optional[List[str]]:
         """
-        Obtiene los nombres de las columnas de una tabla específica desde PostgreSQL.
+        Obtiene los nombres de las columnas de una tabla específica, en orden.
+
+        Los nombres salen de la caché de metadatos (ver _fetch_column_metadata).
 
         Parámetros:
         - table_name: Nombre de la tabla en PostgreSQL.
@@ -75,30 +268,922 @@ class ReportModel:
         - Lista de nombres de las columnas.
         - None si ocurre un error.
         """
+        metadata = self._fetch_column_metadata(table_name)
+        if metadata is None:
+            return None
+        return [column["name"] for column in metadata]
+    # _fetch_columns (fin)
+
+    def _fetch_column_metadata(self, table_name: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Obtiene el nombre y el tipo de las columnas de una tabla, en orden, usando la caché.
+
+        Los metadatos de cada tabla se consultan una sola vez. Como mucho cada
+        utils_db.SCHEMA_CHECK_INTERVAL_DB segundos se comprueba la huella del esquema y,
+        si ha cambiado, se vacía la caché.
+
+        Parámetros:
+        - table_name: Nombre de la tabla en PostgreSQL.
+
+        Retorno:
+        - Lista de diccionarios {"name": ..., "type": ...}.
+        - None si ocurre un error.
+        """
         if not self._validate_table_name(table_name):
             _printv2(show_popup=False, parent=self._popup_parent, message=f"Tabla '{table_name}' no es válida.")
             return None
 
         try:
-            connection = self._db_manager.get_connection()
-            if connection is None:
-                raise ValueError("No hay una conexión activa a la base de datos.")
+            with self._db_manager.connection() as connection, connection.cursor() as cursor:
+                if self._schema_check_due():
+                    cursor.execute(self._SCHEMA_FINGERPRINT_QUERY, (self._application_tables(),), prepare=True)
+                    self._apply_schema_fingerprint(cursor.fetchone()[0])
 
-            query = f"""
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_name = '{table_name}';
-            """
-            with connection.cursor() as cursor:
-                cursor.execute(query)
-                columns = []
-                for row in cursor.fetchall():
-                    columns.append(row[0])  # Construimos la lista de columnas explícitamente
-                return columns
+                with self._metadata_lock:
+                    cached = self._columns_cache.get(table_name)
+                if cached is not None:
+                    return cached
+
+                cursor.execute(self._COLUMN_METADATA_QUERY, (table_name,), prepare=True)
+                return self._store_column_metadata(table_name, cursor.fetchall())
         except Exception as e:
             _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener columnas de '{table_name}': {e}")
             return None
-    # _fetch_columns (fin)
+    # _fetch_column_metadata (fin)
+
+    def _application_tables(self) -> List[str]:
+        """
+        Devuelve los nombres de las tablas de la aplicación (utils_db.EnumTablasDB).
+
+        Retorno:
+        - Lista de nombres de tabla.
+        """
+        return [enum_table.value for enum_table in utils_db.EnumTablasDB]
+    # _application_tables (fin)
+
+    def _schema_check_due(self) -> bool:
+        """
+        Indica si toca volver a comprobar la huella del esquema.
+
+        Retorno:
+        - True si nunca se comprobó o si ha pasado el intervalo configurado.
+        """
+        with self._metadata_lock:
+            checked_at = self._schema_checked_at
+        return checked_at is None or time.monotonic() - checked_at >= utils_db.SCHEMA_CHECK_INTERVAL_DB
+    # _schema_check_due (fin)
+
+    def _apply_schema_fingerprint(self, fingerprint: Optional[str]) -> None:
+        """
+        Registra la huella del esquema y vacía la caché de metadatos si ha cambiado.
+
+        Parámetros:
+        - fingerprint: Huella devuelta por _SCHEMA_FINGERPRINT_QUERY.
+        """
+        with self._metadata_lock:
+            if fingerprint != self._schema_fingerprint:
+                self._columns_cache.clear()
+                self._schema_fingerprint = fingerprint
+            self._schema_checked_at = time.monotonic()
+    # _apply_schema_fingerprint (fin)
+
+    def _store_column_metadata(self, table_name: str, rows: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+        """
+        Guarda en caché los metadatos de columnas de una tabla.
+
+        Parámetros:
+        - table_name: Nombre de la tabla.
+        - rows: Filas (column_name, data_type) en orden.
+
+        Retorno:
+        - Lista de diccionarios {"name": ..., "type": ...}.
+        """
+        metadata = [{"name": name, "type": data_type} for name, data_type in rows]
+        with self._metadata_lock:
+            self._columns_cache[table_name] = metadata
+        return metadata
+    # _store_column_metadata (fin)
+
+    def _invalidate_metadata_cache(self) -> None:
+        """
+        Vacía la caché de metadatos para que la próxima consulta los vuelva a leer del catálogo.
+        """
+        with self._metadata_lock:
+            self._columns_cache.clear()
+            self._schema_fingerprint = None
+            self._schema_checked_at = None
+    # _invalidate_metadata_cache (fin)
+
+    @staticmethod
+    def _uses_full_text(search_text: str, search_mode: utils_db.EnumModosBusqueda) -> bool:
+        """
+        Indica si el texto del filtro se busca con texto completo (y los resultados van por relevancia).
+
+        El modo llega como argumento en cada consulta (no es estado del modelo): quien lanza la
+        consulta lo fija al crearla, y un cambio de modo posterior no altera las que estén en curso.
+
+        Parámetros:
+        - search_text: Texto del filtro.
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - True si el modo es de texto completo y el texto contiene alguna palabra.
+        """
+        return (search_mode == utils_db.EnumModosBusqueda.TEXTO_COMPLETO
+                and bool(QueryBuilder._text_query(search_text)))
+    # _uses_full_text (fin)
+
+    def _filter_builder(self, search_text: str, genre_id: Optional[int],
+                        search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA) -> QueryBuilder:
+        """
+        Crea una consulta sobre 'videojuegos' con las condiciones del filtro.
+
+        En modo subcadena, el texto se busca con ILIKE en las columnas de
+        utils_db.SEARCH_COLUMNS_VIDEOJUEGOS y en el nombre del género
+        (utils_db.SEARCH_LOOKUPS_VIDEOJUEGOS), todos respaldados por índices de trigramas; en modo
+        de texto completo, en la columna tsvector utils_db.FULL_TEXT_COLUMN_VIDEOJUEGOS (índice
+        GIN). El género se filtra por la clave foránea id_genero (calificada, para que la condición
+        sirva también cuando se une 'generos').
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - QueryBuilder con los filtros, sin proyección ni ordenación.
+        """
+        videojuegos = utils_db.EnumTablasDB.VIDEOJUEGOS.value
+        builder = QueryBuilder(videojuegos)
+        if self._uses_full_text(search_text, search_mode):
+            builder._where_text_search(utils_db.FULL_TEXT_COLUMN_VIDEOJUEGOS, utils_db.FULL_TEXT_CONFIG_DB, search_text)
+        elif search_text:
+            builder._where_ilike_any(utils_db.SEARCH_COLUMNS_VIDEOJUEGOS, search_text, utils_db.SEARCH_LOOKUPS_VIDEOJUEGOS)
+        if genre_id is not None:
+            builder._where_equals(f"{videojuegos}.id_genero", genre_id)
+        return builder
+    # _filter_builder (fin)
+
+    @staticmethod
+    def _normalize_search_text(text: str) -> str:
+        """
+        Normaliza un texto para la búsqueda en memoria: minúsculas (casefold) y sin tildes ni diacríticos.
+
+        Parámetros:
+        - text (str): Texto original.
+
+        Retorno:
+        - str: Texto normalizado ("Fútbol" -> "futbol").
+        """
+        decomposed = unicodedata.normalize("NFKD", text.casefold())
+        return "".join(char for char in decomposed if not unicodedata.combining(char))
+    # _normalize_search_text (fin)
+
+    def _add_search_blobs(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Añade a cada fila de 'videojuegos' su texto de búsqueda precalculado (utils_db.SEARCH_BLOB_COLUMN).
+
+        Se calcula una sola vez por fila, al cargarla o al recibir su cambio, con los valores de
+        utils_db.IN_MEMORY_SEARCH_COLUMNS separados por saltos de línea (ninguna consulta los
+        contiene), de modo que filtrar sea un único `in` por fila.
+
+        Parámetros:
+        - rows (list[dict]): Filas del informe (se modifican en el sitio).
+
+        Retorno:
+        - list[dict]: Las mismas filas.
+        """
+        columns = utils_db.IN_MEMORY_SEARCH_COLUMNS
+        for row in rows:
+            row[utils_db.SEARCH_BLOB_COLUMN] = self._normalize_search_text(
+                "\n".join(str(row[column]) for column in columns if row.get(column) is not None))
+        return rows
+    # _add_search_blobs (fin)
+
+    def _report_rows(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Post-procesado común de las filas de 'videojuegos' del informe, sea cual sea la consulta que las trae.
+
+        Con la búsqueda en memoria (utils_db.IN_MEMORY_SEARCH) añade el texto de búsqueda de cada
+        fila, de modo que cualquier fila que llegue al catálogo (carga, páginas, notificaciones o
+        sincronización) lo incluya.
+
+        Parámetros:
+        - rows (list[dict]): Filas leídas (se modifican en el sitio).
+
+        Retorno:
+        - list[dict]: Las mismas filas.
+        """
+        if utils_db.IN_MEMORY_SEARCH:
+            self._add_search_blobs(rows)
+        return rows
+    # _report_rows (fin)
+
+    def _select_report_columns(self, builder: QueryBuilder) -> QueryBuilder:
+        """
+        Proyecta las columnas del informe de 'videojuegos' con el nombre del género ya resuelto.
+
+        Se une 'generos' por su clave (LEFT JOIN, para conservar los videojuegos sin género, que
+        aparecen como "Desconocida"): la vista recibe la columna "genero" sin descargar la tabla
+        de géneros ni recorrer las filas en Python.
+
+        Parámetros:
+        - builder: Consulta sobre 'videojuegos'.
+
+        Retorno:
+        - La misma consulta con la unión y las columnas de utils_db.REPORT_COLUMNS_VIDEOJUEGOS y "genero".
+        """
+        videojuegos = utils_db.EnumTablasDB.VIDEOJUEGOS.value
+        generos = utils_db.EnumTablasDB.GENEROS.value
+        return (builder
+                ._join(generos, f"{videojuegos}.id_genero", f"{generos}.id_genero", outer=True)
+                ._select(*utils_db.REPORT_COLUMNS_VIDEOJUEGOS)
+                ._select_as(f"{generos}.nombre_genero", "genero", default="Desconocida"))
+    # _select_report_columns (fin)
+
+    def _build_filtered_query(self, search_text: str, genre_id: Optional[int], after_key: Optional[Any] = None,
+                              limit: Optional[int] = None, keys: Optional[List[Any]] = None,
+                              search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA
+                              ) -> Tuple[sql.Composable, List[Any]]:
+        """
+        Construye la consulta parametrizada que filtra 'videojuegos' en el servidor.
+
+        Solo se proyectan las columnas de utils_db.REPORT_COLUMNS_VIDEOJUEGOS y el nombre del género.
+        Con búsqueda de texto completo, las filas se ordenan por relevancia (ts_rank) y solo se
+        devuelven las utils_db.FULL_TEXT_TOP_N_DB primeras; en otro caso, se ordenan por código.
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - after_key: Código del último videojuego recibido, para pedir la página siguiente (keyset).
+        - limit: Número máximo de filas (None para todas).
+        - keys: Códigos concretos a los que se limita la consulta (None para no limitar).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Tupla (consulta, parámetros).
+        """
+        primary_key = utils_db.PRIMARY_KEYS_DB[utils_db.EnumTablasDB.VIDEOJUEGOS.value]
+        builder = self._select_report_columns(self._filter_builder(search_text, genre_id, search_mode))
+        if keys is not None:
+            builder._where_in(primary_key, keys)
+        if self._uses_full_text(search_text, search_mode):
+            builder._order_by_rank(utils_db.FULL_TEXT_COLUMN_VIDEOJUEGOS, utils_db.FULL_TEXT_CONFIG_DB, search_text)
+            if keys is None:
+                limit = min(limit or utils_db.FULL_TEXT_TOP_N_DB, utils_db.FULL_TEXT_TOP_N_DB)
+        elif after_key is not None:
+            builder._where_after([primary_key], [after_key])
+        return self._registered("videojuegos_filtrados", builder._order_by(primary_key)._limit(limit))
+    # _build_filtered_query (fin)
+
+    def _build_summary_query(self, search_text: str, genre_id: Optional[int],
+                             search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA) -> Tuple[sql.Composable, List[Any]]:
+        """
+        Construye la consulta agregada (recuento, suma, mínimo, máximo y media de ventas) del filtro activo.
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Tupla (consulta, parámetros).
+        """
+        builder = (self._filter_builder(search_text, genre_id, search_mode)
+                   ._aggregate("COUNT", alias="total")
+                   ._aggregate("SUM", "ventas", alias="suma", default=0)
+                   ._aggregate("MIN", "ventas", alias="minimo")
+                   ._aggregate("MAX", "ventas", alias="maximo")
+                   ._aggregate("AVG", "ventas", alias="media"))
+        return self._registered("resumen_videojuegos", builder)
+    # _build_summary_query (fin)
+
+    def _build_top_sales_query(self, search_text: str, genre_id: Optional[int],
+                               search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA) -> Tuple[sql.Composable, List[Any]]:
+        """
+        Construye la consulta de los utils_db.CHART_TOP_N_DB videojuegos más vendidos del filtro activo.
+
+        Alimenta el gráfico de ventas por título, que así no depende de las filas cargadas en la tabla.
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Tupla (consulta, parámetros).
+        """
+        primary_key = utils_db.PRIMARY_KEYS_DB[utils_db.EnumTablasDB.VIDEOJUEGOS.value]
+        builder = (self._filter_builder(search_text, genre_id, search_mode)
+                   ._select("titulo", "ventas")
+                   ._order_by("ventas", descending=True)
+                   ._order_by(primary_key)
+                   ._limit(utils_db.CHART_TOP_N_DB))
+        return self._registered("mas_vendidos", builder)
+    # _build_top_sales_query (fin)
+
+    def _summary_from_row(self, row: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Normaliza la fila devuelta por la consulta agregada a tipos de Python.
+
+        Parámetros:
+        - row: Fila con las claves total, suma, minimo, maximo y media (o None).
+
+        Retorno:
+        - Diccionario con "total" (int), "suma" (int), "minimo"/"maximo" (int | None) y "media" (float | None).
+        """
+        if not row:
+            return {"total": 0, "suma": 0, "minimo": None, "maximo": None, "media": None}
+        return {
+            "total": int(row["total"]),
+            "suma": int(row["suma"]),
+            "minimo": row["minimo"],
+            "maximo": row["maximo"],
+            "media": float(row["media"]) if row["media"] is not None else None
+        }
+    # _summary_from_row (fin)
+
+    def _fetch_summary(self, search_text: str = "", genre_id: Optional[int] = None,
+                       search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA) -> Optional[Dict[str, Any]]:
+        """
+        Calcula en PostgreSQL el resumen de ventas de los videojuegos que cumplen el filtro.
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Diccionario con "total", "suma", "minimo", "maximo" y "media".
+        - None si ocurre un error.
+        """
+        try:
+            query, params = self._build_summary_query(search_text, genre_id, search_mode)
+            with self._db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                cursor.execute(query, params, prepare=True)
+                return self._summary_from_row(cursor.fetchone())
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al calcular el resumen: {e}")
+            return None
+    # _fetch_summary (fin)
+
+    def _fetch_top_sales(self, search_text: str = "", genre_id: Optional[int] = None,
+                         search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA) -> Optional[List[Dict[str, Any]]]:
+        """
+        Obtiene los videojuegos más vendidos que cumplen el filtro (para el gráfico de ventas por título).
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Lista de filas con "titulo" y "ventas", de más a menos vendido.
+        - None si ocurre un error.
+        """
+        try:
+            query, params = self._build_top_sales_query(search_text, genre_id, search_mode)
+            with self._db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                cursor.execute(query, params, prepare=True)
+                return cursor.fetchall()
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener los más vendidos: {e}")
+            return None
+    # _fetch_top_sales (fin)
+
+    def _fetch_filtered(self, search_text: str = "", genre_id: Optional[int] = None,
+                        after_key: Optional[Any] = None, limit: Optional[int] = None,
+                        search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA) -> Optional[List[Dict[str, Union[str, int, float]]]]:
+        """
+        Obtiene solo los videojuegos que cumplen el filtro de texto y género, filtrando en PostgreSQL.
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - after_key: Código del último videojuego recibido, para pedir la página siguiente (keyset).
+        - limit: Número máximo de filas (None para todas).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Lista de registros coincidentes como diccionarios clave-valor (vacía si no hay coincidencias).
+        - None si ocurre un error.
+        """
+        if after_key is not None and self._uses_full_text(search_text, search_mode):
+            return []  # Solo se devuelven los resultados más relevantes, sin páginas siguientes
+        try:
+            query, params = self._build_filtered_query(search_text, genre_id, after_key, limit, search_mode=search_mode)
+            with self._db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                cursor.execute(query, params, prepare=True)
+                return self._report_rows(cursor.fetchall())
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al filtrar videojuegos: {e}")
+            return None
+    # _fetch_filtered (fin)
+
+    def _fetch_by_keys(self, keys: List[Any], search_text: str = "",
+                       genre_id: Optional[int] = None,
+                       search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA
+                       ) -> Optional[List[Dict[str, Union[str, int, float]]]]:
+        """
+        Obtiene los videojuegos indicados que siguen cumpliendo el filtro activo.
+
+        Se usa al recibir notificaciones de cambios: los códigos que no aparezcan en el
+        resultado se han borrado o han dejado de cumplir el filtro.
+
+        Parámetros:
+        - keys: Códigos de los videojuegos modificados.
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Lista de registros como diccionarios clave-valor.
+        - None si ocurre un error.
+        """
+        if not keys:
+            return []
+        try:
+            query, params = self._build_filtered_query(search_text, genre_id, keys=keys, search_mode=search_mode)
+            with self._db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                cursor.execute(query, params, prepare=True)
+                return self._report_rows(cursor.fetchall())
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener los videojuegos modificados: {e}")
+            return None
+    # _fetch_by_keys (fin)
+
+    def _fetch_batch(self, statements: List[Tuple[Union[str, sql.Composable], Sequence[Any]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Ejecuta varias consultas en modo pipeline: se envían todas juntas y sus resultados vuelven
+        en un único viaje de ida y vuelta al servidor.
+
+        Las consultas se ejecutan en orden dentro de la misma transacción; si una falla,
+        las siguientes no se ejecutan y se lanza la excepción.
+
+        Parámetros:
+        - statements: Lista de pares (consulta, parámetros).
+
+        Retorno:
+        - Lista con las filas (diccionarios clave-valor) de cada consulta, en el mismo orden.
+        """
+        with self._db_manager.connection() as connection:
+            cursors = []
+            try:
+                with connection.pipeline():
+                    for query, params in statements:
+                        cursor = connection.cursor(row_factory=psycopg.rows.dict_row)
+                        cursors.append(cursor)
+                        cursor.execute(query, params, prepare=self._statements._prepares(query))
+                # Al salir del bloque pipeline ya se han recibido todos los resultados
+                return [cursor.fetchall() for cursor in cursors]
+            finally:
+                for cursor in cursors:
+                    cursor.close()
+    # _fetch_batch (fin)
+
+    async def _fetch_batch_async(self, statements: List[Tuple[Union[str, sql.Composable], Sequence[Any]]]) -> List[List[Dict[str, Any]]]:
+        """
+        Versión asíncrona de _fetch_batch (modo pipeline sobre una conexión del pool asíncrono).
+
+        Parámetros:
+        - statements: Lista de pares (consulta, parámetros).
+
+        Retorno:
+        - Lista con las filas de cada consulta, en el mismo orden.
+        """
+        async with self._async_db_manager.connection() as connection:
+            cursors = []
+            try:
+                async with connection.pipeline():
+                    for query, params in statements:
+                        cursor = connection.cursor(row_factory=psycopg.rows.dict_row)
+                        cursors.append(cursor)
+                        await cursor.execute(query, params, prepare=self._statements._prepares(query))
+                return [await cursor.fetchall() for cursor in cursors]
+            finally:
+                for cursor in cursors:
+                    await cursor.close()
+    # _fetch_batch_async (fin)
+
+    def _report_statements(self, search_text: str, genre_id: Optional[int], limit: int, include_columns: bool,
+                           include_genres: bool, search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA
+                           ) -> Tuple[List[Tuple[Union[str, sql.Composable], Sequence[Any]]], List[str]]:
+        """
+        Prepara las consultas necesarias para pintar el informe de videojuegos.
+
+        Parámetros:
+        - search_text: Texto del filtro.
+        - genre_id: Género del filtro (None para todos).
+        - limit: Tamaño de la primera página.
+        - include_columns: Si es True, se incluyen las columnas de 'videojuegos' (solo se consultan
+          si no están en caché o toca comprobar la huella del esquema).
+        - include_genres: Si es True, se incluye la tabla 'generos' (para rellenar el selector de género).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Tupla (lista de pares (consulta, parámetros), nombre de cada resultado en el mismo orden).
+        """
+        videojuegos = utils_db.EnumTablasDB.VIDEOJUEGOS.value
+        statements: List[Tuple[Union[str, sql.Composable], Sequence[Any]]] = []
+        names: List[str] = []
+
+        # El sello va primero: lo que cambie mientras se leen los datos se recibe en la siguiente sincronización
+        statements.append((self._CURRENT_STAMP_QUERY, ()))
+        names.append("stamp")
+
+        if include_columns:
+            if self._schema_check_due():
+                statements.append((self._SCHEMA_FINGERPRINT_QUERY, (self._application_tables(),)))
+                names.append("fingerprint")
+            with self._metadata_lock:
+                cached = videojuegos in self._columns_cache
+            if "fingerprint" in names or not cached:
+                statements.append((self._COLUMN_METADATA_QUERY, (videojuegos,)))
+                names.append("columns")
+
+        statements.append(self._build_filtered_query(search_text, genre_id, limit=limit, search_mode=search_mode))
+        names.append("rows")
+        if include_genres:
+            statements.append((self._table_query(utils_db.EnumTablasDB.GENEROS.value), ()))
+            names.append("genres")
+        statements.append(self._build_summary_query(search_text, genre_id, search_mode))
+        names.append("summary")
+        statements.append(self._build_top_sales_query(search_text, genre_id, search_mode))
+        names.append("top_sales")
+        return statements, names
+    # _report_statements (fin)
+
+    def _report_from_results(self, names: List[str], results: List[List[Dict[str, Any]]],
+                             include_columns: bool, columnar: bool = False) -> Dict[str, Any]:
+        """
+        Interpreta los resultados de las consultas preparadas por _report_statements.
+
+        Parámetros:
+        - names: Nombre de cada resultado.
+        - results: Filas de cada consulta, en el mismo orden.
+        - include_columns: Si se pidieron las columnas de 'videojuegos'.
+        - columnar: Si es True, devuelve además las filas en un ColumnarStore.
+
+        Retorno:
+        - Diccionario con "stamp", "columns" y "genres" (None si no se pidieron), "rows", "summary",
+          "top_sales" y "store" (None si no se pidió).
+        """
+        videojuegos = utils_db.EnumTablasDB.VIDEOJUEGOS.value
+        by_name = dict(zip(names, results))
+
+        if "fingerprint" in by_name:
+            self._apply_schema_fingerprint(next(iter(by_name["fingerprint"][0].values())))
+        columns = None
+        if include_columns:
+            if "columns" in by_name:
+                metadata = self._store_column_metadata(
+                    videojuegos, [(row["column_name"], row["data_type"]) for row in by_name["columns"]])
+            else:
+                with self._metadata_lock:
+                    metadata = self._columns_cache[videojuegos]
+            columns = [column["name"] for column in metadata]
+
+        summary_rows = by_name["summary"]
+        rows = self._report_rows(by_name["rows"])
+        return {
+            "stamp": int(by_name["stamp"][0]["sello"]),
+            "columns": columns,
+            "rows": rows,
+            "genres": by_name.get("genres"),
+            "summary": self._summary_from_row(summary_rows[0] if summary_rows else None),
+            "top_sales": by_name["top_sales"],
+            "store": ColumnarStore(rows) if columnar else None,
+        }
+    # _report_from_results (fin)
+
+    def _fetch_report(self, search_text: str = "", genre_id: Optional[int] = None,
+                      limit: int = utils_db.PAGE_SIZE_DB, include_columns: bool = False,
+                      include_genres: bool = False, columnar: bool = False,
+                      search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene en un único viaje al servidor (modo pipeline) todo lo necesario para pintar el informe:
+        sello de cambio, columnas y géneros (opcionales), primera página filtrada, resumen y más vendidos.
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - limit: Tamaño de la primera página.
+        - include_columns: Si es True, incluye las columnas de 'videojuegos' en "columns".
+        - include_genres: Si es True, incluye las filas de 'generos' en "genres".
+        - columnar: Si es True, incluye las filas como arrays de NumPy en "store" (ColumnarStore).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Diccionario con "stamp", "columns", "rows", "genres", "summary", "top_sales" y "store".
+        - None si ocurre un error.
+        """
+        try:
+            statements, names = self._report_statements(
+                search_text, genre_id, limit, include_columns, include_genres, search_mode)
+            return self._report_from_results(names, self._fetch_batch(statements), include_columns, columnar)
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener los datos del informe: {e}")
+            return None
+    # _fetch_report (fin)
+
+    def _fetch_current_stamp(self) -> Optional[int]:
+        """
+        Obtiene el sello de cambio más reciente asignado (punto de partida de la sincronización).
+
+        Debe pedirse antes de leer los datos: lo que cambie entre ambas lecturas se vuelve a
+        recibir en la siguiente sincronización, y aplicarlo dos veces no tiene efecto.
+
+        Retorno:
+        - int: Último valor de la secuencia de sellos (0 si aún no se ha usado).
+        - None si ocurre un error.
+        """
+        try:
+            with self._db_manager.connection() as connection, connection.cursor() as cursor:
+                cursor.execute(self._CURRENT_STAMP_QUERY, prepare=True)
+                return int(cursor.fetchone()[0])
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener el sello de cambios: {e}")
+            return None
+    # _fetch_current_stamp (fin)
+
+    def _fetch_changes_since(self, table_name: str, stamp: int, search_text: str = "",
+                             genre_id: Optional[int] = None,
+                             search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA
+                             ) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene solo las filas insertadas, modificadas o borradas después de un sello de cambio.
+
+        Para 'videojuegos', cada fila indica además si cumple el filtro indicado, de modo que el
+        cliente pueda quitar las que han dejado de cumplirlo. Una transacción que tome su sello
+        antes que otra pero confirme después puede quedar fuera de una sincronización; las
+        notificaciones de cambios (LISTEN/NOTIFY) cubren ese caso mientras la vista está abierta.
+
+        Parámetros:
+        - table_name: Tabla a sincronizar ('videojuegos' o 'ventas').
+        - stamp: Último sello recibido por el cliente.
+        - search_text: Texto del filtro activo (solo 'videojuegos').
+        - genre_id: Género del filtro activo (solo 'videojuegos').
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Diccionario con "rows" (filas que cumplen el filtro), "removed" (claves borradas o que ya no
+          cumplen el filtro; las borradas llegan como texto) y "stamp" (nuevo sello del cliente).
+        - None si la tabla no es válida o si ocurre un error.
+        """
+        if not self._validate_table_name(table_name) or table_name not in (
+                utils_db.EnumTablasDB.VIDEOJUEGOS.value, utils_db.EnumTablasDB.VENTAS.value):
+            _printv2(show_popup=False, parent=self._popup_parent,
+                     message=f"La tabla '{table_name}' no admite sincronización incremental.")
+            return None
+
+        primary_key = utils_db.PRIMARY_KEYS_DB[table_name]
+        stamp_column = utils_db.CHANGE_STAMP_COLUMN_DB
+        changed_builder = QueryBuilder(table_name)
+        if table_name == utils_db.EnumTablasDB.VIDEOJUEGOS.value:
+            self._select_report_columns(changed_builder)._select(stamp_column)
+            filter_builder = self._filter_builder(search_text, genre_id, search_mode)
+        else:
+            changed_builder._select("*")
+            filter_builder = QueryBuilder(table_name)  # El filtro solo se aplica a 'videojuegos'
+
+        changed_query, changed_params = self._registered("cambios", (
+            changed_builder._select_match(filter_builder, "coincide_filtro")
+            ._where_after([stamp_column], [stamp])._order_by(stamp_column)))
+        deleted_query, deleted_params = self._registered("borrados", (
+            QueryBuilder(utils_db.CHANGE_TOMBSTONES_TABLE_DB)._select("clave", stamp_column)
+            ._where_equals("tabla", table_name)._where_after([stamp_column], [stamp])))
+
+        try:
+            with self._db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                cursor.execute(changed_query, changed_params, prepare=self._statements._prepares(changed_query))
+                changed = cursor.fetchall()
+                cursor.execute(deleted_query, deleted_params, prepare=True)
+                deleted = cursor.fetchall()
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener los cambios de '{table_name}': {e}")
+            return None
+
+        new_stamp = max([stamp] + [row[utils_db.CHANGE_STAMP_COLUMN_DB] for row in changed + deleted])
+        rows: List[Dict[str, Any]] = []
+        removed: List[Any] = []
+        for row in changed:
+            if row.pop("coincide_filtro"):
+                rows.append(row)
+            else:
+                removed.append(row[primary_key])  # Ya no cumple el filtro
+
+        # Borradas, salvo que se hayan vuelto a insertar después
+        present_keys = {str(row[primary_key]) for row in changed}
+        removed += [row["clave"] for row in deleted if row["clave"] not in present_keys]
+        if table_name == utils_db.EnumTablasDB.VIDEOJUEGOS.value:
+            self._report_rows(rows)
+        return {"rows": rows, "removed": removed, "stamp": new_stamp}
+    # _fetch_changes_since (fin)
+
+    def _prune_change_tombstones(self, retention_hours: int = utils_db.CHANGE_TOMBSTONES_RETENTION_HOURS) -> Optional[int]:
+        """
+        Elimina de 'cambios_borrados' las lápidas que ya no necesita ningún cliente.
+
+        Un informe abierto sincroniza cada utils_db.SYNC_INTERVAL_MS, así que su sello nunca es
+        anterior a una lápida de más de retention_hours horas; las lápidas con un sello menor o
+        igual que el de la última de ellas se pueden borrar sin que se pierdan borrados.
+
+        Parámetros:
+        - retention_hours: Horas que se conserva cada lápida.
+
+        Retorno:
+        - Número de lápidas eliminadas.
+        - None si ocurre un error.
+        """
+        tables = [utils_db.EnumTablasDB.VIDEOJUEGOS.value, utils_db.EnumTablasDB.VENTAS.value]
+        try:
+            with self._db_manager.connection() as connection:
+                with connection.transaction(), connection.cursor() as cursor:
+                    cursor.execute(self._PRUNE_TOMBSTONES_QUERY, (tables, retention_hours))
+                    return cursor.rowcount
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al podar las lápidas de borrados: {e}")
+            return None
+    # _prune_change_tombstones (fin)
+
+    def _refresh_sales_rollups(self) -> bool:
+        """
+        Actualiza todos los resúmenes materializados de 'ventas' con REFRESH MATERIALIZED VIEW CONCURRENTLY.
+
+        La actualización concurrente no bloquea a quien esté leyendo los resúmenes. Se toma un bloqueo
+        consultivo para que, si otro cliente ya los está actualizando, esta llamada no repita el trabajo.
+        Conviene llamarlo también después de cargas masivas en 'ventas'.
+
+        Retorno:
+        - True si se actualizaron; False si otro cliente los estaba actualizando o si ocurre un error.
+        """
+        try:
+            with self._db_manager.connection() as connection:
+                with connection.transaction(), connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_try_advisory_xact_lock(%s);", (utils_db.ROLLUP_REFRESH_LOCK_ID,))
+                    if not cursor.fetchone()[0]:
+                        return False  # Otro cliente los está actualizando
+                    for rollup in utils_db.EnumResumenesVentas:
+                        cursor.execute(sql.SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY {};").format(
+                            sql.Identifier(rollup.value)))
+            return True
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al actualizar los resúmenes de ventas: {e}")
+            return False
+    # _refresh_sales_rollups (fin)
+
+    def _fetch_sales_series(self, bucket: str = utils_db.EnumPeriodos.MES.value, date_from: Optional[date] = None,
+                            date_to: Optional[date] = None, search_text: str = "",
+                            genre_id: Optional[int] = None,
+                            search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA
+                            ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Obtiene la serie temporal de unidades vendidas, agrupadas por periodo en PostgreSQL (date_trunc).
+
+        El rango se aplica directamente sobre 'ventas.fecha_venta' (sin funciones ni conversiones
+        sobre la columna), de modo que PostgreSQL solo lee las particiones mensuales del rango
+        (migración 0006_particiones_ventas.sql) y dentro de ellas usa el índice BRIN de la fecha o,
+        si hay filtro de videojuegos, el índice (codigo_videojuego, fecha_venta). Sin filtro de
+        videojuegos, los periodos diarios y mensuales se leen de los resúmenes materializados
+        (actualizados cada utils_db.ROLLUP_REFRESH_INTERVAL_MS), que tienen una fila por periodo.
+
+        Parámetros:
+        - bucket: Periodo de agrupación (valor de utils_db.EnumPeriodos).
+        - date_from: Primer día incluido (None para no limitar).
+        - date_to: Último día incluido (None para no limitar).
+        - search_text: Texto del filtro de videojuegos (vacío para no filtrar).
+        - genre_id: Género del filtro de videojuegos (None para todos).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Lista de diccionarios {"periodo": date, "unidades": int} en orden cronológico.
+        - None si ocurre un error.
+        """
+        end = date_to + timedelta(days=1) if date_to is not None else None  # Rango semiabierto [desde, hasta + 1)
+        rollups = {
+            utils_db.EnumPeriodos.DIA.value: utils_db.EnumResumenesVentas.DIA,
+            utils_db.EnumPeriodos.MES.value: utils_db.EnumResumenesVentas.MES,
+        }
+
+        if not search_text and genre_id is None and bucket in rollups:
+            if bucket == utils_db.EnumPeriodos.MES.value and date_from is not None:
+                date_from = date_from.replace(day=1)  # El periodo mensual empieza el día 1
+            builder = (QueryBuilder(rollups[bucket].value)._select("periodo", "unidades")
+                       ._where_range("periodo", date_from, end)._order_by("periodo"))
+        else:
+            ventas = utils_db.EnumTablasDB.VENTAS.value
+            videojuegos = utils_db.EnumTablasDB.VIDEOJUEGOS.value
+            builder = (QueryBuilder(ventas)
+                       ._select_date_trunc(f"{ventas}.fecha_venta", bucket, "periodo")
+                       ._aggregate("SUM", f"{ventas}.cantidad_vendida", alias="unidades", default=0)
+                       ._where_range(f"{ventas}.fecha_venta", date_from, end))
+            if search_text or genre_id is not None:
+                builder._join(videojuegos, f"{ventas}.codigo_videojuego", f"{videojuegos}.codigo")
+                builder._where_all(self._filter_builder(search_text, genre_id, search_mode))
+            builder._group_by("periodo")._order_by("periodo")
+        query, params = self._registered("serie_ventas", builder)
+
+        try:
+            with self._db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                cursor.execute(query, params, prepare=True)
+                return [{"periodo": row["periodo"], "unidades": int(row["unidades"])} for row in cursor.fetchall()]
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener la serie de ventas: {e}")
+            return None
+    # _fetch_sales_series (fin)
+
+    def _maintain_sales_partitions(self, months_ahead: int = utils_db.SALES_PARTITION_MONTHS_AHEAD,
+                                   retention_months: int = utils_db.SALES_PARTITION_RETENTION_MONTHS
+                                   ) -> Optional[Dict[str, Any]]:
+        """
+        Crea por adelantado las particiones mensuales de 'ventas' y separa las que superan la retención.
+
+        También crea las particiones de los meses con filas en la partición DEFAULT (ventas_default),
+        que se trasladan a ellas (función crear_particion_ventas de la migración 0008).
+
+        Parámetros:
+        - months_ahead: Meses siguientes al actual que deben tener partición.
+        - retention_months: Meses completos anteriores al actual que se conservan (0 para conservarlos todos).
+
+        Retorno:
+        - Diccionario {"created": número de particiones creadas, "detached": tablas separadas}.
+        - None si ocurre un error.
+        """
+        detached: List[str] = []
+        try:
+            with self._db_manager.connection() as connection:
+                with connection.transaction(), connection.cursor() as cursor:
+                    cursor.execute("SELECT crear_particiones_ventas(%s);", (months_ahead,))
+                    created = cursor.fetchone()[0]
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al crear las particiones de ventas: {e}")
+            return None
+
+        if retention_months > 0:
+            first_month = date.today().replace(day=1)
+            months = first_month.year * 12 + first_month.month - 1 - retention_months
+            detached = self._detach_sales_partitions(date(months // 12, months % 12 + 1, 1))
+            if detached is None:
+                return None
+        return {"created": created, "detached": detached}
+    # _maintain_sales_partitions (fin)
+
+    def _detach_sales_partitions(self, before: date) -> Optional[List[str]]:
+        """
+        Separa de 'ventas' las particiones de los meses que terminan antes de una fecha.
+
+        Las particiones separadas se renombran a archivo_ventas_AAAA_MM y conservan sus filas,
+        listas para exportarlas o eliminarlas; los informes dejan de leerlas.
+
+        Parámetros:
+        - before: Fecha límite (se separan los meses completos anteriores).
+
+        Retorno:
+        - Lista con los nombres de las tablas separadas.
+        - None si ocurre un error.
+        """
+        try:
+            with self._db_manager.connection() as connection:
+                with connection.transaction(), connection.cursor() as cursor:
+                    cursor.execute("SELECT separar_particiones_ventas(%s);", (before,))
+                    return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al separar las particiones de ventas: {e}")
+            return None
+    # _detach_sales_partitions (fin)
+
+    def _listen_changes(self, callback: Callable[[Dict[str, Any]], None]) -> bool:
+        """
+        Suscribe una función a las notificaciones de cambios de 'videojuegos' y 'ventas'.
+
+        Parámetros:
+        - callback: Función que recibe cada notificación (se llama desde el hilo de escucha).
+
+        Retorno:
+        - True si el gestor admite notificaciones y la suscripción se realizó.
+        """
+        if not utils_db.USE_NOTIFY_DB or not hasattr(self._db_manager, "add_notification_listener"):
+            return False
+        self._db_manager.add_notification_listener(callback)
+        return True
+    # _listen_changes (fin)
+
+    def _unlisten_changes(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Cancela la suscripción realizada con _listen_changes.
+
+        Parámetros:
+        - callback: Función suscrita anteriormente.
+        """
+        if hasattr(self._db_manager, "remove_notification_listener"):
+            self._db_manager.remove_notification_listener(callback)
+    # _unlisten_changes (fin)
 
     def _get_model(self, table_name: str) -> Optional[Dict[str, Union[List[str], List[Dict[str, Union[str, int, float]]]]]]:
         """
@@ -130,6 +1215,215 @@ class ReportModel:
             return None
     # _get_model (fin)
 
+    def _has_async_manager(self) -> bool:
+        """
+        Indica si el modelo dispone de un AsyncManagerDB abierto para las consultas asíncronas.
+
+        Retorno:
+        - True si se pueden usar los métodos *_async, False en caso contrario.
+        """
+        return self._async_db_manager is not None and self._async_db_manager.is_open()
+    # _has_async_manager (fin)
+
+    def _run_async(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """
+        Ejecuta una corrutina del modelo en el bucle de eventos de AsyncManagerDB.
+
+        Parámetros:
+        - coro: Corrutina a ejecutar (p. ej. self._get_model_async(...)).
+
+        Retorno:
+        - concurrent.futures.Future con el resultado de la corrutina.
+        """
+        return self._async_db_manager._run_coroutine(coro)
+    # _run_async (fin)
+
+    async def _fetch_data_async(self, table_name: str,
+                                columns: Optional[List[str]] = None) -> Optional[List[Dict[str, Union[str, int, float]]]]:
+        """
+        Versión asíncrona de _fetch_data basada en psycopg.AsyncConnection.
+
+        Parámetros:
+        - table_name: Nombre de la tabla en PostgreSQL.
+        - columns: Columnas a traer (None para todas).
+
+        Retorno:
+        - Lista de registros obtenidos como diccionarios clave-valor.
+        - None si ocurre un error.
+        """
+        if not self._validate_table_name(table_name):
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Tabla '{table_name}' no es válida.")
+            return None
+
+        try:
+            query = self._table_query(table_name, columns)
+            async with self._async_db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                await cursor.execute(query, prepare=self._statements._prepares(query))
+                return await cursor.fetchall()
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener datos de '{table_name}': {e}")
+            return None
+    # _fetch_data_async (fin)
+
+    async def _fetch_columns_async(self, table_name: str) -> Optional[List[str]]:
+        """
+        Versión asíncrona de _fetch_columns (comparte la caché de metadatos).
+
+        Parámetros:
+        - table_name: Nombre de la tabla en PostgreSQL.
+
+        Retorno:
+        - Lista de nombres de las columnas.
+        - None si ocurre un error.
+        """
+        if not self._validate_table_name(table_name):
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Tabla '{table_name}' no es válida.")
+            return None
+
+        try:
+            async with self._async_db_manager.connection() as connection, connection.cursor() as cursor:
+                if self._schema_check_due():
+                    await cursor.execute(self._SCHEMA_FINGERPRINT_QUERY, (self._application_tables(),), prepare=True)
+                    self._apply_schema_fingerprint((await cursor.fetchone())[0])
+
+                with self._metadata_lock:
+                    metadata = self._columns_cache.get(table_name)
+                if metadata is None:
+                    await cursor.execute(self._COLUMN_METADATA_QUERY, (table_name,), prepare=True)
+                    metadata = self._store_column_metadata(table_name, await cursor.fetchall())
+                return [column["name"] for column in metadata]
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener columnas de '{table_name}': {e}")
+            return None
+    # _fetch_columns_async (fin)
+
+    async def _fetch_filtered_async(self, search_text: str = "", genre_id: Optional[int] = None,
+                              after_key: Optional[Any] = None, limit: Optional[int] = None,
+                              search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA) -> Optional[List[Dict[str, Union[str, int, float]]]]:
+        """
+        Versión asíncrona de _fetch_filtered.
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - after_key: Código del último videojuego recibido, para pedir la página siguiente (keyset).
+        - limit: Número máximo de filas (None para todas).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Lista de registros coincidentes como diccionarios clave-valor.
+        - None si ocurre un error.
+        """
+        if after_key is not None and self._uses_full_text(search_text, search_mode):
+            return []  # Solo se devuelven los resultados más relevantes, sin páginas siguientes
+        try:
+            query, params = self._build_filtered_query(search_text, genre_id, after_key, limit, search_mode=search_mode)
+            async with self._async_db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                await cursor.execute(query, params, prepare=True)
+                return self._report_rows(await cursor.fetchall())
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al filtrar videojuegos: {e}")
+            return None
+    # _fetch_filtered_async (fin)
+
+    async def _fetch_summary_async(self, search_text: str = "", genre_id: Optional[int] = None,
+                                   search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA) -> Optional[Dict[str, Any]]:
+        """
+        Versión asíncrona de _fetch_summary.
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Diccionario con "total", "suma", "minimo", "maximo" y "media".
+        - None si ocurre un error.
+        """
+        try:
+            query, params = self._build_summary_query(search_text, genre_id, search_mode)
+            async with self._async_db_manager.connection() as connection, \
+                    connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
+                await cursor.execute(query, params, prepare=True)
+                return self._summary_from_row(await cursor.fetchone())
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al calcular el resumen: {e}")
+            return None
+    # _fetch_summary_async (fin)
+
+    async def _fetch_report_async(self, search_text: str = "", genre_id: Optional[int] = None,
+                                  limit: int = utils_db.PAGE_SIZE_DB, include_columns: bool = False,
+                                  include_genres: bool = False, columnar: bool = False,
+                                  search_mode: utils_db.EnumModosBusqueda = utils_db.EnumModosBusqueda.SUBCADENA) -> Optional[Dict[str, Any]]:
+        """
+        Versión asíncrona de _fetch_report.
+
+        Parámetros:
+        - search_text: Texto a buscar (vacío para no filtrar por texto).
+        - genre_id: Identificador del género (None para no filtrar por género).
+        - limit: Tamaño de la primera página.
+        - include_columns: Si es True, incluye las columnas de 'videojuegos' en "columns".
+        - include_genres: Si es True, incluye las filas de 'generos' en "genres".
+        - columnar: Si es True, incluye las filas como arrays de NumPy en "store" (ColumnarStore).
+        - search_mode: Modo de búsqueda del texto (utils_db.EnumModosBusqueda).
+
+        Retorno:
+        - Diccionario con "stamp", "columns", "rows", "genres", "summary", "top_sales" y "store".
+        - None si ocurre un error.
+        """
+        try:
+            statements, names = self._report_statements(
+                search_text, genre_id, limit, include_columns, include_genres, search_mode)
+            return self._report_from_results(names, await self._fetch_batch_async(statements), include_columns, columnar)
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener los datos del informe: {e}")
+            return None
+    # _fetch_report_async (fin)
+
+    async def _fetch_current_stamp_async(self) -> Optional[int]:
+        """
+        Versión asíncrona de _fetch_current_stamp.
+
+        Retorno:
+        - int: Último valor de la secuencia de sellos (0 si aún no se ha usado).
+        - None si ocurre un error.
+        """
+        try:
+            async with self._async_db_manager.connection() as connection, connection.cursor() as cursor:
+                await cursor.execute(self._CURRENT_STAMP_QUERY, prepare=True)
+                return int((await cursor.fetchone())[0])
+        except Exception as e:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener el sello de cambios: {e}")
+            return None
+    # _fetch_current_stamp_async (fin)
+
+    async def _get_model_async(self, table_name: str) -> Optional[Dict[str, Union[List[str], List[Dict[str, Union[str, int, float]]]]]]:
+        """
+        Versión asíncrona de _get_model: obtiene columnas y datos a la vez con asyncio.gather.
+
+        Parámetros:
+        - table_name: Nombre de la tabla en PostgreSQL.
+
+        Retorno:
+        - Diccionario con "columns" y "data".
+        - None si ocurre un error.
+        """
+        if not self._validate_table_name(table_name):
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Tabla '{table_name}' no es válida.")
+            return None
+
+        columns, data = await asyncio.gather(
+            self._fetch_columns_async(table_name),
+            self._fetch_data_async(table_name)
+        )
+        if columns is None or data is None:
+            _printv2(show_popup=False, parent=self._popup_parent, message=f"Error al obtener modelo de '{table_name}'.")
+            return None
+        return {"columns": columns, "data": data}
+    # _get_model_async (fin)
+
     def _validate_table_name(self, table_name: str) -> bool:
         """
         Valida si el nombre de la tabla está permitido según la configuración.
@@ -0,0 +1,162 @@
+# Archivo: src/models/search_index.py
+
+from typing import Collection, Dict, Iterable, List, Optional, Set
+from utils import utils_db
+
+
+class SearchIndex:
+    """
+    Índice invertido de n-gramas (trigramas por defecto) para buscar subcadenas en memoria.
+
+    Cada fila se indexa por su texto de búsqueda ya normalizado (utils_db.SEARCH_BLOB_COLUMN,
+    calculado por ReportModel al cargar o recibir la fila), y cada n-grama de ese texto apunta
+    al conjunto de filas que lo contienen (lista de apariciones). Para buscar, se intersecan las
+    listas de los n-gramas de la consulta empezando por la más corta y solo las candidatas que
+    sobreviven se comprueban con `in` (dos textos pueden compartir todos los n-gramas sin que uno
+    contenga al otro). Las consultas más cortas que un n-grama se resuelven recorriendo los
+    textos. Si se conoce el resultado de una consulta contenida en la nueva (p. ej. la anterior
+    al escribir un carácter más), basta con comprobar esas filas.
+
+    Los identificadores de fila los elige quien usa el índice (p. ej. la posición de la fila en
+    el modelo de tabla). El índice se construye una vez al cargar los datos y se actualiza fila a
+    fila con _add, _update y _remove. No es seguro para hilos: se construye en un hilo y después
+    solo lo usa el hilo principal.
+    """
+
+    def __init__(self, ngram_size: int = utils_db.SEARCH_INDEX_NGRAM_SIZE) -> None:
+        """
+        Inicializa el índice vacío.
+
+        Parámetros:
+        - ngram_size (int): Longitud de los n-gramas indexados.
+        """
+        self._ngram_size = ngram_size
+        self._postings: Dict[str, Set[int]] = {}  # n-grama -> filas que lo contienen
+        self._blobs: Dict[int, str] = {}  # fila -> texto de búsqueda normalizado
+    # __init__ (fin)
+
+    def __len__(self) -> int:
+        """
+        Devuelve el número de filas indexadas.
+        """
+        return len(self._blobs)
+    # __len__ (fin)
+
+    def _ngrams(self, text: str) -> Set[str]:
+        """
+        Devuelve los n-gramas distintos de un texto normalizado.
+
+        Parámetros:
+        - text (str): Texto normalizado.
+
+        Retorno:
+        - set[str]: n-gramas del texto (vacío si es más corto que un n-grama).
+        """
+        size = self._ngram_size
+        return {text[start:start + size] for start in range(len(text) - size + 1)}
+    # _ngrams (fin)
+
+    def _add_rows(self, blobs: Iterable[str], first_row_id: int = 0) -> None:
+        """
+        Indexa varias filas con identificadores consecutivos (p. ej. todas las filas al cargar).
+
+        Parámetros:
+        - blobs (Iterable[str]): Texto de búsqueda normalizado de cada fila.
+        - first_row_id (int): Identificador de la primera fila.
+        """
+        for row_id, blob in enumerate(blobs, start=first_row_id):
+            self._add(row_id, blob)
+    # _add_rows (fin)
+
+    def _add(self, row_id: int, blob: str) -> None:
+        """
+        Indexa una fila nueva.
+
+        Parámetros:
+        - row_id (int): Identificador de la fila.
+        - blob (str): Texto de búsqueda normalizado de la fila.
+        """
+        self._blobs[row_id] = blob
+        for ngram in self._ngrams(blob):
+            self._postings.setdefault(ngram, set()).add(row_id)
+    # _add (fin)
+
+    def _remove(self, row_id: int) -> None:
+        """
+        Quita una fila del índice (si no está indexada no hace nada).
+
+        Parámetros:
+        - row_id (int): Identificador de la fila.
+        """
+        blob = self._blobs.pop(row_id, None)
+        if blob is None:
+            return
+        for ngram in self._ngrams(blob):
+            posting = self._postings.get(ngram)
+            if posting is not None:
+                posting.discard(row_id)
+                if not posting:
+                    del self._postings[ngram]
+    # _remove (fin)
+
+    def _update(self, row_id: int, blob: str) -> None:
+        """
+        Vuelve a indexar una fila modificada.
+
+        Parámetros:
+        - row_id (int): Identificador de la fila.
+        - blob (str): Nuevo texto de búsqueda normalizado de la fila.
+        """
+        self._remove(row_id)
+        self._add(row_id, blob)
+    # _update (fin)
+
+    def _search(self, query: str, candidates: Optional[Collection[int]] = None) -> Set[int]:
+        """
+        Devuelve las filas cuyo texto de búsqueda contiene la consulta.
+
+        Parámetros:
+        - query (str): Consulta ya normalizada como los textos (ReportModel._normalize_search_text);
+          vacía para todas las filas.
+        - candidates (Collection[int] | None): Filas entre las que buscar, p. ej. el resultado de
+          una consulta contenida en esta. Si son menos que las de la lista de apariciones más
+          corta, se comprueban directamente sin consultar el índice.
+
+        Retorno:
+        - set[int]: Identificadores de las filas coincidentes.
+        """
+        if not query:
+            return set(self._blobs) if candidates is None else {row_id for row_id in candidates if row_id in self._blobs}
+        if len(query) < self._ngram_size:
+            return self._scan(query, self._blobs if candidates is None else candidates)
+
+        postings: List[Set[int]] = sorted(
+            (self._postings.get(ngram, set()) for ngram in self._ngrams(query)), key=len)
+        if candidates is not None and len(candidates) <= len(postings[0]):
+            return self._scan(query, candidates)
+
+        matches = set(postings[0])
+        if candidates is not None:
+            matches.intersection_update(candidates)
+        for posting in postings[1:]:
+            if not matches:
+                break
+            matches &= posting
+        return self._scan(query, matches)
+    # _search (fin)
+
+    def _scan(self, query: str, row_ids: Iterable[int]) -> Set[int]:
+        """
+        Comprueba una a una qué filas contienen la consulta (un único `in` por fila).
+
+        Parámetros:
+        - query (str): Consulta ya normalizada.
+        - row_ids (Iterable[int]): Filas a comprobar (las que no están indexadas se descartan).
+
+        Retorno:
+        - set[int]: Filas cuyo texto de búsqueda contiene la consulta.
+        """
+        blobs = self._blobs
+        return {row_id for row_id in row_ids if query in blobs.get(row_id, "")}
+    # _scan (fin)
+# SearchIndex (fin)
@@ -0,0 +1,75 @@
+# Archivo: src/models/statement_registry.py
+
+import threading  # El registro se consulta desde varios hilos de QueryRunner
+from typing import Callable, Dict, Hashable, Set, Tuple, Union
+from psycopg import sql
+
+
+class StatementRegistry:
+    """
+    Registro central de las consultas parametrizadas de ReportModel.
+
+    Cada consulta se identifica por un nombre y una "forma" (p. ej. si el filtro lleva texto,
+    género o clave keyset): el texto SQL solo depende de la forma, nunca de los valores, que
+    viajan siempre como parámetros. La consulta se compone una sola vez por forma y después se
+    reutiliza el mismo objeto.
+
+    Las consultas se ejecutan con `prepare=True`: psycopg prepara cada texto SQL una vez por
+    conexión (PostgreSQL no vuelve a analizarlo ni planificarlo) y mantiene la caché de
+    sentencias preparadas de cada conexión. Una conexión nueva (reconexión o reciclado del pool)
+    empieza con la caché vacía, así que la sentencia se vuelve a preparar sola en su primer uso.
+
+    Las consultas cuyas columnas dependen del esquema vivo (p. ej. "SELECT *") se registran sin
+    preparar: tras un ALTER TABLE, PostgreSQL rechaza ejecutar una sentencia preparada cuyo
+    resultado ha cambiado de columnas ("cached plan must not change result type").
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicializa el registro vacío.
+        """
+        self._statements: Dict[Tuple[str, Hashable], Union[str, sql.Composable]] = {}
+        self._unprepared: Set[int] = set()  # id() de las consultas registradas que no se preparan
+        self._lock = threading.Lock()
+    # __init__ (fin)
+
+    def _get(self, name: str, shape: Hashable, builder: Callable[[], Union[str, sql.Composable]],
+             prepare: bool = True) -> Union[str, sql.Composable]:
+        """
+        Devuelve la consulta registrada con ese nombre y forma, componiéndola la primera vez.
+
+        Parámetros:
+        - name (str): Nombre de la consulta (p. ej. "videojuegos_filtrados").
+        - shape (Hashable): Forma de la consulta; dos llamadas con la misma forma deben generar el mismo SQL.
+        - builder (callable): Función sin argumentos que compone la consulta.
+        - prepare (bool): Si es False, la consulta no se prepara (ver _prepares).
+
+        Retorno:
+        - str | sql.Composable: Consulta lista para `cursor.execute(..., prepare=self._prepares(consulta))`.
+        """
+        key = (name, shape)
+        with self._lock:
+            statement = self._statements.get(key)
+        if statement is None:
+            statement = builder()
+            with self._lock:
+                statement = self._statements.setdefault(key, statement)
+                if not prepare:
+                    self._unprepared.add(id(statement))
+        return statement
+    # _get (fin)
+
+    def _prepares(self, statement: Union[str, sql.Composable]) -> bool:
+        """
+        Indica si una consulta debe ejecutarse como sentencia preparada.
+
+        Parámetros:
+        - statement (str | sql.Composable): Consulta devuelta por _get (o una consulta fija fuera del registro).
+
+        Retorno:
+        - bool: False si se registró con prepare=False; True en otro caso.
+        """
+        with self._lock:
+            return id(statement) not in self._unprepared
+    # _prepares (fin)
+# StatementRegistry (fin)
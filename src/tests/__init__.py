@@ -0,0 +1 @@
+# Archivo: src/tests/__init__.py
@@ -0,0 +1,66 @@
+# Archivo: src/tests/test_columnar_store.py
+
+import unittest
+from datetime import date
+import numpy as np
+from models.columnar_store import ColumnarStore
+
+
+class TestColumnarStore(unittest.TestCase):
+    """
+    Pruebas del almacén columnar del catálogo en memoria.
+    """
+
+    def setUp(self) -> None:
+        self.store = ColumnarStore([
+            {"ventas": 5, "genero": "Acción", "plataforma": "PC", "fecha_lanzamiento": date(2020, 1, 2)},
+            {"ventas": None, "genero": "Deportes", "plataforma": "PC", "fecha_lanzamiento": None},
+            {"ventas": 7, "genero": "Acción", "plataforma": "PS5", "fecha_lanzamiento": date(2021, 5, 6)},
+        ])
+
+    def test_values_and_missing_data(self) -> None:
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store._values("ventas", [0, 1, 2]).tolist(), [5, 0, 7])
+        fechas = self.store._values("fecha_lanzamiento", [0, 1])
+        self.assertEqual(fechas[0], np.datetime64("2020-01-02"))
+        self.assertTrue(np.isnat(fechas[1]))
+
+    def test_select_equal_uses_encoded_values(self) -> None:
+        self.assertEqual(self.store._select_equal("genero", "Acción", [2, 1, 0]), [2, 0])
+        self.assertEqual(self.store._select_equal("plataforma", "PC", [0, 1, 2]), [0, 1])
+        self.assertEqual(self.store._select_equal("genero", "Rol", [0, 1, 2]), [])
+        self.assertEqual(self.store._select_equal("genero", "Acción", []), [])
+
+    def test_set_row_overwrites_values(self) -> None:
+        self.store._set_row(1, {"ventas": 3, "genero": "Rol", "plataforma": "Switch"})
+        self.assertEqual(self.store._values("ventas", [1]).tolist(), [3])
+        self.assertEqual(self.store._select_equal("genero", "Rol", [0, 1, 2]), [1])
+        self.assertEqual(self.store._select_equal("genero", "Deportes", [0, 1, 2]), [])
+
+    def test_append_row_grows_capacity(self) -> None:
+        for ventas in range(40):
+            position = self.store._append_row({"ventas": ventas, "genero": "Deportes", "plataforma": "PC"})
+        self.assertEqual(position, 42)
+        self.assertEqual(len(self.store), 43)
+        self.assertEqual(self.store._values("ventas", [0, 3, 42]).tolist(), [5, 0, 39])
+        self.assertEqual(len(self.store._select_equal("genero", "Deportes", range(43))), 41)
+
+    def test_sales_summary(self) -> None:
+        summary = self.store._sales_summary([0, 1, 2])
+        self.assertEqual(summary, {"total": 3, "suma": 12, "minimo": 0, "maximo": 7, "media": 4.0})
+        self.assertIsNone(self.store._sales_summary([]))
+
+    def test_top_rows(self) -> None:
+        self.store._append_row({"ventas": 7, "genero": "Rol", "plataforma": "PC"})
+        self.assertEqual(self.store._top_rows("ventas", [0, 1, 2, 3], 3), [2, 3, 0])
+        self.assertEqual(self.store._top_rows("ventas", [1, 0], 5), [0, 1])
+        self.assertEqual(self.store._top_rows("ventas", [], 3), [])
+
+    def test_empty_store(self) -> None:
+        store = ColumnarStore([])
+        self.assertEqual(store._append_row({"ventas": 1, "genero": "Rol"}), 0)
+        self.assertEqual(store._sales_summary([0])["suma"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
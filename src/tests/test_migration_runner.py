@@ -0,0 +1,61 @@
+# Archivo: src/tests/test_migration_runner.py
+
+import os
+import tempfile
+import unittest
+from models.migration_runner import MigrationRunner
+
+
+class TestMigrationRunner(unittest.TestCase):
+    """
+    Pruebas de la lectura de scripts y del cálculo de migraciones pendientes (sin base de datos).
+    """
+
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self._write("0002_segunda.sql", "SELECT 2;\n")
+        self._write("0001_primera.sql", "SELECT 1;\r\n")
+        self._write("0010_decima.sql", "SELECT 10;\n")
+        self._write("notas.txt", "no es una migración")
+        self.runner = MigrationRunner(db_manager=None, migrations_dir=self._directory.name)
+
+    def _write(self, file_name: str, content: str) -> None:
+        with open(os.path.join(self._directory.name, file_name), "w", encoding="utf-8", newline="") as file:
+            file.write(content)
+
+    def test_load_migrations_sorted_by_version(self) -> None:
+        migrations = self.runner._load_migrations()
+        self.assertEqual([migration["version"] for migration in migrations], [1, 2, 10])
+        self.assertEqual(migrations[0]["name"], "0001_primera.sql")
+
+    def test_checksum_ignores_line_endings(self) -> None:
+        crlf = self.runner._load_migrations()[0]["checksum"]
+        self._write("0001_primera.sql", "SELECT 1;\n")
+        self.assertEqual(self.runner._load_migrations()[0]["checksum"], crlf)
+
+    def test_duplicate_version_raises(self) -> None:
+        self._write("0002_repetida.sql", "SELECT 0;")
+        with self.assertRaises(ValueError):
+            self.runner._load_migrations()
+
+    def test_pending_returns_unapplied_in_order(self) -> None:
+        migrations = self.runner._load_migrations()
+        applied = {2: migrations[1]["checksum"]}
+        pending = self.runner._pending(migrations, applied)
+        self.assertEqual([migration["version"] for migration in pending], [1, 10])
+        self.assertEqual(self.runner._pending(migrations, {m["version"]: m["checksum"] for m in migrations}), [])
+
+    def test_pending_accepts_padded_checksum(self) -> None:
+        migrations = self.runner._load_migrations()
+        applied = {1: migrations[0]["checksum"] + "  "}  # CHAR(64) puede llegar con espacios
+        self.assertEqual(len(self.runner._pending(migrations, applied)), 2)
+
+    def test_pending_raises_on_checksum_mismatch(self) -> None:
+        migrations = self.runner._load_migrations()
+        with self.assertRaises(ValueError):
+            self.runner._pending(migrations, {2: "0" * 64})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# Archivo: src/tests/test_query_builder.py
+
+import unittest
+from psycopg import sql  # Solo para componer el texto; no se conecta
+from models.query_builder import QueryBuilder
+
+
+class TestQueryBuilder(unittest.TestCase):
+    """
+    Pruebas de la composición de consultas (texto SQL, parámetros y forma).
+    """
+
+    @staticmethod
+    def _sql_text(query: sql.Composable) -> str:
+        """
+        Convierte la consulta compuesta en texto sin conexión (adaptadores por defecto).
+        """
+        return query.as_string(None)
+
+    def test_select_filter_order_limit(self) -> None:
+        query, params = (QueryBuilder("videojuegos")
+                         ._select("codigo", "titulo")
+                         ._where_equals("id_genero", 2)
+                         ._where_after(["codigo"], ["A10"])
+                         ._order_by("codigo")
+                         ._limit(200)
+                         ._build())
+        self.assertEqual(
+            self._sql_text(query),
+            'SELECT "codigo", "titulo" FROM "videojuegos" WHERE "id_genero" = %s AND "codigo" > %s '
+            'ORDER BY "codigo" LIMIT %s')
+        self.assertEqual(params, [2, "A10", 200])
+
+    def test_ilike_escapes_wildcards(self) -> None:
+        _, params = QueryBuilder("videojuegos")._where_ilike_any(["titulo", "descripcion"], "50%_a")._build()
+        self.assertEqual(params, ["%50\\%\\_a%", "%50\\%\\_a%"])
+
+    def test_ilike_lookup_with_default(self) -> None:
+        query, params = (QueryBuilder("videojuegos")
+                         ._where_ilike_any(["titulo"], "rol",
+                                           [("videojuegos.id_genero", "generos", "id_genero", "nombre_genero", "Desconocida")])
+                         ._build())
+        self.assertIn(
+            '"videojuegos"."id_genero" IN (SELECT "id_genero" FROM "generos" WHERE "nombre_genero" ILIKE %s)',
+            self._sql_text(query))
+        self.assertIn('("videojuegos"."id_genero" IS NULL AND \'Desconocida\' ILIKE %s)', self._sql_text(query))
+        self.assertEqual(params, ["%rol%"] * 3)
+
+    def test_shape_ignores_values(self) -> None:
+        first = QueryBuilder("videojuegos")._where_equals("id_genero", 1)._limit(10)
+        second = QueryBuilder("videojuegos")._where_equals("id_genero", 7)._limit(50)
+        third = QueryBuilder("videojuegos")._where_equals("id_genero", 7)
+        self.assertEqual(first._shape(), second._shape())
+        self.assertNotEqual(second._shape(), third._shape())
+
+    def test_selects_all(self) -> None:
+        self.assertTrue(QueryBuilder("generos")._select("*")._selects_all())
+        self.assertFalse(QueryBuilder("generos")._select("id_genero", "nombre_genero")._selects_all())
+
+    def test_params_follow_clause_order(self) -> None:
+        builder = (QueryBuilder("videojuegos")
+                   ._select_match(QueryBuilder("videojuegos")._where_equals("id_genero", 3), "coincide")
+                   ._where_after(["sello"], [5])
+                   ._order_by_rank("busqueda", "spanish", "mario kart")
+                   ._limit(20))
+        self.assertEqual(builder._params(), [3, 5, "mario:* & kart:*", 20])
+
+    def test_text_query_keeps_only_words(self) -> None:
+        self.assertEqual(QueryBuilder._text_query("fútbol & !sala"), "fútbol:* & sala:*")
+        self.assertEqual(QueryBuilder._text_query("&|!"), "")
+
+    def test_rejects_unknown_aggregate_and_period(self) -> None:
+        with self.assertRaises(ValueError):
+            QueryBuilder("ventas")._aggregate("MEDIAN", "cantidad")
+        with self.assertRaises(ValueError):
+            QueryBuilder("ventas")._select_date_trunc("fecha_venta", "decade", "periodo")
+
+
+if __name__ == "__main__":
+    unittest.main()
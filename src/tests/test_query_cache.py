@@ -0,0 +1,70 @@
+# Archivo: src/tests/test_query_cache.py
+
+import unittest
+from unittest import mock
+from models.query_cache import QueryCache
+
+
+class TestQueryCache(unittest.TestCase):
+    """
+    Pruebas de la caché LRU/TTL de resultados de consultas.
+    """
+
+    def test_make_key_normalizes_search_text(self) -> None:
+        self.assertEqual(QueryCache._make_key("videojuegos", "  Mario "), QueryCache._make_key("videojuegos", "mario"))
+
+    def test_get_returns_stored_value_and_counts(self) -> None:
+        cache = QueryCache(ttl=None)
+        key = QueryCache._make_key("videojuegos", "zelda")
+        self.assertIsNone(cache._get(key))
+        cache._put(key, ["fila"], rows=1)
+        self.assertEqual(cache._get(key), ["fila"])
+        stats = cache._get_stats()
+        self.assertEqual((stats["aciertos"], stats["fallos"]), (1, 1))
+
+    def test_entries_expire_after_ttl(self) -> None:
+        cache = QueryCache(ttl=10.0)
+        with mock.patch("models.query_cache.time.monotonic", return_value=100.0):
+            cache._put("clave", "valor")
+        with mock.patch("models.query_cache.time.monotonic", return_value=109.9):
+            self.assertEqual(cache._get("clave"), "valor")
+        with mock.patch("models.query_cache.time.monotonic", return_value=110.0):
+            self.assertIsNone(cache._get("clave"))
+        self.assertEqual(cache._get_stats()["entradas"], 0)
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        cache = QueryCache(max_entries=2, ttl=None)
+        cache._put("a", 1)
+        cache._put("b", 2)
+        cache._get("a")  # "b" pasa a ser la menos usada
+        cache._put("c", 3)
+        self.assertIsNone(cache._get("b"))
+        self.assertEqual((cache._get("a"), cache._get("c")), (1, 3))
+
+    def test_evicts_by_total_rows(self) -> None:
+        cache = QueryCache(max_entries=10, max_rows=5, ttl=None)
+        cache._put("a", "A", rows=3)
+        cache._put("b", "B", rows=3)
+        self.assertIsNone(cache._get("a"))
+        self.assertEqual(cache._get_stats()["filas"], 3)
+
+    def test_result_larger_than_cache_is_not_stored(self) -> None:
+        cache = QueryCache(max_rows=5, ttl=None)
+        cache._put("a", "A", rows=6)
+        self.assertIsNone(cache._get("a"))
+
+    def test_invalidate_by_table(self) -> None:
+        cache = QueryCache(ttl=None)
+        videojuegos = QueryCache._make_key("videojuegos", "x")
+        ventas = QueryCache._make_key("ventas")
+        cache._put(videojuegos, 1)
+        cache._put(ventas, 2)
+        cache._invalidate("videojuegos")
+        self.assertIsNone(cache._get(videojuegos))
+        self.assertEqual(cache._get(ventas), 2)
+        cache._invalidate()
+        self.assertEqual(cache._get_stats()["entradas"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
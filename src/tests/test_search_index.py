@@ -0,0 +1,53 @@
+# Archivo: src/tests/test_search_index.py
+
+import unittest
+from models.search_index import SearchIndex
+
+
+class TestSearchIndex(unittest.TestCase):
+    """
+    Pruebas del índice de n-gramas de la búsqueda en memoria.
+    """
+
+    def setUp(self) -> None:
+        self.index = SearchIndex(ngram_size=3)
+        self.index._add_rows(["futbol total\npc", "futuro\nps5", "golf\npc"])
+
+    def test_add_rows_indexes_consecutive_ids(self) -> None:
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index._search("golf"), {2})
+
+    def test_search_uses_postings_and_verifies_substring(self) -> None:
+        self.assertEqual(self.index._search("fut"), {0, 1})
+        self.assertEqual(self.index._search("futb"), {0})
+        self.assertEqual(self.index._search("tbol t"), {0})
+        self.assertEqual(self.index._search("zzz"), set())
+
+    def test_short_and_empty_queries(self) -> None:
+        self.assertEqual(self.index._search("pc"), {0, 2})
+        self.assertEqual(self.index._search(""), {0, 1, 2})
+
+    def test_search_within_candidates(self) -> None:
+        self.assertEqual(self.index._search("futu", candidates={0, 1}), {1})
+        self.assertEqual(self.index._search("fut", candidates={0}), {0})
+        self.assertEqual(self.index._search("", candidates={1, 7}), {1})
+
+    def test_update_replaces_ngrams(self) -> None:
+        self.index._update(2, "tenis\npc")
+        self.assertEqual(self.index._search("golf"), set())
+        self.assertEqual(self.index._search("tenis"), {2})
+
+    def test_remove_drops_row_and_empty_postings(self) -> None:
+        self.index._remove(1)
+        self.index._remove(1)  # Quitar una fila que ya no está no hace nada
+        self.assertEqual(self.index._search("fut"), {0})
+        self.assertNotIn("uro", self.index._postings)
+        self.assertEqual(len(self.index), 2)
+
+    def test_add_single_row(self) -> None:
+        self.index._add(5, "futbol sala")
+        self.assertEqual(self.index._search("futbol"), {0, 5})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -45,6 +45,36 @@ PORT_DB = 60000
 # Esto ayuda a identificar claramente la conexión en aplicaciones más complejas.
 CONNECTION_NAME = NAME_DB
 
+# Configuración del pool de conexiones (psycopg_pool.ConnectionPool).
+# USE_POOL_DB activa el modo con pool en ManagerDB, de forma que varias ventanas o
+# tareas en segundo plano puedan consultar a la vez sin compartir un único socket.
+USE_POOL_DB = True
+
+# USE_ASYNC_DB añade un AsyncManagerDB (psycopg.AsyncConnection) para que el controlador
+# pida datos, géneros y agregados a la vez mediante corrutinas.
+USE_ASYNC_DB = False
+
+# Número mínimo y máximo de conexiones que mantiene abiertas el pool.
+POOL_MIN_SIZE_DB = 1
+POOL_MAX_SIZE_DB = 5
+
+# Tiempo máximo (segundos) que un cliente espera a que el pool le entregue una conexión.
+POOL_TIMEOUT_DB = 30.0
+
+# Vida máxima (segundos) de una conexión antes de que el pool la recicle.
+POOL_MAX_LIFETIME_DB = 3600.0
+
+# Tiempo máximo (segundos) que una conexión puede permanecer ociosa antes de cerrarse
+# (solo se cierran las que exceden POOL_MIN_SIZE_DB).
+POOL_MAX_IDLE_DB = 600.0
+
+# Sentencias preparadas por conexión.
+# ReportModel ejecuta sus consultas (registradas en StatementRegistry) con prepare=True, de modo que
+# PostgreSQL las analiza y planifica una sola vez por conexión. PREPARED_MAX_DB es el máximo de
+# sentencias que cada conexión mantiene preparadas; debe cubrir todas las formas de consulta del
+# registro para que no se expulsen entre sí.
+PREPARED_MAX_DB = 200
+
 # Definimos un enumerado para los nombres de las tablas de la base de datos.
 # Esto centraliza y organiza los nombres de las tablas, reduciendo la posibilidad de errores tipográficos.
 
@@ -57,6 +87,144 @@ class EnumTablasDB(Enum):
     VENTAS = "ventas"
 
 
+# Clave primaria de cada tabla, utilizada para la paginación por clave (keyset).
+PRIMARY_KEYS_DB = {
+    EnumTablasDB.ROLES.value: "id_rol",
+    EnumTablasDB.USUARIOS.value: "email",
+    EnumTablasDB.GENEROS.value: "id_genero",
+    EnumTablasDB.VIDEOJUEGOS.value: "codigo",
+    EnumTablasDB.VENTAS.value: "id_venta",
+}
+
+# Número de filas por página en las consultas paginadas.
+PAGE_SIZE_DB = 200
+
+# Videojuegos más vendidos del filtro activo que se muestran en el gráfico de ventas por título
+# (calculados en el servidor, independientemente de las páginas cargadas en la tabla).
+CHART_TOP_N_DB = 20
+
+# Filas que trae cada viaje al servidor al recorrer un cursor con nombre (itersize).
+STREAM_ITERSIZE_DB = 2000
+
+# Intervalo mínimo (segundos) entre comprobaciones de la huella del esquema.
+# ReportModel guarda en caché las columnas de cada tabla y solo las vuelve a consultar
+# cuando cambia la huella (columnas, tipos u orden) de las tablas de la aplicación.
+SCHEMA_CHECK_INTERVAL_DB = 60.0
+
+# Columnas de 'videojuegos' sobre las que se busca el texto del filtro (ILIKE en el servidor).
+# Cada una dispone de un índice GIN con pg_trgm (migración 0001_esquema_inicial.sql).
+SEARCH_COLUMNS_VIDEOJUEGOS = ["codigo", "titulo", "descripcion", "plataforma"]
+
+# Columnas de otras tablas en las que también se busca el texto del filtro, a través de una clave
+# foránea de 'videojuegos': (clave foránea, tabla, clave, columna, valor si la clave es NULL).
+# El género se busca por su nombre tal como lo muestra la tabla ("Desconocida" si no tiene);
+# 'generos.nombre_genero' tiene un índice GIN con pg_trgm (migración 0010_trigramas_generos.sql).
+SEARCH_LOOKUPS_VIDEOJUEGOS = [("videojuegos.id_genero", "generos", "id_genero", "nombre_genero", "Desconocida")]
+
+# Búsqueda de texto completo (migración 0007_busqueda_texto_completo.sql): columna tsvector
+# generada de 'videojuegos' (título y descripción, sin tildes) con índice GIN, configuración de
+# PostgreSQL con la que se analiza la consulta y número de resultados, ordenados por relevancia
+# (ts_rank), que se devuelven.
+FULL_TEXT_COLUMN_VIDEOJUEGOS = "busqueda"
+FULL_TEXT_CONFIG_DB = "spanish"
+FULL_TEXT_TOP_N_DB = 100
+
+# Búsqueda en memoria (ReportController con SearchIndex): si IN_MEMORY_SEARCH es True, el informe
+# carga el catálogo completo de videojuegos una vez y filtra en el cliente con un índice de
+# n-gramas de longitud SEARCH_INDEX_NGRAM_SIZE, sin consultar la base de datos en cada pulsación.
+# Pensado para catálogos que caben en memoria; la búsqueda es siempre por subcadena (el modo de
+# texto completo requiere el servidor). ReportModel añade a cada fila, al cargarla o recibir su
+# cambio, la columna SEARCH_BLOB_COLUMN: los valores de IN_MEMORY_SEARCH_COLUMNS (deben estar
+# entre las columnas del informe) unidos, en minúsculas (casefold) y sin tildes.
+IN_MEMORY_SEARCH = False
+IN_MEMORY_SEARCH_COLUMNS = ["titulo", "plataforma", "genero", "descripcion"]
+SEARCH_BLOB_COLUMN = "texto_busqueda"
+SEARCH_INDEX_NGRAM_SIZE = 3
+# Resultados recientes (consulta, género) que se guardan para refinar la búsqueda al escribir o borrar
+SEARCH_REFINEMENT_STACK_SIZE = 16
+
+# Columnas de 'videojuegos' que se piden para el informe (tabla y gráfico): las que se muestran y
+# la clave (paginación y cambios en su sitio). El nombre del género llega resuelto por la unión con
+# 'generos' como columna "genero". El resto (precio, stock...) no viaja.
+REPORT_COLUMNS_VIDEOJUEGOS = ["codigo", "titulo", "plataforma", "ventas", "fecha_lanzamiento", "descripcion"]
+
+# Columnas que muestra la tabla del informe, en orden.
+TABLE_COLUMNS_VIDEOJUEGOS = ["titulo", "genero", "plataforma", "ventas", "fecha_lanzamiento", "descripcion"]
+
+# Caché de resultados de consultas (QueryCache) entre ReportController y ReportModel.
+# Se limita por número de entradas y por filas totales almacenadas (política LRU).
+QUERY_CACHE_MAX_ENTRIES = 256
+QUERY_CACHE_MAX_ROWS = 50000
+
+# Segundos de validez de cada resultado en caché (None para que no caduquen).
+QUERY_CACHE_TTL = 300.0
+
+# Notificaciones de cambios (LISTEN/NOTIFY).
+# Los disparadores de la migración 0002_notificaciones_cambios.sql publican en NOTIFY_CHANNEL_DB cada fila modificada de
+# 'videojuegos' y 'ventas'; ManagerDB escucha en una conexión dedicada y los informes abiertos
+# actualizan solo las filas afectadas.
+USE_NOTIFY_DB = True
+NOTIFY_CHANNEL_DB = "cambios_datos"
+
+# Segundos máximos que el hilo de escucha espera notificaciones antes de comprobar si debe detenerse,
+# y pausa antes de reconectar si se pierde la conexión dedicada.
+NOTIFY_POLL_TIMEOUT_DB = 1.0
+NOTIFY_RECONNECT_DELAY_DB = 5.0
+
+# Milisegundos durante los que se agrupan las notificaciones antes de actualizar la vista.
+NOTIFY_DEBOUNCE_MS = 250
+
+# Milisegundos sin pulsaciones que espera la búsqueda en memoria antes de pedir al servidor la
+# evolución de ventas del filtro (la tabla, el resumen y el gráfico se actualizan en cada pulsación).
+SERIES_DEBOUNCE_MS = 300
+
+# Sincronización incremental por sellos de cambio.
+# Cada fila de 'videojuegos' y 'ventas' guarda en CHANGE_STAMP_COLUMN_DB el último valor de la
+# secuencia 'cambios_seq' y los borrados quedan en CHANGE_TOMBSTONES_TABLE_DB; el informe abierto
+# pide cada SYNC_INTERVAL_MS solo lo cambiado desde su último sello (0 desactiva la sincronización).
+CHANGE_STAMP_COLUMN_DB = "version_cambio"
+CHANGE_TOMBSTONES_TABLE_DB = "cambios_borrados"
+SYNC_INTERVAL_MS = 30000
+# Horas que se conservan las lápidas antes de podarlas en el mantenimiento periódico (cada
+# ROLLUP_REFRESH_INTERVAL_MS); debe superar con holgura el intervalo de sincronización.
+CHANGE_TOMBSTONES_RETENTION_HOURS = 24
+
+# Resúmenes materializados de 'ventas' por día y por mes (migración 0004_resumenes_ventas.sql; los
+# de videojuego, género y plataforma se eliminaron en 0009_eliminar_resumenes_sin_uso.sql).
+# Se actualizan con REFRESH MATERIALIZED VIEW CONCURRENTLY cada ROLLUP_REFRESH_INTERVAL_MS mientras
+# el informe está abierto (0 desactiva la actualización programada). El bloqueo consultivo
+# ROLLUP_REFRESH_LOCK_ID evita que varios clientes los actualicen a la vez.
+ROLLUP_REFRESH_INTERVAL_MS = 600000
+ROLLUP_REFRESH_LOCK_ID = 40402
+
+# Particiones mensuales de 'ventas' (migración 0006_particiones_ventas.sql).
+# Mientras el informe está abierto se crean por adelantado las particiones de los próximos
+# SALES_PARTITION_MONTHS_AHEAD meses y, si SALES_PARTITION_RETENTION_MONTHS es mayor que 0, se
+# separan para archivarlas las de los meses anteriores a ese número de meses (0 conserva todas).
+# Las ventas fuera de las particiones creadas caen en la partición DEFAULT ventas_default
+# (migración 0008_particion_ventas_defecto.sql) y el mantenimiento las traslada a la de su mes.
+SALES_PARTITION_MONTHS_AHEAD = 3
+SALES_PARTITION_RETENTION_MONTHS = 0
+
+
+class EnumResumenesVentas(Enum):
+    DIA = "resumen_ventas_dia"
+    MES = "resumen_ventas_mes"
+
+
+# Periodos de la serie temporal de ventas (unidad de date_trunc en PostgreSQL).
+class EnumPeriodos(Enum):
+    DIA = "day"
+    SEMANA = "week"
+    MES = "month"
+
+
+# Modos del filtro de texto del informe.
+class EnumModosBusqueda(Enum):
+    SUBCADENA = "Contiene"  # ILIKE en utils_db.SEARCH_COLUMNS_VIDEOJUEGOS
+    TEXTO_COMPLETO = "Texto completo"  # tsvector con raíces en español, por relevancia
+
+
 class EnumDataMode(Enum):
     TABLA = "table"
     GRAFICA = "chart"
@@ -3,24 +3,27 @@
 from typing import Optional
 from utils.utils_popup import _printv2  # Importamos la función de impresión y popup centralizada
 from models.manager_db import ManagerDB  # Importamos el gestor de base de datos
-from utils.utils_path import PATH_INICIALIZACION_DB  # Ruta del archivo SQL de inicialización
+from utils.utils_path import MIGRATIONS_DIR  # Carpeta de las migraciones del esquema
+from utils import utils_db  # Configuración de la base de datos (modo pool)
 
 
 def initialize_app(
     show_popup: bool = False,
     popup_parent: Optional[object] = None,
-    sql_file_path: str = PATH_INICIALIZACION_DB
+    migrations_dir: str = MIGRATIONS_DIR,
+    use_pool: bool = utils_db.USE_POOL_DB
 ) -> ManagerDB:
     """
     Inicializa los componentes principales de la aplicación.
 
-    Configuramos elementos básicos como la conexión a la base de datos y ejecutamos
-    scripts SQL para la inicialización.
+    Configuramos elementos básicos como la conexión a la base de datos y aplicamos
+    las migraciones pendientes del esquema (si está al día, solo se consulta su registro).
 
     Parámetros:
     - show_popup (bool): Si es True, muestra popups para notificaciones (por defecto: False).
     - popup_parent (Optional[object]): Widget padre opcional para asociar los popups (por defecto: None).
-    - sql_file_path (str): Ruta al archivo SQL para inicializar la base de datos (por defecto: PATH_INICIALIZACION_DB).
+    - migrations_dir (str): Carpeta con las migraciones de la base de datos (por defecto: MIGRATIONS_DIR).
+    - use_pool (bool): Si es True, ManagerDB utiliza un pool de conexiones (por defecto: utils_db.USE_POOL_DB).
 
     Retorno:
     - ManagerDB: Instancia del gestor de la base de datos inicializado.
@@ -32,11 +35,12 @@ def initialize_app(
         db_manager = initialize_app(show_popup=False, popup_parent=main_window)
     """
     # Inicialización del gestor de base de datos
-    manager_db = ManagerDB(show_popup=show_popup, popup_parent=popup_parent)
+    manager_db = ManagerDB(show_popup=show_popup, popup_parent=popup_parent, use_pool=use_pool)
 
     try:
-        # Intentamos inicializar la base de datos
-        manager_db.init_db(sql_file_path)
+        # Aplicamos las migraciones pendientes de la base de datos
+        if not manager_db.apply_migrations(migrations_dir):
+            raise RuntimeError("No se pudo preparar el esquema de la base de datos.")
 
         # Notificamos si la inicialización fue exitosa
         if show_popup:
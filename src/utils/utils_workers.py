@@ -0,0 +1,261 @@
+# Archivo: src/utils/utils_workers.py
+
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Dict, Optional, Tuple
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from utils import utils_db
+from utils.utils_popup import _printv2
+
+
+class _WorkerSignals(QObject):
+    """
+    Señales emitidas por un QueryWorker desde el hilo secundario.
+
+    QRunnable no hereda de QObject, por lo que las señales se agrupan en este objeto.
+    Al emitirse desde otro hilo, Qt las entrega en cola al hilo principal.
+    """
+    finished = Signal(str, int, object)  # (clave, generación, resultado)
+    failed = Signal(str, int, str)  # (clave, generación, mensaje de error)
+# _WorkerSignals (fin)
+
+
+class QueryWorker(QRunnable):
+    """
+    Tarea que ejecuta una función (normalmente una consulta del modelo) en un hilo del QThreadPool.
+    """
+
+    def __init__(self, key: str, generation: int, func: Callable[..., Any], args: Tuple[Any, ...],
+                 kwargs: Dict[str, Any], is_current: Callable[[str, int], bool]) -> None:
+        """
+        Inicializa la tarea.
+
+        Parámetros:
+        - key (str): Clave que identifica el tipo de petición (p. ej. "filtros").
+        - generation (int): Número de petición dentro de la clave; permite descartar resultados obsoletos.
+        - func (callable): Función a ejecutar en segundo plano.
+        - args (tuple): Argumentos posicionales para la función.
+        - kwargs (dict): Argumentos con nombre para la función.
+        - is_current (callable): Indica si la petición sigue siendo la más reciente de su clave.
+        """
+        super().__init__()
+        self.signals = _WorkerSignals()  # Se crea en el hilo principal, donde viven sus receptores
+        self._key = key
+        self._generation = generation
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._is_current = is_current
+    # __init__ (fin)
+
+    @Slot()
+    def run(self) -> None:
+        """
+        Ejecuta la función y emite el resultado o el error.
+
+        Si antes de empezar la petición ya ha sido sustituida por otra más reciente,
+        no se ejecuta para no ocupar una conexión con trabajo inútil.
+        """
+        if not self._is_current(self._key, self._generation):
+            return
+        try:
+            result = self._func(*self._args, **self._kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self._key, self._generation, str(e))
+        else:
+            self.signals.finished.emit(self._key, self._generation, result)
+    # run (fin)
+# QueryWorker (fin)
+
+
+class QueryRunner(QObject):
+    """
+    Capa de ejecución en segundo plano para las consultas del modelo.
+
+    Cada petición se identifica con una clave. Al enviar una nueva petición con la misma clave,
+    las anteriores quedan obsoletas y sus resultados se descartan al llegar, de forma que la
+    interfaz solo refleja la última petición del usuario.
+    """
+    result_ready = Signal(str, object)  # (clave, resultado) solo para resultados vigentes
+
+    def __init__(self, parent: Optional[QObject] = None, max_threads: Optional[int] = None) -> None:
+        """
+        Inicializa el ejecutor con un QThreadPool propio.
+
+        Parámetros:
+        - parent (QObject | None): Objeto padre opcional (define el ciclo de vida del ejecutor).
+        - max_threads (int | None): Número máximo de hilos simultáneos. Por defecto, el tamaño máximo del
+          pool de conexiones, o 1 sin pool (todas las consultas comparten la misma conexión).
+        """
+        super().__init__(parent)
+        if max_threads is None:
+            max_threads = utils_db.POOL_MAX_SIZE_DB if utils_db.USE_POOL_DB else 1
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(max_threads)
+        self._generations: Dict[str, int] = {}  # Última generación enviada por clave
+        self._callbacks: Dict[str, Tuple[Optional[Callable], Optional[Callable]]] = {}  # Callbacks de la última petición
+        self._futures: Dict[str, Future] = {}  # Última corrutina en curso por clave (modo asíncrono)
+        self._future_signals = _WorkerSignals(self)  # Señales para los resultados de corrutinas
+        self._future_signals.finished.connect(self._on_worker_finished)
+        self._future_signals.failed.connect(self._on_worker_failed)
+    # __init__ (fin)
+
+    def _submit(self, key: str, func: Callable[..., Any], *args: Any,
+                on_result: Optional[Callable[[Any], None]] = None,
+                on_error: Optional[Callable[[str], None]] = None, **kwargs: Any) -> int:
+        """
+        Envía una función para ejecutarse en segundo plano.
+
+        Parámetros:
+        - key (str): Clave de la petición; las peticiones anteriores con la misma clave quedan obsoletas.
+        - func (callable): Función a ejecutar (no debe tocar widgets de Qt).
+        - *args, **kwargs: Argumentos para la función.
+        - on_result (callable | None): Se llama en el hilo principal con el resultado, solo si sigue vigente.
+        - on_error (callable | None): Se llama en el hilo principal con el mensaje de error, solo si sigue vigente.
+
+        Retorno:
+        - int: Generación asignada a la petición.
+        """
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        self._callbacks[key] = (on_result, on_error)
+
+        worker = QueryWorker(key, generation, func, args, kwargs, self._is_current)
+        worker.signals.finished.connect(self._on_worker_finished)
+        worker.signals.failed.connect(self._on_worker_failed)
+        self._thread_pool.start(worker)
+        return generation
+    # _submit (fin)
+
+    def _watch_future(self, key: str, future: Future,
+                      on_result: Optional[Callable[[Any], None]] = None,
+                      on_error: Optional[Callable[[str], None]] = None) -> int:
+        """
+        Entrega en el hilo principal el resultado de una corrutina que se ejecuta en otro bucle de eventos.
+
+        Sigue las mismas reglas que _submit: la petición anterior con la misma clave queda obsoleta
+        y, además, se cancela su corrutina para liberar la conexión cuanto antes.
+
+        Parámetros:
+        - key (str): Clave de la petición.
+        - future (Future): Resultado devuelto por AsyncManagerDB._run_coroutine.
+        - on_result (callable | None): Se llama en el hilo principal con el resultado, solo si sigue vigente.
+        - on_error (callable | None): Se llama en el hilo principal con el mensaje de error, solo si sigue vigente.
+
+        Retorno:
+        - int: Generación asignada a la petición.
+        """
+        previous = self._futures.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        self._callbacks[key] = (on_result, on_error)
+        self._futures[key] = future
+
+        def _on_done(done: Future) -> None:
+            # Se ejecuta en el hilo del bucle asyncio: la señal llega en cola al hilo principal
+            try:
+                result = done.result()
+            except CancelledError:
+                return
+            except Exception as e:
+                self._future_signals.failed.emit(key, generation, str(e))
+            else:
+                self._future_signals.finished.emit(key, generation, result)
+
+        future.add_done_callback(_on_done)
+        return generation
+    # _watch_future (fin)
+
+    def _cancel(self, key: str) -> None:
+        """
+        Deja obsoleta la petición en curso de una clave (p. ej. porque su resultado ya se obtuvo de la caché).
+
+        Parámetros:
+        - key (str): Clave de la petición.
+        """
+        previous = self._futures.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+        self._generations[key] = self._generations.get(key, 0) + 1
+        self._callbacks.pop(key, None)
+    # _cancel (fin)
+
+    def _is_current(self, key: str, generation: int) -> bool:
+        """
+        Indica si una petición es la más reciente de su clave.
+
+        Parámetros:
+        - key (str): Clave de la petición.
+        - generation (int): Generación de la petición.
+
+        Retorno:
+        - bool: True si no ha sido sustituida por otra petición posterior.
+        """
+        return self._generations.get(key) == generation
+    # _is_current (fin)
+
+    @Slot(str, int, object)
+    def _on_worker_finished(self, key: str, generation: int, result: Any) -> None:
+        """
+        Recibe el resultado de un worker en el hilo principal y lo entrega si sigue vigente.
+        """
+        if not self._is_current(key, generation):
+            return  # Resultado obsoleto: el usuario ya ha lanzado otra petición
+        self._futures.pop(key, None)
+        on_result, _ = self._callbacks.pop(key, (None, None))
+        self.result_ready.emit(key, result)
+        if on_result:
+            on_result(result)
+    # _on_worker_finished (fin)
+
+    @Slot(str, int, str)
+    def _on_worker_failed(self, key: str, generation: int, message: str) -> None:
+        """
+        Recibe el error de un worker en el hilo principal y lo notifica si sigue vigente.
+        """
+        if not self._is_current(key, generation):
+            return
+        self._futures.pop(key, None)
+        _, on_error = self._callbacks.pop(key, (None, None))
+        if on_error:
+            on_error(message)
+        else:
+            _printv2(show_popup=False, message=f"Error en la consulta '{key}': {message}")
+    # _on_worker_failed (fin)
+
+    def _wait_for_done(self, msecs: int = -1) -> bool:
+        """
+        Espera a que terminen las tareas en curso (útil al cerrar la aplicación).
+
+        Parámetros:
+        - msecs (int): Tiempo máximo de espera en milisegundos (-1 para esperar indefinidamente).
+
+        Retorno:
+        - bool: True si todas las tareas terminaron.
+        """
+        return self._thread_pool.waitForDone(msecs)
+    # _wait_for_done (fin)
+# QueryRunner (fin)
+
+
+class NotificationBridge(QObject):
+    """
+    Traslada al hilo principal las notificaciones recibidas en el hilo de escucha de ManagerDB.
+
+    `_emit` puede llamarse desde cualquier hilo; la señal se entrega en cola al hilo en el que
+    vive el objeto, donde ya es seguro tocar los widgets.
+    """
+    notification_received = Signal(object)  # Diccionario de la notificación
+
+    def _emit(self, payload: Dict[str, Any]) -> None:
+        """
+        Emite la notificación (se llama desde el hilo de escucha).
+
+        Parámetros:
+        - payload (dict): Notificación decodificada.
+        """
+        self.notification_received.emit(payload)
+    # _emit (fin)
+# NotificationBridge (fin)
@@ -1,11 +1,12 @@
 from PySide6.QtWidgets import (
     QGridLayout, QWidget, QTableView, QLineEdit, QComboBox,
-    QLabel, QSizePolicy, QPushButton, QFileDialog
+    QLabel, QSizePolicy, QPushButton, QFileDialog, QDateEdit
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QDate
 from PySide6.QtGui import QIcon
 from widgets.custom_chart_widget import CustomChartWidget
 from utils import utils_sizes, utils_path, utils_estilos
+from utils.utils_db import EnumPeriodos, EnumModosBusqueda
 from fpdf import FPDF  # Biblioteca para la creación de PDF
 
 class ReportView(QWidget):
@@ -13,6 +14,8 @@ class ReportView(QWidget):
     Clase encargada de gestionar la interfaz de usuario para la visualización de informes.
     """
     apply_filters_signal = Signal(str, str)  # Señal para emitir texto de búsqueda y categoría
+    search_mode_changed_signal = Signal(str)  # Señal para emitir el modo de búsqueda elegido
+    apply_date_range_signal = Signal(object, object, str)  # Señal para emitir desde, hasta (date o None) y periodo
 
     def __init__(self):
         """
@@ -28,6 +31,7 @@ class ReportView(QWidget):
 
         # Inicialización de componentes principales
         self._init_filters()
+        self._init_date_range()
         self._init_table()
         self._init_summary()
         self._init_pdf_buttons()  # Nuevos botones PDF
@@ -36,14 +40,20 @@ class ReportView(QWidget):
         self.chart_widget = CustomChartWidget()
         self.chart_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
+        # Inicializar gráfico de la evolución de ventas por periodo
+        self.sales_series_chart = CustomChartWidget()
+        self.sales_series_chart.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
         # Configuración del diseño principal
         main_layout = QGridLayout()
         main_layout.addLayout(self.filters_layout, 0, 0, 1, 2)
         main_layout.addWidget(self.table_view, 1, 0, 1, 2)
         main_layout.addWidget(self.summary_label, 2, 0, 1, 1)
         main_layout.addWidget(self.chart_widget, 3, 0, 1, 2)  # Añadir gráfico al diseño
-        main_layout.addWidget(self.pdf_table_button, 4, 0)  # Botón PDF Tabla
-        main_layout.addWidget(self.pdf_chart_button, 4, 1)  # Botón PDF Gráfico
+        main_layout.addLayout(self.date_range_layout, 4, 0, 1, 2)  # Rango de fechas y periodo
+        main_layout.addWidget(self.sales_series_chart, 5, 0, 1, 2)  # Evolución de ventas
+        main_layout.addWidget(self.pdf_table_button, 6, 0)  # Botón PDF Tabla
+        main_layout.addWidget(self.pdf_chart_button, 6, 1)  # Botón PDF Gráfico
 
         # Ajustes de márgenes y espaciado
         main_layout.setContentsMargins(
@@ -72,6 +82,14 @@ class ReportView(QWidget):
         # Conectar búsqueda en tiempo real
         self.search_input.textChanged.connect(self._emit_apply_filters_signal)
 
+        # Selector del modo de búsqueda (subcadena o texto completo por relevancia)
+        self.search_mode_select = QComboBox()
+        for mode in EnumModosBusqueda:
+            self.search_mode_select.addItem(mode.value)
+        self.filters_layout.addWidget(QLabel("Modo:"), 0, 2)
+        self.filters_layout.addWidget(self.search_mode_select, 0, 3)
+        self.search_mode_select.currentTextChanged.connect(self.search_mode_changed_signal.emit)
+
         # Selector de categoría
         self.category_select = QComboBox()
         self.category_select.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
@@ -87,6 +105,52 @@ class ReportView(QWidget):
         # Conectar botón a la señal de filtros
         self.apply_filter_button.clicked.connect(self._emit_apply_filters_signal)
 
+    def _init_date_range(self):
+        """
+        Inicializa el rango de fechas (desde/hasta) y el periodo de agrupación de la evolución de ventas.
+
+        La fecha mínima de cada selector se muestra como "Sin límite" y equivale a no acotar el rango.
+        """
+        self.date_range_layout = QGridLayout()
+
+        self.date_from_input = self._create_date_edit()
+        self.date_range_layout.addWidget(QLabel("Desde:"), 0, 0)
+        self.date_range_layout.addWidget(self.date_from_input, 0, 1)
+
+        self.date_to_input = self._create_date_edit()
+        self.date_range_layout.addWidget(QLabel("Hasta:"), 0, 2)
+        self.date_range_layout.addWidget(self.date_to_input, 0, 3)
+
+        # Selector del periodo de agrupación
+        self.bucket_select = QComboBox()
+        self.bucket_select.addItem("Día", EnumPeriodos.DIA.value)
+        self.bucket_select.addItem("Semana", EnumPeriodos.SEMANA.value)
+        self.bucket_select.addItem("Mes", EnumPeriodos.MES.value)
+        self.bucket_select.setCurrentIndex(self.bucket_select.findData(EnumPeriodos.MES.value))
+        self.date_range_layout.addWidget(QLabel("Periodo:"), 0, 4)
+        self.date_range_layout.addWidget(self.bucket_select, 0, 5)
+
+        # Cualquier cambio recalcula la serie
+        self.date_from_input.dateChanged.connect(self._emit_apply_date_range_signal)
+        self.date_to_input.dateChanged.connect(self._emit_apply_date_range_signal)
+        self.bucket_select.currentIndexChanged.connect(self._emit_apply_date_range_signal)
+
+    def _create_date_edit(self):
+        """
+        Crea un selector de fecha con calendario cuyo valor mínimo significa "sin límite".
+
+        Retorno:
+        - QDateEdit: Selector configurado.
+        """
+        date_edit = QDateEdit()
+        date_edit.setCalendarPopup(True)
+        date_edit.setDisplayFormat("dd/MM/yyyy")
+        date_edit.setMinimumDate(QDate(1970, 1, 1))
+        date_edit.setSpecialValueText("Sin límite")
+        date_edit.setDate(date_edit.minimumDate())
+        date_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        return date_edit
+
     def _init_table(self):
         """
         Configura la tabla de datos para mostrar los resultados.
@@ -163,12 +227,16 @@ class ReportView(QWidget):
             pdf.add_page()
             pdf.set_font("Arial", size=12)
 
-            # Obtener el modelo de la tabla
+            # Obtener el modelo de la tabla y cargar las páginas pendientes para exportarla completa
+            # (LazyTableModel pide las páginas en segundo plano al desplazarse; aquí se cargan todas ya)
             model = self.table_view.model()
+            fetch_all = getattr(model, "_fetch_all", None)
+            if fetch_all is not None:
+                fetch_all()
             for row in range(model.rowCount()):
                 for column in range(model.columnCount()):
-                    item = model.item(row, column)
-                    pdf.cell(40, 10, str(item.text()), border=1)
+                    text = model.index(row, column).data()
+                    pdf.cell(40, 10, str(text or ""), border=1)
                 pdf.ln()
 
             pdf.output(pdf_path)
@@ -208,16 +276,48 @@ class ReportView(QWidget):
         category = self.category_select.currentText()
         self.apply_filters_signal.emit(search_text, category)
 
+    @Slot()
+    def _emit_apply_date_range_signal(self):
+        """
+        Emite la señal del rango de fechas con los valores actuales (None si no hay límite) y el periodo.
+        """
+        date_from = self._selected_date(self.date_from_input)
+        date_to = self._selected_date(self.date_to_input)
+        self.apply_date_range_signal.emit(date_from, date_to, self.bucket_select.currentData())
+
+    def _selected_date(self, date_edit):
+        """
+        Devuelve la fecha elegida en un selector o None si está en "Sin límite".
+
+        Parámetros:
+        - date_edit (QDateEdit): Selector de fecha.
+
+        Retorno:
+        - datetime.date | None: Fecha elegida.
+        """
+        if date_edit.date() == date_edit.minimumDate():
+            return None
+        return date_edit.date().toPython()
+
     def _set_model(self, model):
         """
         Establece el modelo de datos en el QTableView y ajusta las columnas.
 
         Parámetros:
-        - model (QStandardItemModel): Modelo de datos compatible con QTableView.
+        - model (QAbstractItemModel): Modelo de datos compatible con QTableView (p. ej. LazyTableModel).
         """
         self.table_view.setModel(model)
         self.table_view.resizeColumnsToContents()
 
+    def _set_search_modes_enabled(self, enabled):
+        """
+        Activa o desactiva el selector del modo de búsqueda.
+
+        Parámetros:
+        - enabled (bool): False deja fijo el modo actual (p. ej. con la búsqueda en memoria).
+        """
+        self.search_mode_select.setEnabled(enabled)
+
     def _set_genres(self, categories):
         """
         Llena el combo box de categorías con los valores recibidos.
@@ -238,12 +338,35 @@ class ReportView(QWidget):
         """
         self.chart_widget._set_data(data)
 
-    def _update_summary(self, total_products: int, total_price: float):
+    def _set_sales_series(self, data, bucket):
+        """
+        Muestra la evolución de las ventas por periodo.
+
+        Parámetros:
+        - data (dict): Periodos (eje X) y unidades por serie (eje Y), como en CustomChartWidget._set_time_series.
+        - bucket (str): Periodo de agrupación (valor de EnumPeriodos).
+        """
+        self.sales_series_chart._set_time_series(data, bucket)
+
+    def _clear_chart(self):
+        """
+        Deja el gráfico vacío.
+        """
+        self.chart_widget.clear_chart()
+
+    def _update_summary(self, total_products: int, total_price: float,
+                        min_value=None, max_value=None, avg_value=None):
         """
         Actualiza la etiqueta del resumen con la cantidad total de productos y la suma total de precios.
 
         Parámetros:
         - total_products (int): Número total de productos.
         - total_price (float): Suma total de los precios de los productos.
+        - min_value (float | None): Valor mínimo (opcional).
+        - max_value (float | None): Valor máximo (opcional).
+        - avg_value (float | None): Valor medio (opcional).
         """
-        self.summary_label.setText(f"Total de elementos: {total_products}, Suma total: {total_price:.2f}")
+        text = f"Total de elementos: {total_products}, Suma total: {total_price:.2f}"
+        if min_value is not None and max_value is not None and avg_value is not None:
+            text += f", Mín: {min_value}, Máx: {max_value}, Media: {avg_value:.2f}"
+        self.summary_label.setText(text)
@@ -0,0 +1,237 @@
+"""
+* WEBGRAFÍA *
+
+- QAbstractTableModel Class. (s. f.). Doc.qt.io. de https://doc.qt.io/qtforpython-6.7/PySide6/QtCore/QAbstractTableModel.html
+
+"""
+
+# Archivo: src/widgets/columnar_table_model.py
+
+from typing import Any, Dict, List, Optional, Sequence
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    """
+    Modelo de tabla virtual respaldado por columnas.
+
+    Los datos se guardan como una secuencia por columna (listas o arreglos de NumPy) en lugar de
+    un QStandardItem por celda; `data()` construye el texto de cada celda solo cuando la vista
+    lo pide. Opcionalmente, un vector de índices selecciona y ordena las filas visibles, de modo
+    que filtrar consiste en sustituir ese vector sin reconstruir ningún objeto.
+    """
+
+    def __init__(self, columns: List[str], column_data: Optional[Dict[str, Sequence[Any]]] = None, parent=None):
+        """
+        Inicializa el modelo.
+
+        Parámetros:
+        - columns (list[str]): Columnas a mostrar, en orden.
+        - column_data (dict[str, Sequence] | None): Valores de cada columna (todas de la misma longitud).
+          Las columnas que falten se muestran vacías.
+        - parent (QObject | None): Objeto padre opcional.
+        """
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._data: Dict[str, Sequence[Any]] = dict(column_data or {})
+        self._size = len(next(iter(self._data.values()))) if self._data else 0
+        self._indices: Optional[Sequence[int]] = None  # None = todas las filas en orden físico
+    # __init__ (fin)
+
+    @classmethod
+    def _from_rows(cls, columns: List[str], rows: List[Dict[str, Any]],
+                   extra_columns: Optional[List[str]] = None, parent=None) -> "ColumnarTableModel":
+        """
+        Crea el modelo a partir de filas en forma de diccionario (una lista por columna).
+
+        Parámetros:
+        - columns (list[str]): Columnas a mostrar, en orden.
+        - rows (list[dict]): Filas como diccionarios clave-valor.
+        - extra_columns (list[str] | None): Columnas que se guardan aunque no se muestren (p. ej. la clave).
+        - parent (QObject | None): Objeto padre opcional.
+
+        Retorno:
+        - ColumnarTableModel: Modelo con los datos en columnas.
+        """
+        stored_columns = list(dict.fromkeys(list(columns) + list(extra_columns or [])))
+        return cls(columns, cls._rows_to_columns(stored_columns, rows), parent=parent)
+    # _from_rows (fin)
+
+    @staticmethod
+    def _rows_to_columns(columns: List[str], rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Transpone filas en forma de diccionario a una lista de valores por columna.
+
+        Parámetros:
+        - columns (list[str]): Columnas a extraer.
+        - rows (list[dict]): Filas como diccionarios clave-valor.
+
+        Retorno:
+        - dict[str, list]: Valores de cada columna.
+        """
+        return {column: [row.get(column, "") for row in rows] for column in columns}
+    # _rows_to_columns (fin)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Devuelve el número de filas visibles.
+        """
+        if parent.isValid():
+            return 0
+        return self._size if self._indices is None else len(self._indices)
+    # rowCount (fin)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Devuelve el número de columnas.
+        """
+        return 0 if parent.isValid() else len(self._columns)
+    # columnCount (fin)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """
+        Devuelve el texto de una celda bajo demanda.
+        """
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        column_values = self._data.get(self._columns[index.column()])
+        if column_values is None:
+            return ""
+        return str(column_values[self._physical_row(index.row())])
+    # data (fin)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """
+        Devuelve los nombres de las columnas como cabecera horizontal.
+        """
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._columns[section] if section < len(self._columns) else None
+        return str(section + 1)
+    # headerData (fin)
+
+    def _physical_row(self, row: int) -> int:
+        """
+        Traduce una fila visible a su posición en las columnas de datos.
+
+        Parámetros:
+        - row (int): Fila visible.
+
+        Retorno:
+        - int: Posición física de la fila.
+        """
+        return row if self._indices is None else int(self._indices[row])
+    # _physical_row (fin)
+
+    def _set_row_indices(self, indices: Optional[Sequence[int]]) -> None:
+        """
+        Sustituye el vector de filas visibles (filtro y orden) sin tocar los datos.
+
+        Parámetros:
+        - indices (Sequence[int] | None): Posiciones físicas de las filas a mostrar, en orden.
+          None muestra todas las filas.
+        """
+        self.beginResetModel()
+        self._indices = indices
+        self.endResetModel()
+    # _set_row_indices (fin)
+
+    def _append_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Añade filas al final de los datos (las columnas deben ser listas).
+
+        Si hay un vector de índices activo, las nuevas filas se añaden también a él.
+
+        Parámetros:
+        - rows (list[dict]): Filas como diccionarios clave-valor.
+        """
+        if not rows:
+            return
+        first_physical = self._size
+        first_visible = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first_visible, first_visible + len(rows) - 1)
+        stored_columns = list(self._data.keys()) or list(self._columns)
+        for column, values in self._rows_to_columns(stored_columns, rows).items():
+            self._data.setdefault(column, [""] * first_physical).extend(values)
+        self._size += len(rows)
+        if self._indices is not None:
+            self._indices = list(self._indices) + list(range(first_physical, self._size))
+        self.endInsertRows()
+    # _append_rows (fin)
+
+    def _update_row(self, physical_row: int, row: Dict[str, Any]) -> None:
+        """
+        Sustituye los valores de una fila existente (las columnas deben ser listas).
+
+        Parámetros:
+        - physical_row (int): Posición física de la fila.
+        - row (dict): Nuevos valores por columna.
+        """
+        for column, values in self._data.items():
+            values[physical_row] = row.get(column, "")
+        if self._indices is None:
+            visible_row = physical_row
+        elif physical_row in self._indices:
+            visible_row = list(self._indices).index(physical_row)
+        else:
+            return  # La fila no está visible con el vector de índices actual
+        self.dataChanged.emit(self.index(visible_row, 0), self.index(visible_row, self.columnCount() - 1))
+    # _update_row (fin)
+
+    def _insert_row(self, physical_row: int, row: Dict[str, Any]) -> None:
+        """
+        Inserta una fila en una posición física (sin vector de índices activo; las columnas deben ser listas).
+
+        Parámetros:
+        - physical_row (int): Posición en la que se inserta la fila.
+        - row (dict): Valores de la fila por columna.
+        """
+        self.beginInsertRows(QModelIndex(), physical_row, physical_row)
+        stored_columns = list(self._data.keys()) or list(self._columns)
+        for column in stored_columns:
+            self._data.setdefault(column, [""] * self._size).insert(physical_row, row.get(column, ""))
+        self._size += 1
+        self.endInsertRows()
+    # _insert_row (fin)
+
+    def _remove_row(self, physical_row: int) -> None:
+        """
+        Elimina una fila por su posición física (sin vector de índices activo; las columnas deben ser listas).
+
+        Parámetros:
+        - physical_row (int): Posición de la fila a eliminar.
+        """
+        self.beginRemoveRows(QModelIndex(), physical_row, physical_row)
+        for values in self._data.values():
+            del values[physical_row]
+        self._size -= 1
+        self.endRemoveRows()
+    # _remove_row (fin)
+
+    def _get_row(self, physical_row: int) -> Dict[str, Any]:
+        """
+        Reconstruye una fila como diccionario a partir de las columnas.
+
+        Parámetros:
+        - physical_row (int): Posición física de la fila.
+
+        Retorno:
+        - dict: Valores de la fila por columna.
+        """
+        return {column: values[physical_row] for column, values in self._data.items()}
+    # _get_row (fin)
+
+    def _get_column(self, column: str) -> Sequence[Any]:
+        """
+        Devuelve la secuencia completa de valores de una columna.
+
+        Parámetros:
+        - column (str): Nombre de la columna.
+
+        Retorno:
+        - Sequence: Valores de la columna (lista vacía si no existe).
+        """
+        return self._data.get(column, [])
+    # _get_column (fin)
+# ColumnarTableModel (fin)
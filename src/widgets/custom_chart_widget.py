@@ -1,10 +1,10 @@
 from typing import Optional, Dict, List, Any
 from PySide6.QtCharts import QChart, QChartView, QBarSet, QBarSeries
-from PySide6.QtCharts import QBarCategoryAxis, QValueAxis
+from PySide6.QtCharts import QBarCategoryAxis, QValueAxis, QLineSeries, QDateTimeAxis
 from PySide6.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QToolTip
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, QPoint, QDate, QDateTime, QTime
 from PySide6.QtGui import QPainter, QImage
-from utils.utils_db import EnumEjes
+from utils.utils_db import EnumEjes, EnumPeriodos
 import os
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
@@ -29,13 +29,15 @@ class CustomChartWidget(QScrollArea):
         # Configuración inicial
         self._set_empty_chart()
 
-    def _clean_data(self, data: Dict[str, List[Any]]) -> Dict[str, List[int]]:
+    def _clean_data(self, data: Dict[str, Any]) -> Dict[str, List[int]]:
         """
         Limpia los datos eliminando valores no finitos y convirtiéndolos a enteros.
+
+        Cada serie puede ser una lista o un array de NumPy (se limpia en una sola operación vectorizada).
         """
         cleaned_data = {}
         for key, values in data.items():
-            values_array = np.array(values, dtype=np.float64)
+            values_array = np.asarray(values, dtype=np.float64)
             valid_values = np.where(np.isfinite(values_array), values_array, 0)
             cleaned_data[key] = valid_values.astype(int).tolist()
         return cleaned_data
@@ -51,17 +53,12 @@ class CustomChartWidget(QScrollArea):
         self._chart.removeAllSeries()
         self._chart.setTitle("Gráfico de ventas por Videojuego")
 
-        if not eje_x or not any(barritas_datos.values()):
+        if not eje_x or not any(len(values) for values in barritas_datos.values()):
             self._set_empty_chart()
             return
 
         bar_series = QBarSeries()
-        for name, values in barritas_datos.items():
-            cleaned_values = [
-                value if value is not None and np.isfinite(value) else 0
-                for value in values
-            ]
-
+        for name, cleaned_values in self._clean_data(barritas_datos).items():
             if len(cleaned_values) != len(eje_x):
                 print(f"Advertencia: El tamaño de los datos de '{name}' no coincide con las categorías del eje X.")
                 continue
@@ -108,6 +105,63 @@ class CustomChartWidget(QScrollArea):
 
         self._chart_view.setMinimumWidth(len(eje_x) * 100)
 
+    def _set_time_series(self, data: Dict[str, Any], bucket: str = EnumPeriodos.MES.value,
+                         title: str = "Evolución de ventas") -> None:
+        """
+        Configura el gráfico como serie temporal (una línea por serie) con eje de fechas.
+
+        El diccionario tiene la misma forma que en _set_data, pero el eje X contiene las fechas
+        (datetime.date) de inicio de cada periodo.
+        """
+        periodos: List[Any] = data.get(EnumEjes.EJE_X.value, [])
+        series_datos: Dict[str, List[Any]] = data.get(EnumEjes.EJE_Y.value, {})
+
+        self._set_empty_chart()
+        self._chart.removeAllSeries()
+
+        if not periodos or not any(series_datos.values()):
+            self._set_empty_chart()
+            return
+
+        self._chart.setTitle(title)
+        instantes = [
+            QDateTime(QDate(periodo.year, periodo.month, periodo.day), QTime(0, 0)).toMSecsSinceEpoch()
+            for periodo in periodos
+        ]
+
+        line_series = []
+        for name, values in self._clean_data(series_datos).items():
+            if len(values) != len(instantes):
+                print(f"Advertencia: El tamaño de los datos de '{name}' no coincide con los periodos del eje X.")
+                continue
+
+            line = QLineSeries()
+            line.setName(name)
+            for instante, value in zip(instantes, values):
+                line.append(instante, value)
+            self._chart.addSeries(line)
+            line_series.append(line)
+
+        if not line_series:
+            self._set_empty_chart()
+            return
+
+        axis_x = QDateTimeAxis()
+        axis_x.setFormat("MM/yyyy" if bucket == EnumPeriodos.MES.value else "dd/MM/yyyy")
+        axis_x.setTickCount(min(len(instantes), 12) if len(instantes) > 1 else 2)
+        axis_x.setLabelsAngle(-90)
+
+        max_y = max((line.at(i).y() for line in line_series for i in range(line.count())), default=0)
+        axis_y = QValueAxis()
+        axis_y.setRange(0, max_y or 1)
+        axis_y.setTitleText("Unidades")
+
+        for line in line_series:
+            self._chart.setAxisX(axis_x, line)
+            self._chart.setAxisY(axis_y, line)
+
+        self._chart_view.setMinimumWidth(0)
+
     def _set_empty_chart(self) -> None:
         """
         Configura el gráfico como vacío.
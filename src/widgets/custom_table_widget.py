@@ -7,13 +7,15 @@
 
 - QStandardItem Class. (s. f.). Doc.qt.io. de https://doc.qt.io/qtforpython-6.7/PySide6/QtGui/QStandardItem.html#PySide6.QtGui.QStandardItem
 
+- QAbstractTableModel Class. (s. f.). Doc.qt.io. de https://doc.qt.io/qtforpython-6.7/PySide6/QtCore/QAbstractTableModel.html
+
 """
 
 # Archivo: src\widgets\custom_table_widget.py
 
 from PySide6.QtWidgets import QTableView
-from PySide6.QtGui import QStandardItemModel, QStandardItem
 from PySide6.QtCore import Qt
+from widgets.columnar_table_model import ColumnarTableModel
 import os
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
@@ -22,9 +24,10 @@ class CustomTableWidget(QTableView):
     """
     Widget personalizado para mostrar tablas utilizando QTableView.
     Recibe datos en forma de diccionario y los renderiza automáticamente.
+    Los datos se guardan por columnas en un ColumnarTableModel, sin un objeto por celda.
     """
 
-    def _init_(self, data=None, parent=None):
+    def __init__(self, data=None, parent=None):
         """
         Inicializa el widget de tabla y, opcionalmente, configura los datos iniciales.
 
@@ -34,16 +37,16 @@ class CustomTableWidget(QTableView):
           - "data" (list[dict]): Lista de filas, donde cada fila es un diccionario con clave/valor.
         - parent (QWidget | None): Widget padre opcional.
         """
-        super()._init_(parent)
+        super().__init__(parent)
 
         # Inicializamos el modelo interno
-        self._model = QStandardItemModel()
+        self._model = ColumnarTableModel([])
         self.setModel(self._model)
 
         # Si se proporcionan datos, configuramos la tabla
         if data:
             self._set_data(data)
-    # _init_ (fin)
+    # __init__ (fin)
 
     def _set_data(self, data):
         """
@@ -65,13 +68,10 @@ class CustomTableWidget(QTableView):
         if not columns:
             print("[ERROR] No se encontraron columnas en los datos proporcionados.")
             return
-        self._model.setHorizontalHeaderLabels(columns)
 
-        # Limpiar filas actuales y agregar nuevas
-        self._model.clear()
-        for row in data.get("data", []):
-            items = [QStandardItem(str(row.get(col, ""))) for col in columns]
-            self._model.appendRow(items)
+        # Sustituir el modelo por uno nuevo con los datos en columnas
+        self._model = ColumnarTableModel._from_rows(columns, data.get("data", []))
+        self.setModel(self._model)
 
         # Ajustar el tamaño de las columnas automáticamente
         self.resizeColumnsToContents()
@@ -101,7 +101,7 @@ class CustomTableWidget(QTableView):
 
         # Fetch row data
         data = [
-            [self._model.item(row, col).text() if self._model.item(row, col) else "" for col in range(column_count)]
+            [self._model.index(row, col).data() or "" for col in range(column_count)]
             for row in range(row_count)
         ]
 
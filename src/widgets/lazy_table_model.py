@@ -0,0 +1,226 @@
+"""
+* WEBGRAFÍA *
+
+- QAbstractTableModel Class. (s. f.). Doc.qt.io. de https://doc.qt.io/qtforpython-6.7/PySide6/QtCore/QAbstractTableModel.html
+
+- Model/View Programming: Lazy Population of Model Data. (s. f.). Doc.qt.io. de https://doc.qt.io/qt-6/model-view-programming.html#lazy-population-of-model-data
+
+"""
+
+# Archivo: src/widgets/lazy_table_model.py
+
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from PySide6.QtCore import QModelIndex
+from utils import utils_db
+from widgets.columnar_table_model import ColumnarTableModel
+
+
+class LazyTableModel(ColumnarTableModel):
+    """
+    Modelo de tabla que carga las filas por páginas a medida que el usuario se desplaza.
+
+    QTableView llama a canFetchMore/fetchMore al acercarse al final de las filas cargadas;
+    en ese momento se pide la página siguiente mediante la función `fetch_page`, que recibe
+    la clave de la última fila cargada (paginación keyset) y el tamaño de página.
+    Las filas se almacenan por columnas (ver ColumnarTableModel).
+
+    Si se indica `request_page`, fetchMore no consulta en el hilo principal: encarga la página
+    (p. ej. a QueryRunner) y la añade cuando llega con _on_page_loaded. Mientras hay una página
+    pedida, canFetchMore devuelve False para no encargar la misma dos veces. `fetch_page` se
+    sigue usando para cargar todo de forma síncrona con _fetch_all (p. ej. al exportar).
+
+    Al recibir cambios de la base de datos, las filas se actualizan en su sitio con
+    _upsert_rows/_remove_keys. Las filas cargadas se localizan con un diccionario clave -> posición,
+    no por bisección: el servidor ordena la clave con la intercalación (collation) de la base de
+    datos, que puede no coincidir con el orden de las cadenas de Python (mayúsculas, tildes...).
+    La bisección solo se usa para elegir dónde insertar una fila nueva, y las páginas siguientes
+    descartan las filas que ya se insertaron así, de modo que ninguna aparece dos veces.
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        rows: Optional[List[Dict[str, Any]]] = None,
+        fetch_page: Optional[Callable[[Any, int], Optional[List[Dict[str, Any]]]]] = None,
+        request_page: Optional[Callable[[Any, int, Callable[[Any, Optional[List[Dict[str, Any]]]], None]], None]] = None,
+        key_column: Optional[str] = None,
+        page_size: int = utils_db.PAGE_SIZE_DB,
+        parent=None
+    ):
+        """
+        Inicializa el modelo con la primera página ya cargada.
+
+        Parámetros:
+        - columns (list[str]): Columnas a mostrar, en orden.
+        - rows (list[dict] | None): Primera página de filas.
+        - fetch_page (callable | None): Función (after_key, limit) -> filas de la página siguiente.
+          Si es None, el modelo solo contiene las filas iniciales.
+        - request_page (callable | None): Función (after_key, limit, on_page) que pide en segundo plano
+          la página siguiente y llama a on_page(after_key, filas) en el hilo principal al recibirla.
+          Si es None, fetchMore usa fetch_page directamente.
+        - key_column (str | None): Columna con la clave de paginación de cada fila (se guarda aunque no se muestre).
+        - page_size (int): Número de filas por página.
+        - parent (QObject | None): Objeto padre opcional.
+        """
+        rows = rows or []
+        stored_columns = list(dict.fromkeys(list(columns) + ([key_column] if key_column else [])))
+        super().__init__(columns, self._rows_to_columns(stored_columns, rows), parent=parent)
+        self._fetch_page = fetch_page
+        self._request_page = request_page
+        self._page_pending = False  # Hay una página pedida con request_page que aún no ha llegado
+        self._key_column = key_column
+        self._page_size = page_size
+        self._key_positions: Optional[Dict[Any, int]] = None  # Clave -> posición (se reconstruye al cambiar las filas)
+
+        # Si la primera página vino completa, puede haber más filas en el servidor
+        self._has_more = fetch_page is not None and key_column is not None and len(rows) >= page_size
+    # __init__ (fin)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """
+        Indica a la vista si quedan páginas por cargar.
+        """
+        return not parent.isValid() and self._has_more and not self._page_pending
+    # canFetchMore (fin)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """
+        Pide la página siguiente (en segundo plano si hay request_page) y la añade al final del modelo.
+        """
+        if not self.canFetchMore(parent):
+            return
+
+        if self._request_page is None:
+            self._append_page(self._fetch_page(self._last_key(), self._page_size))
+            return
+
+        self._page_pending = True
+        self._request_page(self._last_key(), self._page_size, self._on_page_loaded)
+    # fetchMore (fin)
+
+    def _last_key(self) -> Any:
+        """
+        Devuelve la clave de la última fila cargada (None si no hay filas).
+        """
+        keys = self._get_column(self._key_column)
+        return keys[-1] if len(keys) else None
+    # _last_key (fin)
+
+    def _on_page_loaded(self, after_key: Any, page: Optional[List[Dict[str, Any]]]) -> None:
+        """
+        Añade la página pedida con request_page (se llama en el hilo principal).
+
+        Si entretanto se cargaron más filas (p. ej. con _fetch_all), la página ya no sigue a la
+        última fila y se descarta; el modelo la volverá a pedir con la clave actual.
+
+        Parámetros:
+        - after_key (Any): Clave con la que se pidió la página.
+        - page (list[dict] | None): Filas recibidas (None si hubo un error).
+        """
+        self._page_pending = False
+        if not self._has_more or after_key != self._last_key():
+            return
+        self._append_page(page)
+    # _on_page_loaded (fin)
+
+    def _append_page(self, page: Optional[List[Dict[str, Any]]]) -> None:
+        """
+        Añade al final una página recibida y actualiza si quedan más.
+
+        Parámetros:
+        - page (list[dict] | None): Filas de la página (vacía o None al llegar al final o si hubo un error).
+        """
+        if not page:
+            self._has_more = False  # Fin de los datos (o error al obtenerlos)
+            return
+
+        self._has_more = len(page) >= self._page_size
+        # Las filas insertadas antes por un cambio pueden volver a llegar con su página
+        self._append_rows([row for row in page if self._position_of(row.get(self._key_column)) is None])
+    # _append_page (fin)
+
+    def _position_of(self, key: Any) -> Optional[int]:
+        """
+        Devuelve la posición de la fila cargada con una clave.
+
+        Parámetros:
+        - key (Any): Clave buscada.
+
+        Retorno:
+        - int | None: Posición física de la fila, o None si no está cargada.
+        """
+        if self._key_positions is None:
+            self._key_positions = {key: position for position, key in enumerate(self._get_column(self._key_column))}
+        return self._key_positions.get(key)
+    # _position_of (fin)
+
+    def _append_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Añade filas al final (ver ColumnarTableModel) e invalida el diccionario de posiciones.
+        """
+        super()._append_rows(rows)
+        self._key_positions = None
+    # _append_rows (fin)
+
+    def _insert_row(self, physical_row: int, row: Dict[str, Any]) -> None:
+        """
+        Inserta una fila (ver ColumnarTableModel) e invalida el diccionario de posiciones.
+        """
+        super()._insert_row(physical_row, row)
+        self._key_positions = None
+    # _insert_row (fin)
+
+    def _remove_row(self, physical_row: int) -> None:
+        """
+        Elimina una fila (ver ColumnarTableModel) e invalida el diccionario de posiciones.
+        """
+        super()._remove_row(physical_row)
+        self._key_positions = None
+    # _remove_row (fin)
+
+    def _upsert_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Actualiza en su sitio las filas ya cargadas e inserta las nuevas en su posición aproximada.
+
+        Las filas nuevas con una clave posterior a la última cargada no se insertan si quedan
+        páginas pendientes: llegarán con la página correspondiente al desplazarse.
+
+        Parámetros:
+        - rows (list[dict]): Filas modificadas o nuevas (con la columna clave).
+        """
+        for row in rows:
+            key = row.get(self._key_column)
+            position = self._position_of(key)
+            if position is not None:
+                self._update_row(position, row)
+                continue
+            keys = self._get_column(self._key_column)
+            position = bisect_left(keys, key)  # Solo orienta: el orden del servidor puede diferir
+            if position < len(keys) or not self._has_more:
+                self._insert_row(position, row)
+    # _upsert_rows (fin)
+
+    def _remove_keys(self, keys: Iterable[Any]) -> None:
+        """
+        Elimina las filas cargadas cuyas claves se indican (las que no estén cargadas se ignoran).
+
+        Parámetros:
+        - keys (Iterable): Claves de las filas a eliminar.
+        """
+        for key in keys:
+            position = self._position_of(key)
+            if position is not None:
+                self._remove_row(position)
+    # _remove_keys (fin)
+
+    def _fetch_all(self) -> None:
+        """
+        Carga todas las páginas pendientes de forma síncrona (p. ej. antes de exportar la tabla completa).
+
+        Una página pedida en segundo plano que llegue después se descarta en _on_page_loaded.
+        """
+        while self._has_more:
+            self._append_page(self._fetch_page(self._last_key(), self._page_size))
+    # _fetch_all (fin)
+# LazyTableModel (fin)
@@ -5,6 +5,7 @@ from models.report_model import ReportModel
 from views.report_view import ReportView
 from controllers.report_controller import ReportController
 from models.manager_db import ManagerDB
+from models.async_manager_db import AsyncManagerDB
 
 
 class ReportWindow:
@@ -13,15 +14,18 @@ class ReportWindow:
     Conecta el modelo, vista y controlador según el patrón MVC.
     """
 
-    def __init__(self, db_manager: ManagerDB, popup_parent: Optional[object] = None) -> None:
+    def __init__(self, db_manager: ManagerDB, popup_parent: Optional[object] = None,
+                 async_db_manager: Optional[AsyncManagerDB] = None) -> None:
         """
         Constructor que inicializa el modelo, vista y controlador para reportes.
 
         Parámetros:
         - db_manager (ManagerDB): Instancia para gestionar la conexión a la base de datos.
         - popup_parent (Optional[object]): Widget padre para los mensajes emergentes (popups).
+        - async_db_manager (Optional[AsyncManagerDB]): Gestor asíncrono opcional para las consultas concurrentes.
         """
-        self._model: ReportModel = ReportModel(db_manager=db_manager, popup_parent=popup_parent)
+        self._model: ReportModel = ReportModel(
+            db_manager=db_manager, popup_parent=popup_parent, async_db_manager=async_db_manager)
         self._view: ReportView = ReportView()
         self._controller: ReportController = ReportController(
             report_view=self._view,